@@ -108,3 +108,38 @@ notes:
     plays. More information can be found at
     U(https://docs.openstack.org/openstacksdk/)
 '''
+
+    # Documentation fragment for modules which support plan files
+    PLAN = r'''
+options:
+  plan_file:
+    description:
+      - Path to a plan file on the managed host.
+      - In check mode, changes which would be applied to an existing
+        resource are computed and written to this file.
+      - When not in check mode, the plan from this file is applied directly
+        without computing changes again, if the plan has been written by the
+        same module with the same module options and if the resource has not
+        changed since. The latter is verified by fetching the resource once
+        and comparing its revision number, if the resource has one, or all
+        of its attributes. Otherwise the plan is ignored.
+    type: path
+'''
+
+    # Documentation fragment for info modules which support field projection
+    FIELDS = r'''
+options:
+  fields:
+    description:
+      - List of attributes which will be returned for each resource.
+      - Nested attributes are selected with dotted paths such as
+        C(addresses.private) or C(fixed_ips.ip_address). Lists on such paths
+        are projected item by item.
+      - All other attributes are removed from results before they are
+        returned. APIs which support selecting fields, such as the Networking
+        and Bare Metal APIs, are asked to return only the selected top-level
+        attributes.
+      - By default all attributes are returned.
+    type: list
+    elements: str
+'''
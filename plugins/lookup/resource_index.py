@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r'''
+name: resource_index
+author: OpenStack Ansible SIG
+short_description: Query a local index of OpenStack cloud resources
+description:
+  - Return resources from a SQLite database file which has been written
+    by module M(openstack.cloud.resource_index).
+  - No requests are sent to the cloud, so results are as recent as the
+    last refresh of the index.
+options:
+  _terms:
+    description:
+      - Names or IDs of resources.
+      - A resource whose ID matches a term takes precedence over resources
+        whose names match it.
+      - If no terms are given, all resources of type I(type) are returned.
+    type: list
+    elements: str
+    required: false
+  filters:
+    description:
+      - Attributes which returned resources must have.
+      - Keys are attribute names or dotted paths to nested attributes such
+        as C(location.project.id).
+      - Values must be scalars.
+    type: dict
+  path:
+    description:
+      - Path to the SQLite database file.
+    required: true
+    type: path
+  type:
+    description:
+      - Type of resources.
+    choices: ['image', 'network', 'port', 'project', 'security_group',
+              'server', 'subnet', 'volume']
+    required: true
+    type: str
+'''
+
+EXAMPLES = r'''
+- name: Show IDs of active servers
+  ansible.builtin.debug:
+    msg: "{{ query('openstack.cloud.resource_index', type='server',
+                   filters={'status': 'ACTIVE'},
+                   path='/tmp/devstack.sqlite') | map(attribute='id') }}"
+
+- name: Show subnets of networks app and db
+  ansible.builtin.debug:
+    msg: "{{ query('openstack.cloud.resource_index', 'app', 'db',
+                   type='network', path='/tmp/devstack.sqlite')
+             | map(attribute='subnet_ids') }}"
+'''
+
+RETURN = r'''
+_raw:
+  description:
+    - Resources in the same order as the terms or all resources of type
+      I(type) which match I(filters) if no terms are given.
+  type: list
+  elements: dict
+'''
+
+import os
+import sqlite3
+
+from ansible.errors import AnsibleLookupError
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.openstack.cloud.plugins.module_utils.resource_index import (
+    connect,
+    search,
+)
+
+
+class LookupModule(LookupBase):
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        path = self.get_option('path')
+
+        if not os.path.exists(path):
+            raise AnsibleLookupError(
+                'Resource index {0} does not exist'.format(path))
+
+        try:
+            db = connect(path, read_only=True)
+        except sqlite3.Error as e:
+            raise AnsibleLookupError(
+                'Opening resource index {0} failed: {1}'.format(path, e))
+        try:
+            return search(db, self.get_option('type'), terms,
+                          self.get_option('filters'))
+        except (sqlite3.Error, ValueError) as e:
+            raise AnsibleLookupError(
+                'Querying resource index {0} failed: {1}'.format(path, e))
+        finally:
+            db.close()
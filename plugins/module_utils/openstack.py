@@ -32,6 +32,7 @@
 
 import abc
 import copy
+import fnmatch
 try:
     from ansible.module_utils.compat.version import StrictVersion
 except ImportError:
@@ -41,8 +42,12 @@ except ImportError:
         raise ImportError(f'To use this plugin or module with ansible-core'
                           f' < 2.11, you need to use Python < 3.12 with '
                           f'distutils.version present. {exc}')
+import hashlib
 import importlib
+import itertools
+import json
 import os
+import uuid
 
 from ansible.module_utils.basic import AnsibleModule
 
@@ -207,6 +212,15 @@ def openstack_cloud_from_module(module, min_version=None, max_version=None):
         module.fail_json(msg=str(e))
 
 
+def is_uuid(value):
+    """Returns True if value can be parsed as an UUID."""
+    try:
+        uuid.UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
 class OpenStackModule:
     """Openstack Module is a base class for all Openstack Module classes.
 
@@ -261,7 +275,7 @@ class OpenStackModule:
         self.check_mode = self.ansible.check_mode
         self.sdk_version = None
         self.results = {'changed': False}
-        self.exit = self.exit_json = self.ansible.exit_json
+        self.exit = self.exit_json = self._exit_json
         self.fail = self.fail_json = self.ansible.fail_json
         self.warn = self.ansible.warn
         self.sdk, self.conn = self.openstack_cloud_from_module()
@@ -403,6 +417,308 @@ class OpenStackModule:
             versioned_result.update({var_name: kwargs[var_name]})
         return versioned_result
 
+    def plan_update(self, resource, build_update):
+        """Computes changes for a resource and writes them as a plan.
+
+        The plan is written to the file given in module option `plan_file`
+        if the option is set. It is keyed by module name and options and by
+        the revision of the resource before changes have been computed.
+
+        Arguments:
+            resource: Existing resource which is passed to build_update.
+            build_update: Function which returns a dictionary with changes.
+
+        Returns:
+            update {dict} -- changes returned by build_update.
+        """
+        path = self.params.get('plan_file')
+        if path is None:
+            return build_update(resource)
+
+        # Compute revision first because build_update might alter resource
+        revision = self._plan_revision(resource)
+        update = build_update(resource)
+
+        plan = dict(id=resource['id'],
+                    key=self._plan_key(),
+                    revision=revision,
+                    update=update)
+        with open(path, 'w') as f:
+            json.dump(plan, f, default=self._plan_serialize)
+
+        return update
+
+    def read_plan(self, fetch):
+        """Reads a plan which has been written by plan_update().
+
+        The plan is used only if it has been written by this module with
+        the same module options and if the resource has not changed since.
+
+        Arguments:
+            fetch: Function which returns a resource for a given id.
+
+        Returns:
+            resource, update -- resource and planned changes or (None, None)
+                                if no plan can be used.
+        """
+        path = self.params.get('plan_file')
+        if path is None or self.check_mode or not os.path.exists(path):
+            return None, None
+
+        with open(path) as f:
+            plan = json.load(f)
+
+        if plan.get('key') != self._plan_key():
+            return None, None
+
+        try:
+            resource = fetch(plan['id'])
+        except self.sdk.exceptions.ResourceNotFound:
+            return None, None
+
+        if not resource or self._plan_revision(resource) != plan['revision']:
+            return None, None
+
+        return resource, plan['update']
+
+    def _plan_key(self):
+        params = dict((k, self.params[k])
+                      for k in self.argument_spec
+                      if k != 'plan_file')
+        return self._digest([self.module_name, params])
+
+    def _plan_revision(self, resource):
+        data = resource.to_dict(computed=False)
+
+        # Neutron increments revision_number whenever a resource changes
+        if data.get('revision_number') is not None:
+            return self._digest(['revision_number', data['revision_number'],
+                                 data.get('id')])
+
+        # Other services do not update attributes such as updated_at for all
+        # changes, e.g. Nova not for metadata or tags, so the revision
+        # covers all attributes instead. Metadata of object store resources
+        # is not part of to_dict().
+        return self._digest([data, getattr(resource, 'metadata', None)])
+
+    def _plan_serialize(self, o):
+        # Resources such as security groups are part of some updates
+        if hasattr(o, 'to_dict'):
+            return o.to_dict(computed=False)
+        raise TypeError('Object of type {0} is not JSON serializable'
+                        .format(type(o).__name__))
+
+    def _digest(self, o):
+        data = json.dumps(o, sort_keys=True, default=self._plan_serialize)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def find_resources(self, list_function, names_or_ids, type_name,
+                       filter_names=False, **query):
+        """Finds several resources with a single listing.
+
+        Each name or id must match exactly one resource, see
+        resolve_resources().
+
+        Returns:
+            resources {list} -- resources in the order of names_or_ids
+                                without duplicates.
+        """
+        found = dict()
+        for resource in self.resolve_resources(
+                list_function, names_or_ids, type_name,
+                filter_names=filter_names, **query).values():
+            found.setdefault(resource['id'], resource)
+        return list(found.values())
+
+    def resolve_resources(self, list_function, names_or_ids, type_name,
+                          filter_names=False, **query):
+        """Maps several names or ids to resources with a single listing.
+
+        Each name or id must match exactly one resource. A resource whose id
+        matches takes precedence over resources whose names match. The
+        module fails if a name or id does not match any resource or matches
+        several resources.
+
+        Arguments:
+            list_function: Proxy function such as conn.compute.servers.
+            names_or_ids: Names or ids of resources.
+            type_name: Type of resources for error messages, e.g. 'server'.
+            filter_names: Pass names_or_ids as id or name filter to
+                          list_function, e.g. for the Networking API which
+                          accepts lists of ids or names. Names which look
+                          like ids are queried in a second listing.
+            query: Query parameters which are passed to list_function.
+
+        Returns:
+            resources {dict} -- resources keyed by names_or_ids in the order
+                                of names_or_ids.
+        """
+        filters = dict()
+        if filter_names:
+            ids = [v for v in names_or_ids if is_uuid(v)]
+            if len(ids) == len(names_or_ids):
+                filters['id'] = ids
+            elif not ids:
+                filters['name'] = list(names_or_ids)
+        resources = list(list_function(**dict(query, **filters)))
+
+        if 'id' in filters:
+            # Names of resources might look like ids
+            missing = [v for v in names_or_ids
+                       if not any(v in (r['id'], r['name'])
+                                  for r in resources)]
+            if missing:
+                resources += list_function(**dict(query, name=missing))
+
+        resolved = dict()
+        for name_or_id in names_or_ids:
+            matches = [r for r in resources if r['id'] == name_or_id] \
+                or [r for r in resources if r['name'] == name_or_id]
+            if not matches:
+                self.fail_json(msg='No {0} found for {1}'
+                                   .format(type_name, name_or_id))
+            if len(matches) > 1:
+                self.fail_json(msg='Multiple {0}s found for {1}'
+                                   .format(type_name, name_or_id))
+            resolved[name_or_id] = matches[0]
+        return resolved
+
+    def search_resources(self, list_function, resource_class,
+                         name_or_id=None, filters=None, limit=None,
+                         marker=None):
+        """Lists resources and pushes filters to the API where possible.
+
+        Filters which are query parameters of resource_class are passed to
+        list_function, all other filters are matched client-side. Names or
+        ids are queried as name first and as id second unless they contain
+        glob patterns which are matched client-side like in openstacksdk's
+        search_* functions.
+
+        Arguments:
+            list_function: Proxy function such as conn.network.ports.
+            resource_class: Resource class such as openstack.network.v2.port.Port.
+            name_or_id: Name, id or glob pattern of resources to return.
+            filters: Dictionary of attributes which resources must match.
+            limit: Maximum number of resources to return.
+            marker: Id of the last resource of a previous page.
+
+        Returns:
+            resources {list} -- resources which match all criteria.
+        """
+        query_names = self._query_names(resource_class)
+
+        query = {}
+        local_filters = {}
+        for k, v in (filters or {}).items():
+            if v is None:
+                continue
+            elif k in query_names and not isinstance(v, dict):
+                query[k] = v
+            else:
+                local_filters[k] = v
+
+        if 'fields' in query_names:
+            # Attributes which are matched client-side must be fetched too
+            fields = self.query_fields(resource_class,
+                                       'id', 'name', *local_filters)
+            if fields:
+                query['fields'] = fields
+
+        if limit is not None:
+            # Neutron and Glance use limit as page size, following pages are
+            # only fetched if more resources are needed.
+            query['limit'] = limit
+        if marker is not None:
+            query['marker'] = marker
+
+        def search(pattern=None, **kwargs):
+            resources = (
+                r for r in list_function(**dict(query, **kwargs))
+                if (pattern is None
+                    or any(fnmatch.fnmatchcase(str(r.get(k)), pattern)
+                           for k in ['id', 'name']))
+                and self._match_filters(r, local_filters))
+            return list(itertools.islice(resources, limit))
+
+        if name_or_id is None:
+            return search()
+
+        if any(c in name_or_id for c in '*?[') \
+           or not {'id', 'name'} <= query_names:
+            return search(pattern=name_or_id)
+
+        return search(name=name_or_id) or search(id=name_or_id)
+
+    def query_fields(self, resource_class, *required):
+        """Translates module option `fields` into API field names.
+
+        Only top-level attributes can be selected by APIs, so dotted paths
+        are reduced to their first component. Attribute names of
+        resource_class are translated to their server-side names.
+
+        Arguments:
+            resource_class: Resource class such as openstack.network.v2.port.Port.
+            required: Attributes which must be fetched in addition.
+
+        Returns:
+            fields {list} -- API field names or None if module option
+                             `fields` is not set.
+        """
+        fields = self.params.get('fields')
+        if not fields:
+            return None
+
+        names = []
+        for name in [f.split('.')[0] for f in fields] + list(required):
+            name = getattr(getattr(resource_class, name, None), 'name', name)
+            if name not in names:
+                names.append(name)
+        return names
+
+    def _query_names(self, resource_class):
+        mapping = resource_class._query_mapping._mapping
+        names = set(mapping)
+        names.update(v.get('name', k) if isinstance(v, dict) else v
+                     for k, v in mapping.items())
+        return names
+
+    def _match_filters(self, resource, filters):
+        for k, v in filters.items():
+            if isinstance(v, dict):
+                if not isinstance(resource.get(k), dict) \
+                   or not self._match_filters(resource[k], v):
+                    return False
+            elif resource.get(k) != v:
+                return False
+        return True
+
+    def _exit_json(self, **results):
+        fields = self.params.get('fields')
+        if fields:
+            paths = [f.split('.') for f in fields]
+            results = dict((k, v if k == 'changed' else self._project(v, paths))
+                           for k, v in results.items())
+        self.ansible.exit_json(**results)
+
+    def _project(self, value, paths):
+        # Lists such as fixed_ips or addresses are projected item by item
+        if isinstance(value, list):
+            return [self._project(v, paths) for v in value]
+        if not isinstance(value, dict):
+            return value
+
+        projection = {}
+        for path in paths:
+            key = path[0]
+            if key not in value or key in projection:
+                continue
+            subpaths = [p[1:] for p in paths if p[0] == key]
+            if all(subpaths):
+                projection[key] = self._project(value[key], subpaths)
+            else:
+                projection[key] = value[key]
+        return projection
+
     @abc.abstractmethod
     def run(self):
         """Function for overriding in inhetired classes, it's executed by default.
@@ -415,7 +731,7 @@ class OpenStackModule:
         try:
             results = self.run()
             if results and isinstance(results, dict):
-                self.ansible.exit_json(**results)
+                self.exit_json(**results)
         except self.sdk.exceptions.OpenStackCloudException as e:
             params = {
                 'msg': str(e),
@@ -428,4 +744,4 @@ class OpenStackModule:
             }
             self.ansible.fail_json(**params)
         # if we got to this place, modules didn't exit
-        self.ansible.exit_json(**self.results)
+        self.exit_json(**self.results)
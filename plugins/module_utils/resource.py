@@ -5,8 +5,17 @@
 # Copyright (c) 2023 Red Hat, Inc.
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+import concurrent.futures
+import time
+
+
 class StateMachine:
 
+    # Bounds in seconds for intervals between polls while waiting for
+    # resources to be deleted
+    wait_interval_min = 1
+    wait_interval_max = 10
+
     @staticmethod
     def default_crud_functions(connection, service_name, type_name):
         session = getattr(connection, service_name)
@@ -56,6 +65,51 @@ class StateMachine:
 
         resource = self._find(attributes, **kwargs)
 
+        return self._apply(resource, attributes, check_mode, state, timeout,
+                           wait, updateable_attributes,
+                           non_updateable_attributes, **kwargs)
+
+    def batch(self, items, check_mode, timeout, wait, updateable_attributes,
+              non_updateable_attributes, max_workers=None, **kwargs):
+        # kwargs is for passing arguments to subclasses
+
+        # Each item is a dict with keys attributes and state. Instead of
+        # calling _find() for each item, the collection is listed once and
+        # items are matched locally. Changes are applied concurrently.
+        if max_workers is not None and max_workers < 1:
+            self.fail_json(msg='max_workers must be at least 1.')
+
+        resources = list(self.list_function())
+
+        matches = []
+        for item in items:
+            found = self._match(resources, item['attributes'])
+            if len(found) > 1:
+                self.fail_json(msg='Found more than a single resource'
+                                   ' which matches the given attributes'
+                                   ' {0}.'.format(item['attributes']))
+            matches.append(found[0] if found else None)
+
+        ids = [resource['id'] for resource in matches if resource]
+        if len(ids) != len(set(ids)):
+            self.fail_json(msg='Found more than a single item which'
+                               ' matches the same resource.')
+
+        def apply(item, resource):
+            try:
+                resource, is_changed = self._apply(
+                    resource, item['attributes'], check_mode, item['state'],
+                    timeout, wait, updateable_attributes,
+                    non_updateable_attributes, **kwargs)
+                return resource, is_changed, None
+            except self.sdk.exceptions.SDKException as e:
+                return None, False, e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(apply, items, matches))
+
+    def _apply(self, resource, attributes, check_mode, state, timeout, wait,
+               updateable_attributes, non_updateable_attributes, **kwargs):
         if check_mode:
             return self._simulate(state, resource, attributes, timeout, wait,
                                   updateable_attributes,
@@ -90,9 +144,6 @@ class StateMachine:
                       non_updateable_attributes, **kwargs):
         update = {}
 
-        # Fetch details to populate all resource attributes
-        resource = self.get_function(resource['id'])
-
         comparison_attributes = (
             set(updateable_attributes
                 if updateable_attributes is not None
@@ -101,6 +152,9 @@ class StateMachine:
                   if non_updateable_attributes is not None
                   else []))
 
+        # Fetch details only if required to populate all resource attributes
+        resource = self._fetch(resource, comparison_attributes)
+
         resource_attributes = dict(
             (k, attributes[k])
             for k in comparison_attributes
@@ -128,12 +182,32 @@ class StateMachine:
         self.delete_function(resource['id'])
 
         if wait:
-            for count in self.sdk.utils.iterate_timeout(
-                timeout=timeout,
-                message="Timeout waiting for resource to be absent"
-            ):
-                if self._find(attributes) is None:
-                    break
+            self._wait_for_delete(resource, timeout)
+
+    def _wait_for_delete(self, resource, timeout):
+        # Poll the resource by its id instead of calling _find() which would
+        # list a whole collection on each poll when neither id nor name are
+        # known. Intervals between polls grow exponentially up to a limit.
+        interval = self.wait_interval_min
+        deadline = time.time() + timeout
+        while True:
+            try:
+                resource = self.get_function(resource['id'])
+            except self.sdk.exceptions.NotFoundException:
+                return
+
+            # Some resources are reported as deleted for a while
+            status = resource.get('status')
+            if status is not None and status.lower() == 'deleted':
+                return
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise self.sdk.exceptions.ResourceTimeout(
+                    "Timeout waiting for resource to be absent")
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.wait_interval_max)
 
     def _freeze(self, o):
         if isinstance(o, dict):
@@ -163,6 +237,29 @@ class StateMachine:
         # else
         return a == b
 
+    def _fetch(self, resource, attribute_names):
+        # Resources which have been found with find_* functions have either
+        # been fetched by id or have been taken from a listing. Listings
+        # might return a subset of attributes only, e.g. compute's /servers
+        # returns ids, names and links only. Fetch details only if any
+        # attribute to be compared has not been returned by the API.
+        if all(self._is_returned(resource, k) for k in attribute_names):
+            return resource
+
+        return self.get_function(resource['id'])
+
+    def _is_returned(self, resource, attribute_name):
+        # openstacksdk's resources keep attributes returned by the API apart
+        # from defaults of their resource classes, e.g. a flavor's ram is 0
+        # even if a listing did not return it. For other resources, assume
+        # that unset attributes are None.
+        body = getattr(resource, '_body', None)
+        field = getattr(type(resource), attribute_name, None)
+        if body is not None and hasattr(field, 'name'):
+            return field.name in body.attributes
+
+        return resource[attribute_name] is not None
+
     def _find(self, attributes, **kwargs):
         # use find_* functions for id instead of get_* functions because
         # get_* functions raise exceptions when resources cannot be found
@@ -182,6 +279,21 @@ class StateMachine:
     def _find_matches(self, attributes, **kwargs):
         return self.list_function(**attributes)
 
+    def _match(self, resources, attributes):
+        # Mimics _find() for resources which have been listed already
+        if 'id' in attributes:
+            return [r for r in resources if r['id'] == attributes['id']]
+
+        if 'name' in attributes:
+            name_or_id = attributes['name']
+            matches = [r for r in resources if r['id'] == name_or_id]
+            return matches or [r for r in resources
+                               if r['name'] == name_or_id]
+
+        return [r for r in resources
+                if all(self._is_equal(v, r.get(k))
+                       for k, v in attributes.items())]
+
     def _update(self, resource, timeout, update, wait, **kwargs):
         resource_attributes = update.get('resource_attributes')
         if resource_attributes:
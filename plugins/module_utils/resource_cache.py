@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+import os
+import tempfile
+import time
+
+
+class ResourceCache(object):
+    '''Map names of resources to ids in a JSON file.
+
+    The file is shared between module calls, e.g. of several tasks or hosts
+    in a play. Entries expire ttl seconds after they have been stored.
+    Concurrent writers do not corrupt the file, but entries of all but the
+    last writer might be lost, which only costs another lookup.
+    '''
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self.entries = dict()
+        self.is_changed = False
+
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            # Missing or unreadable files are treated as empty caches
+            entries = dict()
+
+        now = time.time()
+        for type_name, items in entries.items():
+            self.entries[type_name] = dict(
+                (name, (id, cached_at))
+                for name, (id, cached_at) in items.items()
+                if now - cached_at < ttl)
+
+    def get(self, type_name, name):
+        '''Return the id of the resource or None if it is not cached.'''
+        entry = self.entries.get(type_name, {}).get(name)
+        return entry[0] if entry else None
+
+    def set(self, type_name, name, id):
+        self.entries.setdefault(type_name, dict())[name] = (id, time.time())
+        self.is_changed = True
+
+    def save(self):
+        if not self.is_changed:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.is_changed = False
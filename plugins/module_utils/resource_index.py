@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+import os
+import sqlite3
+
+try:
+    from urllib.request import pathname2url
+except ImportError:
+    from urllib import pathname2url
+
+SCHEMA = [
+    '''CREATE TABLE IF NOT EXISTS resources (
+           type TEXT NOT NULL,
+           id TEXT NOT NULL,
+           name TEXT,
+           data TEXT NOT NULL,
+           PRIMARY KEY (type, id))''',
+    '''CREATE INDEX IF NOT EXISTS resources_name
+           ON resources (type, name)''',
+    '''CREATE TABLE IF NOT EXISTS refreshes (
+           type TEXT NOT NULL PRIMARY KEY,
+           refreshed_at TEXT NOT NULL)''',
+]
+
+# SQLite before 3.32.0 allows at most 999 variables per statement and every
+# name or id is bound twice
+CHUNK_SIZE = 400
+
+
+def connect(path, copy=False, read_only=False):
+    '''Open the index at path, creating tables if necessary.
+
+    If copy is true, the index is copied into memory, so path is neither
+    created nor modified. If read_only is true, the index is opened without
+    creating tables and path must exist.
+    '''
+    uri = 'file:{0}?mode=ro'.format(pathname2url(os.path.abspath(path)))
+    if read_only:
+        return sqlite3.connect(uri, uri=True)
+    if copy:
+        db = sqlite3.connect(':memory:')
+        if os.path.exists(path):
+            source = sqlite3.connect(uri, uri=True)
+            try:
+                source.backup(db)
+            finally:
+                source.close()
+    else:
+        db = sqlite3.connect(path)
+    for statement in SCHEMA:
+        db.execute(statement)
+    return db
+
+
+def search(db, type_name, names_or_ids=None, filters=None):
+    '''Return resources of type_name from the index as dictionaries.
+
+    If names_or_ids is given, resources are returned in the same order and
+    a resource whose id matches a value takes precedence over resources
+    whose names match it. Keys in filters are attribute names or dotted
+    paths to nested attributes and values must be scalars.
+    '''
+    query = ['SELECT id, name, data FROM resources WHERE type = ?']
+    args = [type_name]
+
+    for key, value in (filters or {}).items():
+        if isinstance(value, (dict, list)):
+            raise ValueError('Filter {0} must be a scalar value'
+                             .format(key))
+        query.append('AND json_extract(data, ?) IS ?')
+        args.extend(['$.' + key, value])
+
+    if not names_or_ids:
+        return [json.loads(row[2])
+                for row in db.execute(' '.join(query), args)]
+
+    # Rows are keyed by id because a resource can match values in
+    # different chunks
+    rows = dict()
+    names_or_ids = list(names_or_ids)
+    for i in range(0, len(names_or_ids), CHUNK_SIZE):
+        chunk = names_or_ids[i:i + CHUNK_SIZE]
+        placeholders = ', '.join('?' * len(chunk))
+        rows.update(
+            (resource_id, (name, data))
+            for resource_id, name, data in db.execute(
+                ' '.join(query + ['AND (id IN ({0}) OR name IN ({0}))'
+                                  .format(placeholders)]),
+                args + chunk + chunk))
+
+    by_name = dict()
+    for name, data in rows.values():
+        by_name.setdefault(name, []).append(data)
+
+    return [json.loads(data)
+            for value in names_or_ids
+            for data in ([rows[value][1]] if value in rows
+                         else by_name.get(value, []))]
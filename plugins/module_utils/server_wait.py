@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import time
+
+# Names of actions in Nova's os-instance-actions which differ from the names
+# used by modules in this collection
+NOVA_ACTIONS = dict(
+    reboot_hard='reboot',
+    reboot_soft='reboot',
+    shelve_offload='shelveOffload',
+)
+
+# Minimum and maximum poll intervals in seconds per Nova action. Intervals
+# grow with the elapsed time, so quick actions are noticed early and long
+# running actions do not cause needless requests.
+INTERVALS = dict(
+    create=(5, 20),
+    delete=(2, 10),
+    lock=(1, 2),
+    pause=(1, 5),
+    reboot=(1, 5),
+    rebuild=(5, 30),
+    resume=(2, 10),
+    shelve=(5, 30),
+    shelveOffload=(5, 30),
+    start=(1, 5),
+    stop=(1, 5),
+    suspend=(2, 10),
+    unlock=(1, 2),
+    unpause=(1, 5),
+    unshelve=(5, 30),
+)
+
+
+def get_interval(action, elapsed):
+    '''Return seconds to sleep before polling servers again.'''
+    min_interval, max_interval = INTERVALS.get(action, (2, 10))
+    return min(max(min_interval, elapsed / 4), max_interval)
+
+
+def find_action_error(conn, server_id, action):
+    '''Return the error message of the latest action or None.
+
+    Nova lists instance actions with the most recent action first and sets
+    their message to 'Error' when they have failed.
+    '''
+    for server_action in conn.compute.server_actions(server_id):
+        if server_action['action'] == action:
+            if server_action['message']:
+                return 'Action {0} failed for server {1}: {2}'.format(
+                    action, server_id, server_action['message'])
+            return None
+    return None
+
+
+def wait_for_servers(conn, action, ids, list_servers, is_done, timeout):
+    '''Wait until is_done(server) is true for all servers with ids.
+
+    list_servers(ids) must return servers with the given ids which still
+    exist, keyed by id. Servers which have been left in status ERROR or
+    whose action has failed according to Nova's instance actions are not
+    waited for until the timeout.
+
+    Returns servers which are done, keyed by id, error messages of servers
+    for which the action has failed, keyed by id, and ids of servers which
+    are not done after timeout seconds.
+    '''
+    action = NOVA_ACTIONS.get(action, action)
+    done = dict()
+    failed = dict()
+    pending = set(ids)
+    start = time.monotonic()
+
+    while pending:
+        servers = list_servers(pending)
+        for id in list(pending):
+            server = servers.get(id)
+            if is_done(server):
+                done[id] = server
+                pending.discard(id)
+            elif server is not None and not server['task_state']:
+                # Nova sets a task state until an action has been completed,
+                # so a server without task which is not done yet has been
+                # left behind by a failed action
+                if server['status'] == 'ERROR':
+                    fault = server['fault'] or {}
+                    message = 'Server is in status ERROR: {0}'.format(
+                        fault.get('message',
+                                  'no further information available'))
+                else:
+                    message = find_action_error(conn, id, action)
+                if message:
+                    failed[id] = message
+                    pending.discard(id)
+
+        elapsed = time.monotonic() - start
+        if not pending or elapsed >= timeout:
+            break
+        time.sleep(min(get_interval(action, elapsed), timeout - elapsed))
+
+    return done, failed, pending
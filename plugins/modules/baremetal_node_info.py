@@ -15,7 +15,18 @@ options:
     mac:
       description:
         - MAC address that is used to attempt to identify the host.
-      type: str
+        - A list of MAC addresses may be given to identify several hosts
+          at once. All Bare Metal ports are then listed once to find the
+          nodes of these MAC addresses.
+      type: list
+      elements: str
+    max_workers:
+      description:
+        - Maximum number of nodes which are fetched concurrently when
+          searching by I(mac).
+        - If more nodes match, all nodes are listed once instead.
+      type: int
+      default: 8
     name:
       description:
         - Name or ID of the baremetal node.
@@ -23,6 +34,7 @@ options:
       aliases: ['node']
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -39,6 +51,16 @@ EXAMPLES = r'''
     name: "00000000-0000-0000-0000-000000000002"
   register: nodes
 
+- debug: var=nodes
+
+- name: Gather information about baremetal nodes by MAC addresses
+  openstack.cloud.baremetal_node_info:
+    cloud: "devstack"
+    mac:
+      - "00:11:22:33:44:55"
+      - "00:11:22:33:44:66"
+  register: nodes
+
 - debug: var=nodes
 '''
 
@@ -346,6 +368,8 @@ baremetal_nodes:
     elements: dict
 '''
 
+import concurrent.futures
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
     OpenStackModule
 )
@@ -353,7 +377,9 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
 
 class BaremetalNodeInfoModule(OpenStackModule):
     argument_spec = dict(
-        mac=dict(),
+        fields=dict(type='list', elements='str'),
+        mac=dict(type='list', elements='str'),
+        max_workers=dict(type='int', default=8),
         name=dict(aliases=['node']),
     )
 
@@ -366,43 +392,76 @@ class BaremetalNodeInfoModule(OpenStackModule):
 
     def run(self):
         name_or_id = self.params['name']
-        mac = self.params['mac']
+        macs = self.params['mac']
+        fields = self.query_fields(self.sdk.baremetal.v1.node.Node, 'id')
 
-        node_id = None
+        node_ids = []
         if name_or_id:
             # self.conn.baremetal.nodes() does not support searching by name or
             # id which we want to provide for backward compatibility
             node = self.conn.baremetal.find_node(name_or_id)
             if node:
-                node_id = node['id']
-        elif mac:
-            # self.conn.get_machine_by_mac(mac) is not necessary
-            # because nodes can be filtered by instance_id
-            baremetal_port = self.conn.get_nic_by_mac(mac)
-            if baremetal_port:
-                node_id = baremetal_port['node_id']
+                node_ids = [node['id']]
+        elif macs:
+            node_ids = self._find_node_ids_by_macs(macs)
 
-        if name_or_id or mac:
-            if node_id:
-                # fetch node details with self.conn.baremetal.get_node()
-                # because self.conn.baremetal.nodes() does not provide a
-                # query parameter to filter by a node's id
-                node = self.conn.baremetal.get_node(node_id)
-                nodes = [node.to_dict(computed=False)]
-            else:  # not node_id
-                # return empty list when no matching node could be found
-                # because *_info modules do not raise errors on missing
-                # resources
-                nodes = []
+        if name_or_id or macs:
+            # return empty list when no matching node could be found
+            # because *_info modules do not raise errors on missing
+            # resources
+            nodes = [node.to_dict(computed=False)
+                     for node in self._fetch_nodes(node_ids, fields)]
         else:  # not name_or_id and not mac
+            # Bare Metal API does not allow selecting fields of details
+            kwargs = dict(fields=fields) if fields else dict(details=True)
             nodes = [node.to_dict(computed=False) for node in
-                     self.conn.baremetal.nodes(details=True)]
+                     self.conn.baremetal.nodes(**kwargs)]
 
         self.exit_json(changed=False,
                        nodes=nodes,
                        # keep for backward compatibility
                        baremetal_nodes=nodes)
 
+    def _find_node_ids_by_macs(self, macs):
+        if len(macs) == 1:
+            # self.conn.get_machine_by_mac(mac) is not necessary
+            # because nodes can be filtered by instance_id
+            baremetal_port = self.conn.get_nic_by_mac(macs[0])
+            return [baremetal_port['node_id']] if baremetal_port else []
+
+        # Listing all ports once is cheaper than one request per address
+        node_ids_by_mac = dict(
+            (port['address'].lower(), port['node_id'])
+            for port in self.conn.baremetal.ports(
+                fields=['address', 'node_id']))
+
+        node_ids = []
+        for mac in macs:
+            node_id = node_ids_by_mac.get(mac.lower())
+            if node_id and node_id not in node_ids:
+                node_ids.append(node_id)
+        return node_ids
+
+    def _fetch_nodes(self, node_ids, fields):
+        max_workers = self.params['max_workers']
+
+        if len(node_ids) > max_workers:
+            # A single listing is cheaper than several rounds of requests
+            kwargs = dict(fields=fields) if fields else dict(details=True)
+            nodes = dict((node['id'], node)
+                         for node in self.conn.baremetal.nodes(**kwargs))
+            return [nodes[node_id] for node_id in node_ids
+                    if node_id in nodes]
+
+        # fetch node details with self.conn.baremetal.get_node()
+        # because self.conn.baremetal.nodes() does not provide a
+        # query parameter to filter by a node's id
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(
+                lambda node_id: self.conn.baremetal.get_node(node_id,
+                                                             fields=fields),
+                node_ids))
+
 
 def main():
     module = BaremetalNodeInfoModule()
@@ -27,6 +27,7 @@ options:
       type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -142,6 +143,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
 class BaremetalPortInfoModule(OpenStackModule):
     argument_spec = dict(
         address=dict(),
+        fields=dict(type='list', elements='str'),
         name=dict(aliases=['uuid']),
         node=dict(),
     )
@@ -157,7 +159,9 @@ class BaremetalPortInfoModule(OpenStackModule):
             port = self.conn.baremetal.find_port(name_or_id)
             return [port] if port else []
 
-        kwargs = {}
+        fields = self.query_fields(self.sdk.baremetal.v1.port.Port, 'id')
+        # Bare Metal API does not allow selecting fields of details
+        kwargs = dict(fields=fields) if fields else dict(details=True)
         address = self.params['address']
         if address:
             kwargs['address'] = address
@@ -171,7 +175,7 @@ class BaremetalPortInfoModule(OpenStackModule):
                 # node does not exist so no port could possibly be found
                 return []
 
-        return self.conn.baremetal.ports(details=True, **kwargs)
+        return self.conn.baremetal.ports(**kwargs)
 
     def run(self):
         ports = [port.to_dict(computed=False)
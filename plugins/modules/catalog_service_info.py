@@ -18,6 +18,7 @@ options:
       type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -71,6 +72,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
 
 class CatalogServiceInfoModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         name=dict(),
     )
 
@@ -12,6 +12,11 @@ author: OpenStack Ansible SIG
 description:
   - Fetch OpenStack compute flavors.
 options:
+  disk:
+    description:
+      - Filter flavors based on the size of the root disk in GB.
+      - I(disk) supports same format as I(ram) option.
+    type: str
   ephemeral:
     description:
       - Filter flavors based on the amount of ephemeral storage.
@@ -21,6 +26,10 @@ options:
     description:
       - Limits number of flavors to I(limit) results.
       - By default all matching flavors are returned.
+      - Flavors are fetched page by page with I(limit) as page size until
+        I(limit) matching flavors have been found, unless I(disk),
+        I(ephemeral), I(ram) or I(vcpus) is C(MIN) or C(MAX) which requires
+        fetching all flavors.
     type: int
   name:
     description:
@@ -38,6 +47,9 @@ options:
          prefix the amount of RAM with one of these acceptable range values:
          '<', '>', '<=', '>='. These values represent less than, greater than,
          less than or equal to, and greater than or equal to, respectively."
+      - "Exact amounts and ranges with '>' or '>=' are passed to the Compute
+         API which returns only flavors with at least this amount of RAM.
+         The same applies to I(disk)."
     type: str
   vcpus:
     description:
@@ -46,6 +58,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -74,6 +87,12 @@ EXAMPLES = r'''
     ram: "MIN"
     limit: 1
 
+- name: Get up to 5 flavors with >= 20 GB root disk
+  openstack.cloud.compute_flavor_info:
+    cloud: mycloud
+    disk: ">=20"
+    limit: 5
+
 - name: Get all flavors with >=1024 MB RAM and 2 vCPUs
   openstack.cloud.compute_flavor_info:
     cloud: mycloud
@@ -152,12 +171,17 @@ flavors:
       sample: 2
 '''
 
+import itertools
+import re
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
 
 class ComputeFlavorInfoModule(OpenStackModule):
     argument_spec = dict(
+        disk=dict(),
         ephemeral=dict(),
+        fields=dict(type='list', elements='str'),
         limit=dict(type='int'),
         name=dict(),
         ram=dict(),
@@ -170,27 +194,50 @@ class ComputeFlavorInfoModule(OpenStackModule):
 
     def run(self):
         name = self.params['name']
+        limit = self.params['limit']
 
         filters = dict((k, self.params[k])
-                       for k in ['ephemeral', 'ram', 'vcpus']
+                       for k in ['disk', 'ephemeral', 'ram', 'vcpus']
                        if self.params[k] is not None)
 
         if name:
             flavor = self.conn.compute.find_flavor(name)
             flavors = [flavor] if flavor else []
+        elif any(v.upper() in ['MIN', 'MAX'] for v in filters.values()):
+            # Minimum and maximum are computed over all flavors
+            flavors = self.conn.range_search(
+                list(self.conn.compute.flavors()), filters)
+            filters = {}
         else:
-            flavors = list(self.conn.compute.flavors())
+            flavors = self.conn.compute.flavors(**self._query())
 
         if filters:
-            flavors = self.conn.range_search(flavors, filters)
+            flavors = (f for f in flavors
+                       if all(self.conn.range_search([f], {k: v})
+                              for k, v in filters.items()))
 
-        limit = self.params['limit']
-        if limit is not None:
-            flavors = flavors[:limit]
+        # Stop paging as soon as enough flavors have been found
+        flavors = list(itertools.islice(flavors, limit))
 
         self.exit_json(changed=False,
                        flavors=[f.to_dict(computed=False) for f in flavors])
 
+    def _query(self):
+        query = {}
+
+        for option, key in [('disk', 'min_disk'), ('ram', 'min_ram')]:
+            value = self.params[option]
+            match = re.match(r'^\s*(>=?)?\s*(\d+)\s*$', value or '')
+            if match:
+                operator, amount = match.groups()
+                query[key] = int(amount) + (1 if operator == '>' else 0)
+
+        limit = self.params['limit']
+        if limit is not None:
+            query['limit'] = limit
+
+        return query
+
 
 def main():
     module = ComputeFlavorInfoModule()
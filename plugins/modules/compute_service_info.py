@@ -22,6 +22,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -81,6 +82,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class ComputeServiceInfoModule(OpenStackModule):
     argument_spec = dict(
         binary=dict(),
+        fields=dict(type='list', elements='str'),
         host=dict(),
     )
 
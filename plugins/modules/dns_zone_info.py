@@ -37,6 +37,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -139,6 +140,7 @@ class DnsZoneInfoModule(OpenStackModule):
     argument_spec = dict(
         description=dict(),
         email=dict(),
+        fields=dict(type='list', elements='str'),
         name=dict(),
         ttl=dict(type='int'),
         type=dict(choices=['primary', 'secondary']),
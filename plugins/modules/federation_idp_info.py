@@ -18,6 +18,7 @@ options:
     aliases: ['name']
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -67,6 +68,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 
 class IdentityFederationIdpInfoModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         id=dict(aliases=['name']),
     )
     module_kwargs = dict(
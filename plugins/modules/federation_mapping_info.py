@@ -21,6 +21,7 @@ notes:
     - Name equals the ID of a federation mapping.
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -59,6 +60,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 
 class IdentityFederationMappingInfoModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         name=dict(aliases=['id']),
     )
 
@@ -48,6 +48,7 @@ options:
     type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 RETURN = '''
@@ -142,6 +143,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class FloatingIPInfoModule(OpenStackModule):
     argument_spec = dict(
         description=dict(),
+        fields=dict(type='list', elements='str'),
         fixed_ip_address=dict(),
         floating_ip_address=dict(),
         floating_network=dict(),
@@ -187,6 +189,11 @@ class FloatingIPInfoModule(OpenStackModule):
         if status:
             query['status'] = status.upper()
 
+        fields = self.query_fields(
+            self.sdk.network.v2.floating_ip.FloatingIP)
+        if fields:
+            query['fields'] = fields
+
         self.exit_json(
             changed=False,
             floating_ips=[ip.to_dict(computed=False)
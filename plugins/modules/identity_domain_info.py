@@ -23,6 +23,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -72,6 +73,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 
 class IdentityDomainInfoModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         filters=dict(type='dict'),
         name=dict(),
     )
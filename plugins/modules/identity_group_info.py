@@ -27,6 +27,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -80,6 +81,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class IdentityGroupInfoModule(OpenStackModule):
     argument_spec = dict(
         domain=dict(),
+        fields=dict(type='list', elements='str'),
         filters=dict(type='dict'),
         name=dict(),
     )
@@ -24,6 +24,7 @@ options:
     required: false
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 RETURN = r'''
@@ -72,6 +73,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class IdentityRoleInfoModule(OpenStackModule):
     argument_spec = dict(
         domain_id=dict(),
+        fields=dict(type='list', elements='str'),
         name=dict(),
     )
 
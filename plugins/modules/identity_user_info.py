@@ -27,6 +27,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -104,6 +105,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class IdentityUserInfoModule(OpenStackModule):
     argument_spec = dict(
         domain=dict(),
+        fields=dict(type='list', elements='str'),
         filters=dict(type='dict'),
         name=dict(),
     )
@@ -20,10 +20,25 @@ options:
   filters:
     description:
       - Dict of properties of the images used for query
+      - Properties which are query parameters of the Image API such as
+        C(owner), C(status) or C(visibility) are passed to the API, all
+        other properties are matched client-side.
     type: dict
     aliases: ['properties']
+  limit:
+    description:
+      - Maximum number of images to return.
+      - Images are fetched page by page with I(limit) as page size until
+        I(limit) images matching all criteria have been found.
+    type: int
+  marker:
+    description:
+      - ID of the last image of a previous page.
+      - Only images listed after this image will be returned.
+    type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -39,6 +54,20 @@ EXAMPLES = r'''
   openstack.cloud.image_info:
     filters:
       is_protected: False
+
+- name: Retrieve first page of images owned by a project
+  openstack.cloud.image_info:
+    filters:
+      owner: 55e2ce24b2a245b09f181bf025724cbe
+    limit: 100
+  register: result
+
+- name: Retrieve next page of images owned by a project
+  openstack.cloud.image_info:
+    filters:
+      owner: 55e2ce24b2a245b09f181bf025724cbe
+    limit: 100
+    marker: "{{ result.images[-1].id }}"
 '''
 
 RETURN = r'''
@@ -271,7 +300,10 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class ImageInfoModule(OpenStackModule):
 
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         filters=dict(type='dict', aliases=['properties']),
+        limit=dict(type='int'),
+        marker=dict(),
         name=dict(aliases=['image']),
     )
 
@@ -280,17 +312,15 @@ class ImageInfoModule(OpenStackModule):
     )
 
     def run(self):
-        kwargs = dict((k, self.params[k])
-                      for k in ['filters']
-                      if self.params[k] is not None)
-
-        name_or_id = self.params['name']
-        if name_or_id is not None:
-            kwargs['name_or_id'] = name_or_id
+        images = self.search_resources(self.conn.image.images,
+                                       self.sdk.image.v2.image.Image,
+                                       name_or_id=self.params['name'],
+                                       filters=self.params['filters'],
+                                       limit=self.params['limit'],
+                                       marker=self.params['marker'])
 
         self.exit(changed=False,
-                  images=[i.to_dict(computed=False)
-                          for i in self.conn.search_images(**kwargs)])
+                  images=[i.to_dict(computed=False) for i in images])
 
 
 def main():
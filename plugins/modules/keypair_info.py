@@ -31,6 +31,7 @@ options:
     type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = '''
@@ -108,6 +109,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
 
 class KeyPairInfoModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         name=dict(),
         user_id=dict(),
         limit=dict(type='int'),
@@ -28,6 +28,7 @@ notes:
     - Name equals the ID of an identity provider.
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -71,6 +72,7 @@ class IdentityFederationProtocolInfoModule(OpenStackModule):
     argument_spec = dict(
         name=dict(aliases=['id']),
         idp=dict(required=True, aliases=['idp_id', 'idp_name']),
+        fields=dict(type='list', elements='str'),
     )
 
     module_kwargs = dict(
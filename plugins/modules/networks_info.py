@@ -21,10 +21,25 @@ options:
      description:
         - A dictionary of meta data to use for further filtering.  Elements of
           this dictionary may be additional dictionaries.
+        - Elements which are query parameters of the Networking API such as
+          C(project_id), C(status) or C(is_router_external) are passed to the
+          API, all other elements are matched client-side.
      required: false
      type: dict
+   limit:
+     description:
+        - Maximum number of networks to return.
+        - Networks are fetched page by page with I(limit) as page size until
+          I(limit) networks matching all criteria have been found.
+     type: int
+   marker:
+     description:
+        - ID of the last network of a previous page.
+        - Only networks listed after this network will be returned.
+     type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = '''
@@ -171,18 +186,23 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class NetworkInfoModule(OpenStackModule):
     argument_spec = dict(
         name=dict(),
-        filters=dict(type='dict')
+        filters=dict(type='dict'),
+        limit=dict(type='int'),
+        marker=dict(),
+        fields=dict(type='list', elements='str'),
     )
     module_kwargs = dict(
         supports_check_mode=True
     )
 
     def run(self):
-        kwargs = {
-            'filters': self.params['filters'],
-            'name_or_id': self.params['name']
-        }
-        networks = self.conn.search_networks(**kwargs)
+        networks = self.search_resources(
+            self.conn.network.networks,
+            self.sdk.network.v2.network.Network,
+            name_or_id=self.params['name'],
+            filters=self.params['filters'],
+            limit=self.params['limit'],
+            marker=self.params['marker'])
         networks = [i.to_dict(computed=False) for i in networks]
         self.exit(changed=False, networks=networks)
 
@@ -59,6 +59,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -127,6 +128,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class NeutronRBACPoliciesInfo(OpenStackModule):
     argument_spec = dict(
         action=dict(choices=['access_as_external', 'access_as_shared']),
+        fields=dict(type='list', elements='str'),
         object_id=dict(),
         object_type=dict(choices=['security_group', 'qos_policy', 'network']),
         policy_id=dict(),
@@ -161,6 +163,13 @@ class NeutronRBACPoliciesInfo(OpenStackModule):
             if project:
                 kwargs['project_id'] = project.id
 
+            # Attributes which are matched client-side must be fetched too
+            fields = self.query_fields(
+                self.sdk.network.v2.rbac_policy.RBACPolicy,
+                'object_id', 'target_project_id', 'project_id')
+            if fields:
+                kwargs['fields'] = fields
+
             policies = list(self.conn.network.rbac_policies(**kwargs))
 
         for k in ['object_id', 'target_project_id']:
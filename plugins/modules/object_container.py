@@ -63,6 +63,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.plan
 '''
 
 RETURN = r'''
@@ -216,6 +217,7 @@ class ContainerModule(OpenStackModule):
         delete_with_all_objects=dict(type='bool', default=False),
         metadata=dict(type='dict'),
         name=dict(required=True, aliases=['container']),
+        plan_file=dict(type='path'),
         read_ACL=dict(),
         state=dict(default='present', choices=['present', 'absent']),
         write_ACL=dict(),
@@ -227,7 +229,11 @@ class ContainerModule(OpenStackModule):
 
     def run(self):
         state = self.params['state']
-        container = self._find()
+
+        container, update = \
+            self.read_plan(self.conn.object_store.get_container_metadata)
+        if not container:
+            container = self._find()
 
         if self.ansible.check_mode:
             self.exit_json(changed=self._will_change(state, container))
@@ -243,7 +249,8 @@ class ContainerModule(OpenStackModule):
 
         elif state == 'present' and container:
             # Update container
-            update = self._build_update(container)
+            if update is None:
+                update = self._build_update(container)
             if update:
                 container = self._update(container, update)
 
@@ -346,7 +353,7 @@ class ContainerModule(OpenStackModule):
         if state == 'present' and not container:
             return True
         elif state == 'present' and container:
-            return bool(self._build_update(container))
+            return bool(self.plan_update(container, self._build_update))
         elif state == 'absent' and container:
             return True
         else:
@@ -23,6 +23,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 """
 
 EXAMPLES = r"""
@@ -165,6 +166,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 
 class ObjectContainersInfoModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         name=dict(aliases=["container"]),
         prefix=dict(),
     )
@@ -32,6 +32,7 @@ options:
 
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 
 '''
 
@@ -92,6 +93,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
 class PortForwardingInfoModule(OpenStackModule):
     argument_spec = dict(
         external_port=dict(type='int'),
+        fields=dict(type='list', elements='str'),
         floating_ip=dict(),
         internal_port_id=dict(),
         port_forwarding_id=dict(),
@@ -115,10 +117,15 @@ class PortForwardingInfoModule(OpenStackModule):
             fip = self.conn.network.find_ip(floating_ip)
             floating_ips = [fip] if fip else []
         else:
-            floating_ips = self.conn.network.ips()
+            # Only ids of floating ips are needed
+            floating_ips = self.conn.network.ips(fields=['id'])
 
         port_forwardings = []
         if port_forwarding_id is None:
+            fields = self.query_fields(
+                self.sdk.network.v2.port_forwarding.PortForwarding)
+            if fields:
+                query_kwargs['fields'] = fields
             for fip in floating_ips:
                 pfwds = self.conn.network.port_forwardings(fip.id, **query_kwargs)
                 port_forwardings.extend(list(pfwds))
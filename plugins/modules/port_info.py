@@ -21,9 +21,23 @@ options:
             - A dictionary of meta data to use for further filtering. Elements
               of this dictionary will be matched passed to the API as query
               parameter filters.
+            - Elements which are not query parameters of the Networking API
+              are matched client-side.
         type: dict
+    limit:
+        description:
+            - Maximum number of ports to return.
+            - Ports are fetched page by page with I(limit) as page size until
+              I(limit) ports matching all criteria have been found.
+        type: int
+    marker:
+        description:
+            - ID of the last port of a previous page.
+            - Only ports listed after this port will be returned.
+        type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = '''
@@ -270,6 +284,9 @@ class PortInfoModule(OpenStackModule):
     argument_spec = dict(
         name=dict(aliases=['port']),
         filters=dict(type='dict'),
+        limit=dict(type='int'),
+        marker=dict(),
+        fields=dict(type='list', elements='str'),
     )
     module_kwargs = dict(
         supports_check_mode=True
@@ -277,9 +294,13 @@ class PortInfoModule(OpenStackModule):
 
     def run(self):
         ports = [p.to_dict(computed=False) for p in
-                 self.conn.search_ports(
+                 self.search_resources(
+                     self.conn.network.ports,
+                     self.sdk.network.v2.port.Port,
                      name_or_id=self.params['name'],
-                     filters=self.params['filters'])]
+                     filters=self.params['filters'],
+                     limit=self.params['limit'],
+                     marker=self.params['marker'])]
 
         self.exit_json(changed=False, ports=ports)
 
@@ -0,0 +1,238 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r'''
+---
+module: probe
+short_description: Check existence and status of many OpenStack resources
+author: OpenStack Ansible SIG
+description:
+  - Check whether flavors, images, networks, ports, projects, routers,
+    security groups, servers, subnets and volumes exist and which status
+    they are in.
+  - References are grouped by type. Images, networks, ports, routers,
+    security groups and subnets are queried with a single filter for all
+    references of a type. Other types are listed once and matched locally.
+    Resource types are queried concurrently.
+  - This module does not change any resources.
+options:
+  max_workers:
+    description:
+      - Maximum number of concurrent requests.
+    default: 8
+    type: int
+  resources:
+    description:
+      - List of resources to probe.
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Name or ID of the resource.
+        required: true
+        type: str
+      type:
+        description:
+          - Type of the resource.
+        choices: ['flavor', 'image', 'network', 'port', 'project', 'router',
+                  'security_group', 'server', 'subnet', 'volume']
+        required: true
+        type: str
+extends_documentation_fragment:
+  - openstack.cloud.openstack
+'''
+
+RETURN = r'''
+resources:
+  description: "Dictionary which maps resource types to dictionaries which
+                map names and IDs as given in I(resources) to the probe
+                result."
+  returned: always
+  type: dict
+  sample:
+    server:
+      web1:
+        exists: true
+        id: e0c5c4ee-0d8c-4b6b-8bbf-8c0c7ea3ee7c
+        matches: 1
+        status: ACTIVE
+      web2:
+        exists: false
+        id: null
+        matches: 0
+        status: null
+  contains:
+    exists:
+      description: Whether at least one resource matches the name or ID.
+      type: bool
+    id:
+      description: ID of the matching resource or C(null) if none or more
+                   than one resource matches.
+      type: str
+    matches:
+      description: Number of resources which match the name or ID.
+      type: int
+    status:
+      description: Status of the matching resource or C(null) if none or
+                   more than one resource matches or if resources of this
+                   type have no status.
+      type: str
+'''
+
+EXAMPLES = r'''
+- name: Probe resources
+  openstack.cloud.probe:
+    cloud: devstack
+    resources:
+      - type: server
+        name: web1
+      - type: volume
+        name: data
+      - type: network
+        name: 0c2b3a6c-0e1b-4b6c-a3d6-f1f5b0f9c7a1
+  register: probe
+
+- name: Show server status
+  ansible.builtin.debug:
+    msg: "web1 is {{ probe.resources.server.web1.status }}"
+  when: probe.resources.server.web1.exists
+'''
+
+import concurrent.futures
+
+from ansible_collections.openstack.cloud.plugins.module_utils.openstack import (
+    OpenStackModule, is_uuid)
+
+# Maximum number of names or ids which are sent in a single request
+CHUNK_SIZE = 100
+
+# filter is 'list' for APIs which accept repeated query parameters,
+# 'in' for APIs which accept an 'in:' operator and None for APIs which
+# cannot filter by many names or ids at once, query holds parameters which
+# are passed to every listing
+TYPES = dict(
+    # Nova lists public flavors only unless is_public is the string None
+    flavor=dict(service='compute', list='flavors', filter=None,
+                status=None, query=dict(is_public='None')),
+    image=dict(service='image', list='images', filter='in',
+               status='status'),
+    network=dict(service='network', list='networks', filter='list',
+                 status='status'),
+    port=dict(service='network', list='ports', filter='list',
+              status='status'),
+    project=dict(service='identity', list='projects', filter=None,
+                 status=None),
+    router=dict(service='network', list='routers', filter='list',
+                status='status'),
+    security_group=dict(service='network', list='security_groups',
+                        filter='list', status=None),
+    server=dict(service='compute', list='servers', filter=None,
+                status='status'),
+    subnet=dict(service='network', list='subnets', filter='list',
+                status=None),
+    volume=dict(service='block_storage', list='volumes', filter=None,
+                status='status'),
+)
+
+
+class ProbeModule(OpenStackModule):
+    argument_spec = dict(
+        max_workers=dict(default=8, type='int'),
+        resources=dict(required=True, type='list', elements='dict',
+                       options=dict(
+                           name=dict(required=True),
+                           type=dict(required=True,
+                                     choices=sorted(TYPES.keys())),
+                       )),
+    )
+
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    def run(self):
+        refs = dict()
+        for item in self.params['resources']:
+            names = refs.setdefault(item['type'], [])
+            if item['name'] not in names:
+                names.append(item['name'])
+
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            futures = dict(
+                (type_name, executor.submit(self._probe, type_name, names))
+                for type_name, names in refs.items())
+            resources = dict((type_name, future.result())
+                             for type_name, future in futures.items())
+
+        self.exit_json(changed=False, resources=resources)
+
+    def _probe(self, type_name, names):
+        spec = TYPES[type_name]
+        list_function = getattr(getattr(self.conn, spec['service']),
+                                spec['list'])
+
+        if spec['filter']:
+            query = dict(spec.get('query', {}))
+            if spec['filter'] == 'list':
+                query['fields'] = ['id', 'name']
+                if spec['status']:
+                    query['fields'].append(spec['status'])
+
+            # UUIDs can be names too, so names are queried for all
+            # references which did not match an id
+            ids = [name for name in names if is_uuid(name)]
+            resources = list(self._query(list_function, spec['filter'],
+                                         query, 'id', ids))
+            found = set(r['id'] for r in resources)
+            resources += self._query(list_function, spec['filter'], query,
+                                     'name',
+                                     [name for name in names
+                                      if name not in found])
+        else:
+            resources = list(list_function(**spec.get('query', {})))
+
+        by_id = dict()
+        by_name = dict()
+        for resource in resources:
+            by_id[resource['id']] = resource
+        for resource in by_id.values():
+            by_name.setdefault(resource['name'], []).append(resource)
+
+        results = dict()
+        for name in names:
+            matches = [by_id[name]] if name in by_id \
+                else by_name.get(name, [])
+            resource = matches[0] if len(matches) == 1 else None
+            results[name] = dict(
+                exists=bool(matches),
+                id=resource['id'] if resource else None,
+                matches=len(matches),
+                status=resource.get(spec['status'])
+                if resource and spec['status'] else None)
+        return results
+
+    def _query(self, list_function, filter, query, key, values):
+        for i in range(0, len(values), CHUNK_SIZE):
+            chunk = values[i:i + CHUNK_SIZE]
+            if filter == 'in':
+                # Glance requires values with commas or quotes to be quoted
+                chunk = 'in:' + ','.join(
+                    '"{0}"'.format(v.replace('"', '\\"'))
+                    if ',' in v or '"' in v else v
+                    for v in chunk)
+            yield from list_function(**dict(query, **{key: chunk}))
+
+
+def main():
+    module = ProbeModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
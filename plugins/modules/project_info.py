@@ -28,6 +28,7 @@ options:
     type: dict
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -102,6 +103,7 @@ class IdentityProjectInfoModule(OpenStackModule):
         domain=dict(),
         name=dict(),
         filters=dict(type='dict'),
+        fields=dict(type='list', elements='str'),
     )
     module_kwargs = dict(
         supports_check_mode=True
@@ -0,0 +1,551 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r'''
+---
+module: reconcile
+short_description: Manage many interdependent OpenStack cloud resources
+author: OpenStack Ansible SIG
+description:
+  - Create, update and delete networks, subnets, routers, ports, security
+    groups, servers and volumes which are described in a single desired
+    state document.
+  - Resources refer to each other by name. These references define the
+    order in which changes are applied. Changes to resources which do not
+    depend on each other are applied concurrently.
+  - Each resource type is listed once before any change is applied.
+    Resources are matched by name against these listings.
+options:
+  max_workers:
+    description:
+      - Maximum number of concurrent requests.
+    default: 8
+    type: int
+  resources:
+    description:
+      - List of resources.
+      - A resource may refer to other resources by name, either to resources
+        in this list or to existing resources in the cloud. Resources which
+        shall be present must not refer to resources which shall be absent.
+      - "Supported references in I(attributes) are C(network) for
+         subnets and ports, C(security_groups) for ports and servers,
+         C(external_network) for routers, and C(networks) and C(ports)
+         for servers. References are converted to attributes such as
+         C(network_id), C(security_group_ids), C(external_gateway_info)
+         and C(networks)."
+      - Networks and ports of servers are attached in the order in which
+        I(networks) and I(ports) are given in I(attributes). The order of
+        security groups of ports is not significant.
+    required: true
+    type: list
+    elements: dict
+    suboptions:
+      attributes:
+        description:
+          - "Resource attributes which are defined in openstacksdk's
+             resource classes, plus references to other resources."
+          - Attributes C(cidr), C(ip_version), C(ipv6_address_mode),
+            C(ipv6_ra_mode), C(network_id) and C(subnet_pool_id) of subnets,
+            C(network_id) of ports, C(external_gateway_info) of routers and
+            C(provider_network_type) and C(provider_physical_network) of
+            networks cannot be updated.
+          - Only attributes C(access_ipv4), C(access_ipv6), C(description)
+            and C(name) of servers and C(description) and C(name) of
+            volumes can be updated.
+        type: dict
+      name:
+        description:
+          - Name of the resource.
+          - Names must be unique per resource type.
+        required: true
+        type: str
+      state:
+        description:
+          - Whether the resource should be C(present) or C(absent).
+          - Defaults to I(state).
+        choices: ['present', 'absent']
+        type: str
+      type:
+        description:
+          - Type of the resource.
+        choices: ['network', 'port', 'router', 'security_group', 'server',
+                  'subnet', 'volume']
+        required: true
+        type: str
+  state:
+    description:
+      - Whether resources should be C(present) or C(absent) unless
+        defined differently in I(resources).
+    choices: ['present', 'absent']
+    default: present
+    type: str
+  wait:
+    description:
+      - Whether Ansible should wait until networks, routers, servers and
+        volumes have reached their target I(state) before dependent
+        resources are processed.
+      - Created resources are waited for until they are active or
+        available. Updated resources are waited for until they are back in
+        the status they had before the update, e.g. C(in-use) for attached
+        volumes or C(SHUTOFF) for stopped servers.
+    type: bool
+    default: true
+extends_documentation_fragment:
+  - openstack.cloud.openstack
+'''
+
+RETURN = r'''
+resources:
+  description: List of per-resource results in the same order as
+               I(resources).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    changed:
+      description: Whether this resource has been changed.
+      type: bool
+    failed:
+      description: Whether applying changes to this resource failed or has
+                   been skipped because a resource it depends on failed.
+      type: bool
+    msg:
+      description: Error message if applying changes failed.
+      type: str
+    name:
+      description: Name of the resource as given in I(resources).
+      type: str
+    resource:
+      description: Dictionary describing the identified (and possibly
+                   modified) OpenStack cloud resource.
+      returned: When the state of this resource is C(present) and no error
+                occurred.
+      type: dict
+    type:
+      description: Type of the resource as given in I(resources).
+      type: str
+'''
+
+EXAMPLES = r'''
+- name: Bring up an environment
+  openstack.cloud.reconcile:
+    cloud: devstack
+    resources:
+      - type: network
+        name: app
+      - type: subnet
+        name: app
+        attributes:
+          network: app
+          cidr: 10.10.0.0/24
+          ip_version: 4
+      - type: router
+        name: app
+        attributes:
+          external_network: public
+      - type: security_group
+        name: app
+        attributes:
+          description: Application servers
+      - type: port
+        name: app-vip
+        attributes:
+          network: app
+          security_groups:
+            - app
+      - type: server
+        name: app-1
+        attributes:
+          flavor_id: 2d7d4bd1-a3cb-4e39-8e1d-8b2e3c8a2d6e
+          image_id: 6e4b3e05-5a7c-4c11-8c8e-1cf0f6bd6f4c
+          networks:
+            - app
+          security_groups:
+            - app
+      - type: volume
+        name: app-data
+        attributes:
+          size: 10
+
+- name: Tear down an environment
+  openstack.cloud.reconcile:
+    cloud: devstack
+    state: absent
+    resources:
+      - type: network
+        name: app
+      - type: subnet
+        name: app
+        attributes:
+          network: app
+      - type: server
+        name: app-1
+        attributes:
+          networks:
+            - app
+'''
+
+import concurrent.futures
+
+from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
+from ansible_collections.openstack.cloud.plugins.module_utils.resource import StateMachine
+
+# Resource types with the openstacksdk service which provides them, the
+# status to wait for after creation, references to other resources and
+# attributes which can or cannot be updated. A reference maps an attribute
+# name which holds names of other resources to the type of referenced
+# resources, the openstacksdk attribute which receives their ids and a
+# function which converts a single id to a value of that attribute.
+# Unordered attributes hold lists whose order is not significant.
+TYPES = dict(
+    network=dict(
+        service='network',
+        status='active',
+        references=dict(),
+        non_updateable=['provider_network_type',
+                        'provider_physical_network'],
+    ),
+    port=dict(
+        service='network',
+        references=dict(
+            network=('network', 'network_id', None),
+            security_groups=('security_group', 'security_group_ids', None),
+        ),
+        non_updateable=['network_id'],
+        unordered=['security_group_ids'],
+    ),
+    router=dict(
+        service='network',
+        status='active',
+        references=dict(
+            external_network=('network', 'external_gateway_info',
+                              lambda id: dict(network_id=id)),
+        ),
+        non_updateable=['external_gateway_info'],
+    ),
+    security_group=dict(
+        service='network',
+        references=dict(),
+        non_updateable=[],
+    ),
+    server=dict(
+        service='compute',
+        status='active',
+        references=dict(
+            networks=('network', 'networks', lambda id: dict(uuid=id)),
+            ports=('port', 'networks', lambda id: dict(port=id)),
+            security_groups=('security_group', 'security_groups',
+                             lambda id: dict(name=id)),
+        ),
+        updateable=['access_ipv4', 'access_ipv6', 'description', 'name'],
+    ),
+    subnet=dict(
+        service='network',
+        references=dict(
+            network=('network', 'network_id', None),
+        ),
+        non_updateable=['cidr', 'ip_version', 'ipv6_address_mode',
+                        'ipv6_ra_mode', 'network_id', 'subnet_pool_id'],
+    ),
+    volume=dict(
+        service='block_storage',
+        status='available',
+        references=dict(),
+        updateable=['description', 'name'],
+    ),
+)
+
+
+class ReconcileModule(OpenStackModule):
+    argument_spec = dict(
+        max_workers=dict(default=8, type='int'),
+        resources=dict(required=True, type='list', elements='dict',
+                       options=dict(
+                           attributes=dict(type='dict'),
+                           name=dict(required=True),
+                           state=dict(choices=['absent', 'present']),
+                           type=dict(required=True,
+                                     choices=sorted(TYPES.keys())),
+                       )),
+        state=dict(default='present', choices=['absent', 'present']),
+        wait=dict(default=True, type='bool'),
+    )
+
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    class _StateMachine(StateMachine):
+        # status is passed as keyword argument to the constructor
+
+        def _create(self, attributes, timeout, wait, **kwargs):
+            resource = super()._create(attributes, timeout, False, **kwargs)
+            return self._wait(resource, timeout, self.status) if wait \
+                else resource
+
+        def _update(self, resource, timeout, update, wait, **kwargs):
+            # Updated resources keep the status they had before, e.g.
+            # attached volumes stay in-use and stopped servers stay SHUTOFF
+            status = resource.get('status')
+            resource = super()._update(resource, timeout, update, False,
+                                       **kwargs)
+            return self._wait(resource, timeout, status) if wait \
+                else resource
+
+        def _wait(self, resource, timeout, status):
+            if not self.status or not status:
+                # Resource does not report a meaningful status
+                return resource
+
+            return self.sdk.resource.wait_for_status(self.session,
+                                                     resource,
+                                                     status=status,
+                                                     failures=['error'],
+                                                     wait=timeout,
+                                                     attribute='status')
+
+    def run(self):
+        items = self._parse_resources()
+        dependencies = self._build_dependencies(items)
+
+        type_names = set(type_name for type_name, name in items)
+        for item in items.values():
+            type_names.update(
+                TYPES[item['type']]['references'][k][0]
+                for k in item['references'])
+
+        self.state_machines = dict(
+            (type_name, self._StateMachine(
+                connection=self.conn,
+                service_name=TYPES[type_name]['service'],
+                type_name=type_name,
+                sdk=self.sdk,
+                fail_json=self.fail_json,
+                status=TYPES[type_name].get('status')))
+            for type_name in type_names)
+
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            self.listings = self._list(executor, type_names)
+            results = self._apply(executor, items, dependencies)
+
+        results = [results[key] for key in items]
+        is_changed = any(result['changed'] for result in results)
+        failures = [result for result in results if result['failed']]
+        if failures:
+            self.fail_json(msg='Failed to apply changes to {0} of {1}'
+                               ' resources.'.format(len(failures),
+                                                    len(results)),
+                           changed=is_changed,
+                           resources=results)
+
+        self.exit_json(changed=is_changed, resources=results)
+
+    def _parse_resources(self):
+        items = {}
+        for resource in self.params['resources']:
+            type_name = resource['type']
+            key = (type_name, resource['name'])
+            if key in items:
+                self.fail_json(msg='Found more than a single {0} with name'
+                                   ' {1}.'.format(*key))
+
+            attributes = dict(resource['attributes'] or {})
+            # References keep the order of attributes, e.g. networks and
+            # ports of servers are attached in the order they are given
+            references = dict(
+                (k, attributes.pop(k))
+                for k in list(attributes)
+                if k in TYPES[type_name]['references'])
+            references = dict((k, v) for k, v in references.items()
+                              if v is not None)
+            attributes['name'] = resource['name']
+
+            items[key] = dict(attributes=attributes,
+                              name=resource['name'],
+                              references=references,
+                              state=resource['state'] or self.params['state'],
+                              type=type_name)
+        return items
+
+    def _build_dependencies(self, items):
+        # Returns a dict which maps each resource to resources which have to
+        # be processed before. Resources which shall be present depend on
+        # resources they refer to, while resources which shall be absent
+        # have to wait for resources which refer to them.
+        dependencies = dict((key, set()) for key in items)
+        for key, item in items.items():
+            for ref_key in self._iterate_references(item):
+                if ref_key not in items:
+                    # Reference to an existing resource in the cloud
+                    continue
+
+                ref_state = items[ref_key]['state']
+                if item['state'] == 'present' and ref_state == 'absent':
+                    self.fail_json(msg='{0} {1} shall be present but refers'
+                                       ' to {2} {3} which shall be absent.'
+                                       .format(*(key + ref_key)))
+                elif item['state'] == 'present':
+                    dependencies[key].add(ref_key)
+                elif ref_state == 'absent':
+                    dependencies[ref_key].add(key)
+
+        return dependencies
+
+    def _iterate_references(self, item):
+        for k, value in item['references'].items():
+            ref_type = TYPES[item['type']]['references'][k][0]
+            names = value if isinstance(value, list) else [value]
+            for name in names:
+                yield (ref_type, name)
+
+    def _list(self, executor, type_names):
+        futures = dict(
+            (type_name, executor.submit(
+                lambda sm: list(sm.list_function()),
+                self.state_machines[type_name]))
+            for type_name in type_names)
+        return dict((type_name, future.result())
+                    for type_name, future in futures.items())
+
+    def _apply(self, executor, items, dependencies):
+        results = {}
+        pending = dict((key, set(deps)) for key, deps in dependencies.items())
+        running = {}
+
+        while pending or running:
+            # Skipping an item might make items which depend on it ready, so
+            # ready items are collected until none are left
+            ready = [k for k, deps in pending.items() if not deps]
+            while ready:
+                for key in ready:
+                    del pending[key]
+
+                    failed = [k for k in dependencies[key]
+                              if results[k]['failed']]
+                    if failed:
+                        results[key] = self._result(
+                            items[key], failed=True,
+                            msg='Skipped because {0} {1} failed.'
+                                .format(*failed[0]))
+                        self._discard(pending, key)
+                        continue
+
+                    future = executor.submit(self._apply_item, items[key],
+                                             results)
+                    running[future] = key
+                ready = [k for k, deps in pending.items() if not deps]
+
+            if not running:
+                if pending:
+                    # References between resource types do not form cycles
+                    self.fail_json(msg='Found circular references between'
+                                       ' resources {0}.'
+                                       .format(sorted(pending.keys())))
+                continue
+
+            done = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED).done
+            for future in done:
+                key = running.pop(future)
+                results[key] = future.result()
+                self._discard(pending, key)
+
+        return results
+
+    def _discard(self, pending, key):
+        for deps in pending.values():
+            deps.discard(key)
+
+    def _apply_item(self, item, results):
+        sm = self.state_machines[item['type']]
+        definition = TYPES[item['type']]
+
+        try:
+            matches = sm._match(self.listings[item['type']],
+                                dict(name=item['name']))
+            if len(matches) > 1:
+                raise ValueError('Found more than a single {0} with name {1}.'
+                                 .format(item['type'], item['name']))
+            resource = matches[0] if matches else None
+
+            attributes = dict(item['attributes'])
+            if item['state'] == 'present':
+                attributes.update(self._resolve_references(item, results))
+
+            for k in definition.get('unordered', []):
+                # Neutron might return lists in any order, so only their
+                # elements are compared
+                if resource and k in attributes \
+                   and resource[k] is not None \
+                   and sorted(attributes[k]) == sorted(resource[k]):
+                    attributes[k] = resource[k]
+
+            updateable_attributes = None
+            if 'updateable' in definition:
+                updateable_attributes = [k for k in attributes
+                                         if k in definition['updateable']]
+
+            resource, is_changed = sm._apply(
+                resource, attributes, self.ansible.check_mode,
+                item['state'], self.params['timeout'], self.params['wait'],
+                updateable_attributes, definition.get('non_updateable'))
+        except (ValueError, self.sdk.exceptions.SDKException) as e:
+            return self._result(item, failed=True, msg=str(e))
+
+        return self._result(item, changed=is_changed, resource=resource)
+
+    def _resolve_references(self, item, results):
+        attributes = {}
+        for k, value in item['references'].items():
+            ref_type, attribute, convert = TYPES[item['type']]['references'][k]
+            names = value if isinstance(value, list) else [value]
+
+            ids = [self._resolve_reference(ref_type, name, results)
+                   for name in names]
+            if convert:
+                ids = [convert(id) for id in ids]
+
+            if not isinstance(value, list):
+                attributes[attribute] = ids[0]
+            else:
+                attributes.setdefault(attribute, []).extend(ids)
+        return attributes
+
+    def _resolve_reference(self, type_name, name, results):
+        key = (type_name, name)
+        if key in results:
+            resource = results[key].get('resource')
+            # Resources which would be created in check mode have no id
+            return resource.get('id') if resource else None
+
+        matches = self.state_machines[type_name]._match(
+            self.listings[type_name], dict(name=name))
+        if len(matches) != 1:
+            raise ValueError('Found {0} instead of a single {1} with name or'
+                             ' id {2}.'.format(len(matches), type_name, name))
+        return matches[0]['id']
+
+    def _result(self, item, changed=False, failed=False, msg=None,
+                resource=None):
+        result = dict(changed=changed,
+                      failed=failed,
+                      name=item['name'],
+                      type=item['type'])
+        if msg is not None:
+            result['msg'] = msg
+        if resource is not None:
+            result['resource'] = resource.to_dict(computed=False)
+        return result
+
+
+def main():
+    module = ReconcileModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
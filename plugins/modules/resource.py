@@ -26,8 +26,39 @@ options:
       - For a complete list of attributes open any resource class inside
         openstacksdk such as file C(openstack/compute/v2/server.py) in
         U(https://opendev.org/openstack/openstacksdk/) for server attributes.
-    required: true
+      - Mutually exclusive with I(items). One of I(attributes) and I(items)
+        is required.
     type: dict
+  items:
+    description:
+      - List of resources of the same I(service) and I(type) which will be
+        managed in a single task.
+      - The collection is listed once and each item is matched locally by
+        C(id), by C(name) or by all of its I(attributes), just like
+        I(attributes) identify a single resource. Attributes which are not
+        returned in listings cannot be used to match resources.
+      - Changes for all items are applied concurrently, see I(max_workers).
+      - Mutually exclusive with I(attributes).
+    type: list
+    elements: dict
+    suboptions:
+      attributes:
+        description:
+          - Resource attributes, see I(attributes).
+        required: true
+        type: dict
+      state:
+        description:
+          - Whether the resource should be C(present) or C(absent).
+          - Defaults to I(state).
+        choices: ['present', 'absent']
+        type: str
+  max_workers:
+    description:
+      - Maximum number of concurrent requests when I(items) is given.
+      - Must be at least 1.
+    default: 8
+    type: int
   non_updateable_attributes:
     description:
       - List of attribute names which cannot be updated.
@@ -105,8 +136,32 @@ RETURN = r'''
 resource:
   description: Dictionary describing the identified (and possibly modified)
                OpenStack cloud resource.
-  returned: On success when I(state) is C(present).
+  returned: On success when I(state) is C(present) and I(items) is not given.
   type: dict
+results:
+  description: List of per-item results in the same order as I(items).
+  returned: When I(items) is given.
+  type: list
+  elements: dict
+  contains:
+    attributes:
+      description: Attributes of this item as given in I(items).
+      type: dict
+    changed:
+      description: Whether this resource has been changed.
+      type: bool
+    failed:
+      description: Whether applying changes to this resource failed.
+      type: bool
+    msg:
+      description: Error message if applying changes failed.
+      type: str
+    resource:
+      description: Dictionary describing the identified (and possibly
+                   modified) OpenStack cloud resource.
+      returned: When the state of this item is C(present) and no error
+                occurred.
+      type: dict
 '''
 
 EXAMPLES = r'''
@@ -278,6 +333,22 @@ EXAMPLES = r'''
       floating_ip_address: 10.6.6.150
       port_id: !!null
 
+- name: Create many ports at once
+  openstack.cloud.resource:
+    cloud: devstack-admin
+    service: network
+    type: port
+    items:
+      - attributes:
+          name: ansible_port_1
+          network_id: "{{ network_internal.resource.id }}"
+      - attributes:
+          name: ansible_port_2
+          network_id: "{{ network_internal.resource.id }}"
+      - attributes:
+          name: ansible_port_3
+        state: absent
+
 - name: Delete server
   openstack.cloud.resource:
     cloud: devstack-admin
@@ -380,7 +451,13 @@ from ansible_collections.openstack.cloud.plugins.module_utils.resource import St
 
 class ResourceModule(OpenStackModule):
     argument_spec = dict(
-        attributes=dict(required=True, type='dict'),
+        attributes=dict(type='dict'),
+        items=dict(type='list', elements='dict',
+                   options=dict(
+                       attributes=dict(required=True, type='dict'),
+                       state=dict(choices=['absent', 'present']),
+                   )),
+        max_workers=dict(default=8, type='int'),
         non_updateable_attributes=dict(type='list', elements='str'),
         service=dict(required=True),
         state=dict(default='present', choices=['absent', 'present']),
@@ -390,6 +467,12 @@ class ResourceModule(OpenStackModule):
     )
 
     module_kwargs = dict(
+        mutually_exclusive=[
+            ('attributes', 'items'),
+        ],
+        required_one_of=[
+            ('attributes', 'items'),
+        ],
         supports_check_mode=True
     )
 
@@ -400,7 +483,11 @@ class ResourceModule(OpenStackModule):
         sm = StateMachine(connection=self.conn,
                           service_name=service_name,
                           type_name=type_name,
-                          sdk=self.sdk)
+                          sdk=self.sdk,
+                          fail_json=self.fail_json)
+
+        if self.params['items'] is not None:
+            self._run_batch(sm)
 
         kwargs = dict((k, self.params[k])
                       for k in ['attributes', 'non_updateable_attributes',
@@ -415,6 +502,42 @@ class ResourceModule(OpenStackModule):
             self.exit_json(changed=is_changed,
                            resource=resource.to_dict(computed=False))
 
+    def _run_batch(self, sm):
+        items = [dict(attributes=item['attributes'],
+                      state=item['state'] or self.params['state'])
+                 for item in self.params['items']]
+
+        kwargs = dict((k, self.params[k])
+                      for k in ['non_updateable_attributes', 'timeout',
+                                'wait', 'updateable_attributes'])
+
+        outcomes = sm.batch(items=items,
+                            check_mode=self.ansible.check_mode,
+                            max_workers=self.params['max_workers'],
+                            **kwargs)
+
+        results = []
+        for item, (resource, is_changed, error) in zip(items, outcomes):
+            result = dict(attributes=item['attributes'],
+                          changed=is_changed,
+                          failed=error is not None)
+            if error is not None:
+                result['msg'] = str(error)
+            elif resource is not None:
+                result['resource'] = resource.to_dict(computed=False)
+            results.append(result)
+
+        is_changed = any(result['changed'] for result in results)
+        failures = [result for result in results if result['failed']]
+        if failures:
+            self.fail_json(msg='Failed to apply changes to {0} of {1}'
+                               ' resources.'.format(len(failures),
+                                                    len(results)),
+                           changed=is_changed,
+                           results=results)
+
+        self.exit_json(changed=is_changed, results=results)
+
 
 def main():
     module = ResourceModule()
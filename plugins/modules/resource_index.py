@@ -0,0 +1,241 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r'''
+---
+module: resource_index
+short_description: Snapshot OpenStack cloud resources into a local index
+author: OpenStack Ansible SIG
+description:
+  - Store images, networks, ports, projects, security groups, servers,
+    subnets and volumes in a SQLite database file.
+  - Resource types are listed concurrently.
+  - Use lookup plugin C(openstack.cloud.resource_index) to query the index
+    without sending requests to the cloud.
+  - "Run this module on the Ansible controller, e.g. with
+     C(delegate_to: localhost), to query the index with the lookup plugin."
+options:
+  max_workers:
+    description:
+      - Maximum number of concurrent requests.
+    default: 8
+    type: int
+  path:
+    description:
+      - Path to the SQLite database file.
+      - The file is created if it does not exist.
+      - Use a separate file for each cloud and project.
+    required: true
+    type: path
+  refresh:
+    description:
+      - When I(refresh) is C(incremental) and the index already contains a
+        resource type, only servers and volumes which have been changed
+        since the last refresh are fetched. Deleted servers are reported by
+        the Compute API, deleted volumes are found with a listing of volume
+        IDs.
+      - Resources which have been changed up to 10 minutes before the last
+        refresh are fetched again to allow for clock differences between
+        the host running this module and the cloud.
+      - Incremental refresh of volumes requires Block Storage API
+        microversion 3.60 or later. Volumes are listed completely on
+        clouds which do not support it.
+      - Other resource types are always listed completely.
+      - When I(refresh) is C(full), all resources are listed and stored
+        again.
+    choices: ['full', 'incremental']
+    default: incremental
+    type: str
+  types:
+    description:
+      - Resource types which are stored in the index.
+      - Resources of other types which are already stored in the index are
+        kept.
+    choices: ['image', 'network', 'port', 'project', 'security_group',
+              'server', 'subnet', 'volume']
+    default: ['image', 'network', 'port', 'project', 'security_group',
+              'server', 'subnet', 'volume']
+    type: list
+    elements: str
+extends_documentation_fragment:
+  - openstack.cloud.openstack
+'''
+
+RETURN = r'''
+counts:
+  description: Number of indexed resources per resource type.
+  returned: always
+  type: dict
+  sample:
+    network: 3
+    server: 42
+'''
+
+EXAMPLES = r'''
+- name: Snapshot servers and ports
+  openstack.cloud.resource_index:
+    cloud: devstack
+    path: /tmp/devstack.sqlite
+    types:
+      - port
+      - server
+  delegate_to: localhost
+
+- name: Show addresses of server web1
+  ansible.builtin.debug:
+    msg: "{{ (query('openstack.cloud.resource_index', 'web1',
+                    type='server', path='/tmp/devstack.sqlite')
+              | first).addresses }}"
+'''
+
+import concurrent.futures
+import datetime
+import json
+
+from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
+from ansible_collections.openstack.cloud.plugins.module_utils.resource_index import connect
+
+# Listings since the last refresh start earlier by this margin, so changes
+# are not missed if clocks of the managed host and the cloud differ
+SINCE_MARGIN = datetime.timedelta(minutes=10)
+
+# since returns query parameters which limit listings to resources which have
+# changed since a point in time, since_microversion is the API microversion
+# which is required for these query parameters
+TYPES = dict(
+    image=dict(service='image', list='images'),
+    network=dict(service='network', list='networks'),
+    port=dict(service='network', list='ports'),
+    project=dict(service='identity', list='projects'),
+    security_group=dict(service='network', list='security_groups'),
+    server=dict(service='compute', list='servers',
+                since=lambda timestamp: dict(changes_since=timestamp)),
+    subnet=dict(service='network', list='subnets'),
+    volume=dict(service='block_storage', list='volumes',
+                since=lambda timestamp: dict(updated_at='gte:' + timestamp),
+                since_microversion='3.60'),
+)
+
+
+class ResourceIndexModule(OpenStackModule):
+    argument_spec = dict(
+        max_workers=dict(default=8, type='int'),
+        path=dict(required=True, type='path'),
+        refresh=dict(default='incremental', choices=['full', 'incremental']),
+        types=dict(default=sorted(TYPES.keys()), type='list',
+                   elements='str', choices=sorted(TYPES.keys())),
+    )
+
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    def run(self):
+        # In check mode changes are applied to a copy of the index in memory
+        db = connect(self.params['path'], copy=self.ansible.check_mode)
+        try:
+            refreshed_at = dict(db.execute(
+                'SELECT type, refreshed_at FROM refreshes').fetchall())
+            if self.params['refresh'] == 'full':
+                refreshed_at = dict()
+
+            with concurrent.futures.ThreadPoolExecutor(
+                    self.params['max_workers']) as executor:
+                futures = dict(
+                    (type_name, executor.submit(
+                        self._fetch, type_name, refreshed_at.get(type_name)))
+                    for type_name in self.params['types'])
+                listings = dict((type_name, future.result())
+                                for type_name, future in futures.items())
+
+            # SQLite connections must not be shared between threads, so the
+            # index is written once all listings have completed
+            is_changed = False
+            for type_name, listing in listings.items():
+                is_changed = self._store(db, type_name, *listing) \
+                    or is_changed
+
+            counts = dict(db.execute(
+                'SELECT type, COUNT(*) FROM resources GROUP BY type'
+            ).fetchall())
+
+            db.commit()
+        finally:
+            db.close()
+
+        self.exit_json(changed=is_changed, counts=counts)
+
+    def _fetch(self, type_name, since):
+        '''Return timestamp, resources, deleted ids and existing ids.
+
+        Both collections of ids are None if the listing is complete, i.e.
+        stored resources which have not been listed have been deleted.
+        '''
+        timestamp = (datetime.datetime.now(datetime.timezone.utc)
+                     - SINCE_MARGIN).strftime('%Y-%m-%dT%H:%M:%SZ')
+        spec = TYPES[type_name]
+        proxy = getattr(self.conn, spec['service'])
+        list_function = getattr(proxy, spec['list'])
+
+        if not since or 'since' not in spec \
+           or ('since_microversion' in spec
+               and not self.sdk.utils.supports_microversion(
+                   proxy, spec['since_microversion'])):
+            return timestamp, list(list_function()), None, None
+
+        resources = list(list_function(**spec['since'](since)))
+        if type_name == 'server':
+            # Compute API reports deleted servers when changes-since is used
+            deleted_ids = [r['id'] for r in resources
+                           if r['status'] == 'DELETED']
+            resources = [r for r in resources if r['status'] != 'DELETED']
+            return timestamp, resources, deleted_ids, None
+        else:
+            existing_ids = set(r['id']
+                               for r in list_function(details=False))
+            return timestamp, resources, None, existing_ids
+
+    def _store(self, db, type_name, timestamp, resources, deleted_ids,
+               existing_ids):
+        stored = dict(db.execute(
+            'SELECT id, data FROM resources WHERE type = ?',
+            [type_name]).fetchall())
+
+        items = dict()
+        for resource in resources:
+            items[resource['id']] = (
+                resource['name'],
+                json.dumps(resource.to_dict(computed=False), sort_keys=True))
+
+        if deleted_ids is None:
+            if existing_ids is None:
+                # Complete listing
+                existing_ids = set(items)
+            deleted_ids = [id for id in stored
+                           if id not in existing_ids and id not in items]
+
+        deleted_ids = [id for id in deleted_ids if id in stored]
+        changed_items = [(type_name, id, name, data)
+                         for id, (name, data) in items.items()
+                         if stored.get(id) != data]
+
+        db.executemany('DELETE FROM resources WHERE type = ? AND id = ?',
+                       [(type_name, id) for id in deleted_ids])
+        db.executemany('INSERT OR REPLACE INTO resources (type, id, name,'
+                       ' data) VALUES (?, ?, ?, ?)', changed_items)
+        db.execute('INSERT OR REPLACE INTO refreshes (type, refreshed_at)'
+                   ' VALUES (?, ?)', [type_name, timestamp])
+
+        return bool(deleted_ids or changed_items)
+
+
+def main():
+    module = ResourceIndexModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,75 @@ author: OpenStack Ansible SIG
 description:
   - List OpenStack cloud resources.
 options:
+  limit:
+    description:
+      - Maximum number of resources to return.
+      - Listing stops as soon as I(limit) resources have been fetched.
+    type: int
+  marker:
+    description:
+      - ID of the last resource of a previous listing.
+      - Only resources listed after this resource will be returned.
+      - Not all OpenStack APIs support markers for all resource types.
+    type: str
+  max_workers:
+    description:
+      - Maximum number of concurrent listings when I(queries) is used.
+    default: 8
+    type: int
+  queries:
+    description:
+      - List of listings which are run concurrently.
+      - Results are returned in I(results) keyed by query name.
+      - Mutually exclusive with I(service), I(type), I(parameters),
+        I(limit), I(marker), I(page_size) and I(output_file).
+    type: list
+    elements: dict
+    suboptions:
+      fields:
+        description:
+          - List of attributes which will be returned for each resource.
+          - Nested attributes are selected with dotted paths such as
+            C(addresses.private).
+          - By default all attributes are returned.
+        type: list
+        elements: str
+      limit:
+        description:
+          - Maximum number of resources to return.
+          - Listing stops as soon as I(limit) resources have been fetched.
+        type: int
+      marker:
+        description:
+          - ID of the last resource of a previous listing, see I(marker)
+            above.
+        type: str
+      name:
+        description:
+          - Name of the query which is used as key in I(results).
+        required: true
+        type: str
+      page_size:
+        description:
+          - Number of resources to fetch per request, see I(page_size)
+            above.
+        type: int
+      parameters:
+        description:
+          - Query parameters passed to OpenStack API for results filtering,
+            see I(parameters) above.
+        type: dict
+      service:
+        description:
+          - OpenStack service which this resource is part of, see I(service)
+            above.
+        required: true
+        type: str
+      type:
+        description:
+          - Typename of the resource, see I(type) above.
+        required: true
+        type: str
   service:
     description:
       - OpenStack service which this resource is part of.
@@ -22,8 +91,25 @@ options:
          U(https://opendev.org/openstack/openstacksdk): Most subdirectories
          in the C(openstack) directory correspond to a OpenStack service,
          except C(cloud), C(common) and other auxiliary directories."
-    required: true
+      - Required if I(queries) is not set.
     type: str
+  output_file:
+    description:
+      - Path to a file on the managed host to which resources will be
+        written in JSON Lines format, one resource per line, instead of
+        returning them in I(resources).
+      - Resources are written while they are being listed, so collections
+        of any size can be exported without holding all of them in memory.
+      - The file will be overwritten if it exists.
+      - In check mode, resources are counted but the file is neither
+        created nor overwritten.
+    type: path
+  page_size:
+    description:
+      - Number of resources to fetch per request.
+      - Passed to the OpenStack API as query parameter C(limit) which
+        openstacksdk uses as page size when fetching further pages.
+    type: int
   parameters:
     description:
       - Query parameters passed to OpenStack API for results filtering.
@@ -45,7 +131,7 @@ options:
          to C(openstack) directory, change to any service directory such as
          C(compute), choose a api version directory such as C(v2) and find all
          available resource classes such as C(Server) inside C(*.py) files."
-    required: true
+      - Required if I(queries) is not set.
     type: str
 notes:
   - "This module does not support all OpenStack cloud resources. Resource
@@ -57,11 +143,20 @@ extends_documentation_fragment:
 '''
 
 RETURN = r'''
+count:
+  description: Number of resources written to I(output_file).
+  returned: if I(output_file) is set
+  type: int
 resources:
   description: Dictionary describing the identified OpenStack cloud resources.
-  returned: always
+  returned: if I(service) and I(type) are set and I(output_file) is not set
   type: list
   elements: dict
+results:
+  description: Dictionary mapping each query name to a list of dictionaries
+               describing the resources found by this query.
+  returned: if I(queries) is set
+  type: dict
 '''
 
 EXAMPLES = r'''
@@ -100,36 +195,165 @@ EXAMPLES = r'''
     type: network
     parameters:
       name: public
+
+- name: Export all ports of all projects
+  openstack.cloud.resources:
+    cloud: devstack-admin
+    service: network
+    type: port
+    page_size: 1000
+    output_file: /tmp/ports.jsonl
+
+- name: List first page of servers
+  openstack.cloud.resources:
+    cloud: devstack-admin
+    service: compute
+    type: server
+    limit: 50
+    page_size: 50
+  register: servers
+
+- name: List next page of servers
+  openstack.cloud.resources:
+    cloud: devstack-admin
+    service: compute
+    type: server
+    limit: 50
+    page_size: 50
+    marker: "{{ servers.resources[-1].id }}"
+
+- name: List several resource types at once
+  openstack.cloud.resources:
+    cloud: devstack-admin
+    queries:
+      - name: ports
+        service: network
+        type: port
+        fields: [id, device_id, fixed_ips.ip_address]
+      - name: servers
+        service: compute
+        type: server
+        parameters:
+          all_projects: true
+      - name: volumes
+        service: block_storage
+        type: volume
+        limit: 100
+  register: audit
+
+- name: Show number of ports
+  debug:
+    msg: "{{ audit.results.ports|length }}"
 '''
 
+import concurrent.futures
+import itertools
+import json
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
 
 class ResourcesModule(OpenStackModule):
     argument_spec = dict(
+        limit=dict(type='int'),
+        marker=dict(),
+        max_workers=dict(default=8, type='int'),
+        output_file=dict(type='path'),
+        page_size=dict(type='int'),
         parameters=dict(type='dict'),
-        service=dict(required=True),
-        type=dict(required=True),
+        queries=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                fields=dict(type='list', elements='str'),
+                limit=dict(type='int'),
+                marker=dict(),
+                name=dict(required=True),
+                page_size=dict(type='int'),
+                parameters=dict(type='dict'),
+                service=dict(required=True),
+                type=dict(required=True),
+            )),
+        service=dict(),
+        type=dict(),
     )
 
     module_kwargs = dict(
+        mutually_exclusive=[
+            ('queries', 'service'),
+            ('queries', 'type'),
+            ('queries', 'parameters'),
+            ('queries', 'limit'),
+            ('queries', 'marker'),
+            ('queries', 'page_size'),
+            ('queries', 'output_file'),
+        ],
+        required_one_of=[
+            ('queries', 'service'),
+        ],
+        required_together=[
+            ('service', 'type'),
+        ],
         supports_check_mode=True
     )
 
     def run(self):
-        service_name = self.params['service']
-        type_name = self.params['type']
+        queries = self.params['queries']
+        if queries is None and self.params['output_file']:
+            self.exit_json(changed=False, count=self._export(self.params))
+        elif queries is None:
+            self.exit_json(changed=False,
+                           resources=self._list(self.params))
+
+        names = [query['name'] for query in queries]
+        if len(set(names)) != len(names):
+            self.fail_json(msg='Query names must be unique.')
 
-        session = getattr(self.conn, service_name)
-        list_function = getattr(session, '{0}s'.format(type_name))
+        # All listings share the connection and its authentication
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            results = dict(zip(names, executor.map(self._list, queries)))
+
+        self.exit_json(changed=False, results=results)
+
+    def _export(self, query):
+        if self.ansible.check_mode:
+            # Resources are counted but the file is left untouched
+            return sum(1 for resource in self._iterate(query))
+
+        count = 0
+        with open(query['output_file'], 'w') as f:
+            for resource in self._iterate(query):
+                f.write(json.dumps(resource.to_dict(computed=False)))
+                f.write('\n')
+                count += 1
+        return count
+
+    def _iterate(self, query):
+        session = getattr(self.conn, query['service'])
+        list_function = getattr(session, '{0}s'.format(query['type']))
+
+        parameters = dict(query['parameters'] or {})
+        if query['page_size'] is not None:
+            parameters['limit'] = query['page_size']
+        if query['marker'] is not None:
+            parameters['marker'] = query['marker']
 
-        parameters = self.params['parameters']
         resources = \
             list_function(**parameters) if parameters else list_function()
 
-        self.exit_json(
-            changed=False,
-            resources=[r.to_dict(computed=False) for r in resources])
+        # Generators fetch further pages only when needed
+        return itertools.islice(resources, query['limit'])
+
+    def _list(self, query):
+        resources = [r.to_dict(computed=False) for r in self._iterate(query)]
+
+        fields = query.get('fields')
+        if fields:
+            resources = self._project(resources,
+                                      [f.split('.') for f in fields])
+
+        return resources
 
 
 def main():
@@ -56,8 +56,20 @@ options:
              all tags in this list will be returned.
          type: list
          elements: str
+   limit:
+     description:
+        - Maximum number of routers to return.
+        - Routers are fetched page by page with I(limit) as page size until
+          I(limit) routers matching all criteria have been found.
+     type: int
+   marker:
+     description:
+        - ID of the last router of a previous page.
+        - Only routers listed after this router will be returned.
+     type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = '''
@@ -254,7 +266,10 @@ class RouterInfoModule(OpenStackModule):
 
     argument_spec = dict(
         name=dict(),
-        filters=dict(type='dict', default={})
+        filters=dict(type='dict', default={}),
+        limit=dict(type='int'),
+        marker=dict(),
+        fields=dict(type='list', elements='str'),
     )
     module_kwargs = dict(
         supports_check_mode=True
@@ -263,9 +278,13 @@ class RouterInfoModule(OpenStackModule):
     def run(self):
         routers = [
             router.to_dict(computed=False)
-            for router in self.conn.search_routers(
+            for router in self.search_resources(
+                self.conn.network.routers,
+                self.sdk.network.v2.router.Router,
                 name_or_id=self.params['name'],
-                filters=self.params['filters'])]
+                filters=self.params['filters'],
+                limit=self.params['limit'],
+                marker=self.params['marker'])]
         self.exit(changed=False, routers=routers)
 
 
@@ -119,6 +119,7 @@ options:
     type: bool
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.plan
 '''
 
 RETURN = r'''
@@ -271,6 +272,7 @@ class SecurityGroupModule(OpenStackModule):
                 remote_ip_prefix=dict(),
             ),
         ),
+        plan_file=dict(type='path'),
         state=dict(default='present', choices=['absent', 'present']),
         stateful=dict(type="bool"),
     )
@@ -282,7 +284,10 @@ class SecurityGroupModule(OpenStackModule):
     def run(self):
         state = self.params['state']
 
-        security_group = self._find()
+        security_group, update = \
+            self.read_plan(self.conn.network.get_security_group)
+        if not security_group:
+            security_group = self._find()
 
         if self.ansible.check_mode:
             self.exit_json(changed=self._will_change(state, security_group))
@@ -296,7 +301,8 @@ class SecurityGroupModule(OpenStackModule):
 
         elif state == 'present' and security_group:
             # Update security_group
-            update = self._build_update(security_group)
+            if update is None:
+                update = self._build_update(security_group)
             if update:
                 security_group = self._update(security_group, update)
 
@@ -561,7 +567,7 @@ class SecurityGroupModule(OpenStackModule):
         if state == 'present' and not security_group:
             return True
         elif state == 'present' and security_group:
-            return bool(self._build_update(security_group))
+            return bool(self.plan_update(security_group, self._build_update))
         elif state == 'absent' and security_group:
             return True
         else:
@@ -22,6 +22,12 @@ options:
     description:
       - Description of the security group.
     type: str
+  limit:
+    description:
+      - Maximum number of security groups to return.
+      - Security groups are fetched page by page with I(limit) as page size
+        until I(limit) security groups have been found.
+    type: int
   name:
     description:
       - Name or id of the security group.
@@ -54,6 +60,7 @@ options:
     elements: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 RETURN = r'''
@@ -142,6 +149,13 @@ EXAMPLES = r'''
   openstack.cloud.security_group_info:
     cloud: devstack
     name: my_sg
+
+- name: Get up to 10 security groups tagged with app
+  openstack.cloud.security_group_info:
+    cloud: devstack
+    tags:
+      - app
+    limit: 10
 '''
 
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
@@ -151,6 +165,8 @@ class SecurityGroupInfoModule(OpenStackModule):
     argument_spec = dict(
         any_tags=dict(type='list', elements='str'),
         description=dict(),
+        fields=dict(type='list', elements='str'),
+        limit=dict(type='int'),
         name=dict(),
         not_any_tags=dict(type='list', elements='str'),
         not_tags=dict(type='list', elements='str'),
@@ -174,14 +190,12 @@ class SecurityGroupInfoModule(OpenStackModule):
 
         # self.conn.search_security_groups() cannot be used here,
         # refer to git blame for rationale.
-        security_groups = self.conn.network.security_groups(**args)
-
-        if name:
-            # TODO: Upgrade name_or_id code to match openstacksdk [1]?
-            # [1] https://opendev.org/openstack/openstacksdk/src/commit/
-            #     0898398415ae7b0e2447d61226acf50f01567cdd/openstack/cloud/_utils.py#L89
-            security_groups = [item for item in security_groups
-                               if name in (item['id'], item['name'])]
+        security_groups = self.search_resources(
+            self.conn.network.security_groups,
+            self.sdk.network.v2.security_group.SecurityGroup,
+            name_or_id=name,
+            filters=args,
+            limit=self.params['limit'])
 
         self.exit(changed=False,
                   security_groups=[sg.to_dict(computed=False)
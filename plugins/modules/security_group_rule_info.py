@@ -71,6 +71,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -186,6 +187,7 @@ class SecurityGroupRuleInfoModule(OpenStackModule):
         description=dict(),
         direction=dict(choices=['egress', 'ingress']),
         ether_type=dict(choices=['IPv4', 'IPv6'], aliases=['ethertype']),
+        fields=dict(type='list', elements='str'),
         id=dict(aliases=['rule']),
         port_range_min=dict(type='int'),
         port_range_max=dict(type='int'),
@@ -227,6 +229,11 @@ class SecurityGroupRuleInfoModule(OpenStackModule):
                 self.exit_json(changed=False, security_group_rules=[])
             filters['security_group_id'] = security_group.id
 
+        fields = self.query_fields(
+            self.sdk.network.v2.security_group_rule.SecurityGroupRule)
+        if fields:
+            filters['fields'] = fields
+
         security_group_rules = \
             self.conn.network.security_group_rules(**filters)
 
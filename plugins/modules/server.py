@@ -48,6 +48,22 @@ options:
         - This server attribute cannot be updated.
       aliases: ['root_volume']
       type: str
+    count:
+      description:
+        - Number of servers in a fleet of servers.
+        - If I(count) is set, I(name) must be a printf-style pattern with a
+          single integer conversion such as C(web-%02d). Servers are named by
+          formatting this pattern with the numbers 1 to I(count).
+        - Image, flavor and networks are resolved once for all servers.
+          Missing servers are created concurrently and, if I(wait) is
+          C(true), all servers are awaited with a single listing of servers
+          per polling interval.
+        - Existing servers of the fleet are not updated and servers beyond
+          I(count) are not deleted.
+        - Results are returned in I(servers) instead of I(server).
+        - Mutually exclusive with I(boot_volume), I(floating_ips),
+          I(plan_file) and I(volumes).
+      type: int
     config_drive:
       description:
         - Whether to boot the server with config drive enabled.
@@ -132,6 +148,13 @@ options:
         - The key pair name to be used when creating a instance.
         - This server attribute cannot be updated.
       type: str
+    max_workers:
+      description:
+        - Maximum number of concurrent requests when I(count) is set or
+          when floating ip addresses are attached to and detached from a
+          server.
+      default: 8
+      type: int
     metadata:
       description:
         - 'A list of key value pairs that should be provided as a metadata to
@@ -144,6 +167,7 @@ options:
         - Name that has to be given to the instance. It is also possible to
           specify the ID of the instance instead of its name if I(state) is
           I(absent).
+        - A printf-style pattern such as C(web-%02d) if I(count) is set.
         - This server attribute cannot be updated.
       required: true
       type: str
@@ -159,6 +183,8 @@ options:
         - A list of networks to which the instance's interface should
           be attached. Networks may be referenced by net-id/net-name/port-id
           or port-name.
+        - All networks and ports which are referenced by name are looked up
+          with a single listing per resource type.
         - 'Also this accepts a string containing a list of (net/port)-(id/name)
           Example: C(nics: "net-id=uuid-1,port-name=myport")'
         - Only one of I(network) or I(nics) should be supplied.
@@ -171,6 +197,35 @@ options:
           description:
             - 'A I(tag) for the specific port to be passed via metadata.
               Eg: C(tag: test_tag)'
+    nics_cache:
+      description:
+        - Path to a file in which IDs of networks and ports which are
+          referenced by name in I(nics) are cached.
+        - The cache is shared between tasks, e.g. when several servers are
+          created in a play, and networks and ports are only looked up if
+          they are not in the cache.
+        - Use a separate file for each cloud and project.
+        - Networks and ports which have been recreated with the same name
+          are not found until cache entries have expired.
+      type: path
+    nics_cache_ttl:
+      description:
+        - Number of seconds after which entries in I(nics_cache) expire.
+      default: 300
+      type: int
+    return_server:
+      description:
+        - Whether to return all server attributes in I(server) or only
+          C(id), C(name) and C(status).
+        - If I(return_server) is C(full), the server is fetched again after
+          floating ip addresses or security groups have been changed.
+          Changes to metadata, tags and server attributes do not require
+          another request.
+        - If I(return_server) is C(minimal), the server is never fetched
+          again after it has been created or updated.
+      choices: ['full', 'minimal']
+      default: full
+      type: str
     reuse_ips:
       description:
         - When I(auto_ip) is true and this option is true, the I(auto_ip) code
@@ -249,11 +304,37 @@ options:
         - If the module should wait for the instance to be created.
       type: bool
       default: 'true'
+    wait_strategy:
+      description:
+        - How to wait for servers when I(count) is set and I(wait) is true.
+        - If I(wait_strategy) is C(fixed), servers are polled at a fixed
+          interval until they are active or absent or until I(timeout) has
+          been reached.
+        - If I(wait_strategy) is C(adaptive), the poll interval starts short
+          and grows with the elapsed time, with bounds depending on whether
+          servers are created or deleted. Waiting for a server stops early
+          when Nova's instance actions report that its creation or deletion
+          has failed.
+      choices: ['adaptive', 'fixed']
+      default: fixed
+      type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.plan
 '''
 
 EXAMPLES = '''
+- name: Create a fleet of 20 servers named web-01 to web-20
+  openstack.cloud.server:
+    cloud: devstack
+    name: web-%02d
+    count: 20
+    image: cirros
+    flavor: m1.tiny
+    network: private
+    auto_ip: false
+  register: fleet
+
 - name: Create a new instance with metadata and attaches it to a network
   openstack.cloud.server:
        state: present
@@ -802,9 +883,38 @@ server:
             description: Same as attached_volumes.
             returned: success
             type: list
+servers:
+    description: Per-server results of a fleet of servers.
+    type: list
+    elements: dict
+    returned: When I(count) is set.
+    contains:
+        changed:
+            description: Whether this server has been created or deleted.
+            type: bool
+        failed:
+            description: Whether creating or deleting this server failed.
+            type: bool
+        msg:
+            description: Error message if creating or deleting this server
+                         failed.
+            type: str
+        name:
+            description: Name of the server.
+            type: str
+        server:
+            description: Dictionary describing the server, see I(server).
+            returned: When I(state) is C(present) and the server has been
+                      created or found.
+            type: dict
 '''
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
+from ansible_collections.openstack.cloud.plugins.module_utils.resource_cache import ResourceCache
+from ansible_collections.openstack.cloud.plugins.module_utils.server_wait import wait_for_servers
+import concurrent.futures
 import copy
+import ipaddress
+import re
 
 
 class ServerModule(OpenStackModule):
@@ -816,6 +926,7 @@ class ServerModule(OpenStackModule):
         boot_from_volume=dict(default=False, type='bool'),
         boot_volume=dict(aliases=['root_volume']),
         config_drive=dict(default=False, type='bool'),
+        count=dict(type='int'),
         delete_ips=dict(default=False, type='bool', aliases=['delete_fip']),
         description=dict(),
         flavor=dict(),
@@ -826,10 +937,15 @@ class ServerModule(OpenStackModule):
         image=dict(),
         image_exclude=dict(default='(deprecated)'),
         key_name=dict(),
+        max_workers=dict(default=8, type='int'),
         metadata=dict(type='raw', aliases=['meta']),
         name=dict(required=True),
         network=dict(),
         nics=dict(default=[], type='list', elements='raw'),
+        nics_cache=dict(type='path'),
+        nics_cache_ttl=dict(default=300, type='int'),
+        plan_file=dict(type='path'),
+        return_server=dict(default='full', choices=['full', 'minimal']),
         reuse_ips=dict(default=True, type='bool'),
         scheduler_hints=dict(type='dict'),
         security_groups=dict(type='list', elements='str'),
@@ -839,6 +955,7 @@ class ServerModule(OpenStackModule):
         userdata=dict(),
         volume_size=dict(type='int'),
         volumes=dict(default=[], type='list', elements='str'),
+        wait_strategy=dict(default='fixed', choices=['adaptive', 'fixed']),
     )
 
     module_kwargs = dict(
@@ -848,6 +965,10 @@ class ServerModule(OpenStackModule):
             ['image', 'boot_volume'],
             ['boot_from_volume', 'boot_volume'],
             ['nics', 'network'],
+            ['count', 'boot_volume'],
+            ['count', 'floating_ips'],
+            ['count', 'plan_file'],
+            ['count', 'volumes'],
         ],
         required_if=[
             ('boot_from_volume', True, ['volume_size', 'image']),
@@ -858,12 +979,21 @@ class ServerModule(OpenStackModule):
     )
 
     def run(self):
+        if self.params['count'] is not None:
+            self._run_fleet()
+
         state = self.params['state']
 
-        server = self.conn.compute.find_server(self.params['name'])
-        if server:
-            # fetch server details such as server['addresses']
-            server = self.conn.compute.get_server(server)
+        server, update = self.read_plan(self.conn.compute.get_server)
+        if not server:
+            # find_server() returns server details such as server['addresses']
+            server = self.conn.compute.find_server(self.params['name'],
+                                                   details=True)
+            if server and self.params['plan_file']:
+                # Plans are verified with get_server() whose response has
+                # attributes which listings lack, e.g. server_groups, so the
+                # plan has to be computed from the same response
+                server = self.conn.compute.get_server(server['id'])
 
         if self.ansible.check_mode:
             self.exit_json(changed=self._will_change(state, server))
@@ -872,16 +1002,17 @@ class ServerModule(OpenStackModule):
             # Create server
             server = self._create()
             self.exit_json(changed=True,
-                           server=server.to_dict(computed=False))
+                           server=self._server_result(server))
 
         elif state == 'present' and server:
             # Update server
-            update = self._build_update(server)
+            if update is None:
+                update = self._build_update(server)
             if update:
                 server = self._update(server, update)
 
             self.exit_json(changed=bool(update),
-                           server=server.to_dict(computed=False))
+                           server=self._server_result(server))
 
         elif state == 'absent' and server:
             # Delete server
@@ -892,6 +1023,201 @@ class ServerModule(OpenStackModule):
             # Do nothing
             self.exit_json(changed=False)
 
+    def _run_fleet(self):
+        names = self._fleet_names()
+        query = self._fleet_query()
+
+        # A single listing finds all existing servers of the fleet
+        existing = dict()
+        for server in self.conn.compute.servers(**query):
+            if server['name'] in names:
+                existing.setdefault(server['name'], server)
+
+        state = self.params['state']
+        pending = [name for name in names
+                   if (name in existing) == (state == 'absent')]
+
+        if self.ansible.check_mode:
+            self.exit_json(changed=bool(pending))
+
+        results = dict(
+            (name, dict(name=name, changed=False, failed=False,
+                        server=self._server_result(existing[name])))
+            for name in existing)
+
+        if pending and state == 'present':
+            results.update(self._create_fleet(pending, query))
+        elif pending and state == 'absent':
+            results.update(self._delete_fleet(
+                dict((name, existing[name]) for name in pending), query))
+
+        results = [results[name] for name in names if name in results]
+        is_changed = any(result['changed'] for result in results)
+        failures = [result for result in results if result['failed']]
+        if failures:
+            self.fail_json(msg='Failed to {0} {1} of {2} servers.'.format(
+                               'create' if state == 'present' else 'delete',
+                               len(failures), len(pending)),
+                           changed=is_changed,
+                           servers=results)
+
+        self.exit_json(changed=is_changed, servers=results)
+
+    def _create_fleet(self, names, query):
+        # Image, flavor and networks are resolved once for all servers
+        args = self._build_create_args(resolve=True)
+        args['wait'] = False
+
+        results = dict()
+        servers = dict()
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            futures = dict(
+                (name, executor.submit(self.conn.create_server,
+                                       **dict(args, name=name)))
+                for name in names)
+            for name, future in futures.items():
+                try:
+                    servers[name] = future.result()
+                    results[name] = dict(
+                        name=name, changed=True, failed=False,
+                        server=self._server_result(servers[name]))
+                except self.sdk.exceptions.SDKException as e:
+                    results[name] = dict(name=name, changed=False,
+                                         failed=True, msg=str(e))
+
+            if not (self.params['wait'] and servers):
+                return results
+
+            active, errors, pending = self._poll_fleet(
+                'create', [server.id for server in servers.values()], query,
+                lambda server: server is not None
+                and server['status'] in ('ACTIVE', 'ERROR'))
+
+            futures = dict()
+            for name, server in servers.items():
+                if server.id in errors:
+                    results[name].update(failed=True, msg=errors[server.id])
+                    continue
+                if server.id in pending:
+                    results[name].update(
+                        failed=True,
+                        msg='Timeout waiting for server to become active')
+                    continue
+
+                server = active[server.id]
+                results[name]['server'] = self._server_result(server)
+                if server['status'] == 'ERROR':
+                    fault = server['fault'] or {}
+                    results[name].update(
+                        failed=True,
+                        msg='Server is in status ERROR: {0}'.format(
+                            fault.get('message',
+                                      'no further information available')))
+                elif self.params['auto_ip'] \
+                        or self.params['floating_ip_pools']:
+                    futures[name] = executor.submit(
+                        self.conn.add_ips_to_server, server,
+                        auto_ip=self.params['auto_ip'],
+                        ip_pool=self.params['floating_ip_pools'],
+                        reuse=self.params['reuse_ips'],
+                        wait=True,
+                        timeout=self.params['timeout'])
+
+            for name, future in futures.items():
+                try:
+                    results[name]['server'] = \
+                        self._server_result(future.result())
+                except self.sdk.exceptions.SDKException as e:
+                    results[name].update(failed=True, msg=str(e))
+
+        return results
+
+    def _delete_fleet(self, servers, query):
+        results = dict()
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            futures = dict(
+                (name, executor.submit(self.conn.delete_server, server.id,
+                                       wait=False,
+                                       delete_ips=self.params['delete_ips']))
+                for name, server in servers.items())
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    results[name] = dict(name=name, changed=True,
+                                         failed=False)
+                except self.sdk.exceptions.SDKException as e:
+                    results[name] = dict(name=name, changed=False,
+                                         failed=True, msg=str(e))
+
+        if self.params['wait']:
+            deleted, errors, pending = self._poll_fleet(
+                'delete', [server.id for name, server in servers.items()
+                           if not results[name]['failed']], query,
+                lambda server: server is None
+                or server['status'] == 'DELETED')
+            for name, server in servers.items():
+                if server.id in errors:
+                    results[name].update(failed=True, msg=errors[server.id])
+                elif server.id in pending:
+                    results[name].update(
+                        failed=True,
+                        msg='Timeout waiting for server to be absent')
+
+        return results
+
+    def _fleet_names(self):
+        try:
+            names = [self.params['name'] % i
+                     for i in range(1, self.params['count'] + 1)]
+        except (TypeError, ValueError):
+            names = []
+        if len(set(names)) != self.params['count']:
+            self.fail_json(msg="Option 'name' must be a pattern with a single"
+                               " integer conversion such as 'web-%02d' if"
+                               " option 'count' is set")
+        return names
+
+    def _fleet_query(self):
+        # Nova matches names as regular expressions, so the listing is only
+        # filtered if the pattern starts with a prefix of plain characters
+        prefix = self.params['name'].split('%', 1)[0]
+        if re.match(r'^[\w-]+$', prefix):
+            return dict(name='^' + prefix)
+        return dict()
+
+    # Wait until is_done() is true for all servers with a single listing of
+    # servers per interval. Returns servers which are done, keyed by id,
+    # error messages of servers for which the action has failed, keyed by
+    # id, and ids of servers which are not done after the timeout.
+    def _poll_fleet(self, action, ids, query, is_done):
+        def list_servers(ids):
+            return dict((server.id, server) for server
+                        in self.conn.compute.servers(**query))
+
+        if self.params['wait_strategy'] == 'adaptive':
+            return wait_for_servers(self.conn, action, ids, list_servers,
+                                    is_done, self.params['timeout'])
+
+        done = dict()
+        pending = set(ids)
+        try:
+            for count in self.sdk.utils.iterate_timeout(
+                timeout=self.params['timeout'],
+                message="Timeout waiting for servers"
+            ):
+                servers = list_servers(pending)
+                for id in list(pending):
+                    if is_done(servers.get(id)):
+                        done[id] = servers.get(id)
+                        pending.discard(id)
+                if not pending:
+                    break
+        except self.sdk.exceptions.ResourceTimeout:
+            pass
+        return done, dict(), pending
+
     def _build_update(self, server):
         if server.status not in ('ACTIVE', 'SHUTOFF', 'PAUSED', 'SUSPENDED'):
             self.fail_json(msg="The instance is available but not "
@@ -904,9 +1230,12 @@ class ServerModule(OpenStackModule):
             **self._build_update_tags(server)}
 
     def _build_update_ips(self, server):
-        auto_ip = self.params['auto_ip']
         floating_ips = self.params['floating_ips']
         floating_ip_pools = self.params['floating_ip_pools']
+        # auto_ip cannot be set together with floating_ips or
+        # floating_ip_pools, so it is true by default only
+        auto_ip = self.params['auto_ip'] \
+            and not (floating_ips or floating_ip_pools)
 
         if not (auto_ip or floating_ips or floating_ip_pools):
             # No floating ip has been requested, so
@@ -914,10 +1243,7 @@ class ServerModule(OpenStackModule):
             return {}
 
         # Get floating ip addresses attached to the server
-        ips = [interface_spec['addr']
-               for v in server['addresses'].values()
-               for interface_spec in v
-               if interface_spec.get('OS-EXT-IPS:type', None) == 'floating']
+        ips = self._get_floating_ips(server)
 
         if (auto_ip and ips and not floating_ip_pools and not floating_ips):
             # Server has a floating ip address attached and
@@ -951,26 +1277,47 @@ class ServerModule(OpenStackModule):
             # Detach ips which are not supposed to be attached
             update['remove_ips'] = remove_ips
 
+        return update
+
+    def _get_floating_ips(self, server):
+        return [interface_spec['addr']
+                for v in (server['addresses'] or {}).values()
+                for interface_spec in v
+                if interface_spec.get('OS-EXT-IPS:type', None) == 'floating']
+
     def _build_update_security_groups(self, server):
         update = {}
 
         if self.params['security_groups'] is None:
             return update
 
-        required_security_groups = dict(
-            (sg['id'], sg) for sg in [
-                self.conn.network.find_security_group(
-                    security_group_name_or_id, ignore_missing=False)
-                for security_group_name_or_id in self.params['security_groups']
-            ])
-
-        # Retrieve IDs of security groups attached to the server
+        # Retrieve security groups attached to the server
         server = self.conn.compute.fetch_server_security_groups(server)
         assigned_security_groups = dict(
-            (sg['id'], self.conn.network.get_security_group(sg['id']))
-            for sg in server.security_groups)
-
-        # openstacksdk adds security groups to server using resources
+            (sg['id'], sg) for sg in server.security_groups or [])
+
+        # Requested security groups which are attached already are matched
+        # by id or name, all others are resolved with a single listing
+        assigned_names = dict(
+            (sg['name'], sg) for sg in assigned_security_groups.values())
+        required_security_groups = dict()
+        unresolved = []
+        for name_or_id in self.params['security_groups']:
+            sg = assigned_security_groups.get(name_or_id) \
+                or assigned_names.get(name_or_id)
+            if sg:
+                required_security_groups[sg['id']] = sg
+            else:
+                unresolved.append(name_or_id)
+
+        if unresolved:
+            required_security_groups.update(
+                (sg['id'], sg)
+                for sg in self._find_security_groups(unresolved))
+
+        # openstacksdk adds and removes security groups by name or id, so
+        # both security group resources and dictionaries returned by the
+        # Compute API can be passed
         add_security_groups = [
             sg for (sg_id, sg) in required_security_groups.items()
             if sg_id not in assigned_security_groups]
@@ -978,7 +1325,6 @@ class ServerModule(OpenStackModule):
         if add_security_groups:
             update['add_security_groups'] = add_security_groups
 
-        # openstacksdk removes security groups from servers using resources
         remove_security_groups = [
             sg for (sg_id, sg) in assigned_security_groups.items()
             if sg_id not in required_security_groups]
@@ -988,6 +1334,11 @@ class ServerModule(OpenStackModule):
 
         return update
 
+    def _find_security_groups(self, names_or_ids):
+        return self.find_resources(
+            self.conn.network.security_groups, names_or_ids,
+            'security group', filter_names=True, fields=['id', 'name'])
+
     def _build_update_server(self, server):
         update = {}
 
@@ -1005,7 +1356,7 @@ class ServerModule(OpenStackModule):
 
         remove_metadata = dict()
         for (k, v) in assigned_metadata.items():
-            if k not in required_metadata or required_metadata[k] != v:
+            if k not in required_metadata:
                 remove_metadata[k] = v
 
         if remove_metadata:
@@ -1052,6 +1403,19 @@ class ServerModule(OpenStackModule):
         return update
 
     def _create(self):
+        # openstacksdk's create_server() fetches the server after it has been
+        # created or, if wait is true, after it has become active. It might
+        # call meta.add_server_interfaces() which adds floating ip addresses
+        # to server['addresses'] which Nova has not reported yet. Fetching
+        # the server once again would not add any information, so the
+        # server is returned as is.
+        # Ref.: https://opendev.org/openstack/openstacksdk/src/commit/3f81d0001dd994cde990d38f6e2671ee0694d7d5/openstack/cloud/_compute.py#L942
+        return self.conn.create_server(**self._build_create_args())
+
+    def _build_create_args(self, resolve=False):
+        # With resolve, image, flavor and network are passed as resources
+        # and network ids, so create_server() does not look them up again,
+        # e.g. for every server of a fleet
         for k in ['auto_ip', 'floating_ips', 'floating_ip_pools']:
             if self.params[k] \
                and self.params['wait'] is False:
@@ -1063,11 +1427,11 @@ class ServerModule(OpenStackModule):
 
         flavor_name_or_id = self.params['flavor']
 
-        image_id = None
+        image = None
         if not self.params['boot_volume']:
-            image_id = self.conn.get_image_id(
+            image = self.conn.get_image_exclude(
                 self.params['image'], self.params['image_exclude'])
-            if not image_id:
+            if not image:
                 self.fail_json(
                     msg="Could not find image {0} with exclude {1}".format(
                         self.params['image'], self.params['image_exclude']))
@@ -1082,8 +1446,8 @@ class ServerModule(OpenStackModule):
                 self.fail_json(msg="Could not find any matching flavor")
 
         args = dict(
-            flavor=flavor.id,
-            image=image_id,
+            flavor=flavor if resolve else flavor.id,
+            image=image if resolve or not image else image.id,
             ip_pool=self.params['floating_ip_pools'],
             ips=self.params['floating_ips'],
             meta=self._parse_metadata(self.params['metadata']),
@@ -1098,14 +1462,19 @@ class ServerModule(OpenStackModule):
             if self.params[k] is not None:
                 args[k] = self.params[k]
 
-        server = self.conn.create_server(**args)
+        if resolve and not args['nics']:
+            # nics and network are mutually exclusive
+            network = args.pop('network', None)
+            if network:
+                args['nics'] = [
+                    {'net-id': self._resolve_nics('network',
+                                                  [network])[network]}]
+            else:
+                network = self.conn.get_default_network()
+                if network:
+                    args['nics'] = [{'net-id': network['id']}]
 
-        # openstacksdk's create_server() might call meta.add_server_interfaces(
-        # ) which alters server attributes such as server['addresses']. So we
-        # do an extra call to compute.get_server() to return a clean server
-        # resource.
-        # Ref.: https://opendev.org/openstack/openstacksdk/src/commit/3f81d0001dd994cde990d38f6e2671ee0694d7d5/openstack/cloud/_compute.py#L942
-        return self.conn.compute.get_server(server)
+        return args
 
     def _delete(self, server):
         self.conn.delete_server(
@@ -1127,11 +1496,22 @@ class ServerModule(OpenStackModule):
         server = self._update_security_groups(server, update)
         server = self._update_tags(server, update)
         server = self._update_server(server, update)
-        # Refresh server attributes after security groups etc. have changed
-        #
-        # Use compute.get_server() instead of compute.find_server()
-        # to include server details
-        return self.conn.compute.get_server(server)
+
+        # Changes to metadata, tags and server attributes are applied to the
+        # server object directly, but floating ip addresses and security
+        # groups are only reported correctly by Nova after a refresh
+        refresh_keys = ['ips', 'add_security_groups', 'remove_security_groups']
+        if not self.params['wait']:
+            # Server has been refreshed while waiting for specific ips
+            refresh_keys += ['add_ips', 'remove_ips']
+
+        if self.params['return_server'] == 'full' \
+           and any(k in update for k in refresh_keys):
+            # Use compute.get_server() instead of compute.find_server()
+            # to include server details
+            server = self.conn.compute.get_server(server)
+
+        return server
 
     def _update_ips(self, server, update):
         args = dict((k, self.params[k]) for k in ['wait', 'timeout'])
@@ -1139,24 +1519,75 @@ class ServerModule(OpenStackModule):
         if ips:
             server = self.conn.add_ips_to_server(server, **ips, **args)
 
-        add_ips = update.get('add_ips')
-        if add_ips:
+        add_ips = update.get('add_ips', [])
+        remove_ips = update.get('remove_ips', [])
+        if not (add_ips or remove_ips):
+            return server
+
+        # Resolve all floating ip addresses with a single listing
+        floating_ips = dict(
+            (ip['floating_ip_address'], ip)
+            for ip in self.conn.network.ips(
+                floating_ip_address=add_ips + remove_ips))
+        missing = [ip for ip in add_ips + remove_ips
+                   if ip not in floating_ips]
+        if missing:
+            self.fail_json(msg="Could not find floating ip addresses: {0}"
+                               .format(', '.join(missing)))
+
+        port_id, fixed_address = \
+            self._find_floating_ip_port(server) if add_ips else (None, None)
+
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            # Detach ips which are not supposed to be attached
+            futures = [
+                executor.submit(self.conn.network.update_ip,
+                                floating_ips[ip], port_id=None)
+                for ip in remove_ips]
+
             # Add specific ips which have not been added
-            server = self.conn.add_ip_list(server, add_ips, **args)
+            for ip in add_ips:
+                if port_id:
+                    futures.append(executor.submit(
+                        self.conn.network.update_ip, floating_ips[ip],
+                        port_id=port_id, fixed_ip_address=fixed_address))
+                else:
+                    # openstacksdk chooses a port on the NAT destination
+                    # network if the server has several ports
+                    futures.append(executor.submit(
+                        self.conn.add_ip_list, server, [ip]))
+
+            for future in futures:
+                future.result()
+
+        if self.params['wait']:
+            expected_ips = set(self._get_floating_ips(server)) \
+                .difference(remove_ips).union(add_ips)
+            for count in self.sdk.utils.iterate_timeout(
+                timeout=self.params['timeout'],
+                message="Timeout waiting for floating ip addresses of"
+                        " server {0}".format(server['id'])
+            ):
+                server = self.conn.compute.get_server(server['id'])
+                if set(self._get_floating_ips(server)) == expected_ips:
+                    break
 
-        remove_ips = update.get('remove_ips')
-        if remove_ips:
-            # Detach ips which are not supposed to be attached
-            for ip in remove_ips:
-                ip_id = self.conn.network.find_ip(name_or_id=ip,
-                                                  ignore_missing=False).id
-                # self.conn.network.update_ip(ip_id, port_id=None) does not
-                # handle nova network but self.conn.detach_ip_from_server()
-                # does so
-                self.conn.detach_ip_from_server(server_id=server.id,
-                                                floating_ip_id=ip_id)
         return server
 
+    def _find_floating_ip_port(self, server):
+        # All floating ip addresses are attached to the same port if the
+        # server has a single port with an IPv4 address
+        ports = list(self.conn.network.ports(device_id=server['id']))
+        if len(ports) != 1:
+            return None, None
+
+        for address in ports[0]['fixed_ips'] or []:
+            if ipaddress.ip_address(address['ip_address']).version == 4:
+                return ports[0]['id'], address['ip_address']
+
+        return None, None
+
     def _update_security_groups(self, server, update):
         add_security_groups = update.get('add_security_groups')
         if add_security_groups:
@@ -1184,6 +1615,12 @@ class ServerModule(OpenStackModule):
             self.conn.compute.delete_server_metadata(server.id,
                                                      remove_metadata.keys())
 
+        if add_metadata or remove_metadata:
+            server.metadata = dict(
+                (k, v) for (k, v)
+                in dict(server.metadata, **(add_metadata or {})).items()
+                if k not in (remove_metadata or {}))
+
         server_attributes = update.get('server_attributes')
         if server_attributes:
             # Server object cannot passed to self.conn.compute.update_server()
@@ -1193,19 +1630,25 @@ class ServerModule(OpenStackModule):
             server = self.conn.compute.update_server(server['id'],
                                                      **server_attributes)
 
-        # Whenever server attributes such as metadata have changed,
-        # the server object has to be refreshed. This will
-        # be postponed until all updates have been applied.
         return server
 
     def _update_tags(self, server, update):
-        tags = update.get('tags')
+        if 'tags' not in update:
+            return server
 
+        tags = update['tags']
         self.conn.compute.put(
             "/servers/{server_id}/tags".format(server_id=server['id']),
             json={"tags": tags},
             microversion="2.26"
         )
+        server.tags = tags
+        return server
+
+    def _server_result(self, server):
+        server = server.to_dict(computed=False)
+        if self.params['return_server'] == 'minimal':
+            return dict((k, server[k]) for k in ['id', 'name', 'status'])
         return server
 
     def _parse_metadata(self, metadata):
@@ -1238,11 +1681,20 @@ class ServerModule(OpenStackModule):
                 self.fail_json(
                     msg="Each entry in the 'nics' parameter must be a dict.")
 
+        network_ids = self._resolve_nics(
+            'network', [net['net-name'] for net in nets
+                        if not net.get('net-id') and net.get('net-name')])
+        port_ids = self._resolve_nics(
+            'port', [net['port-name'] for net in nets
+                     if not (net.get('net-id') or net.get('net-name')
+                             or net.get('port-id'))
+                     and net.get('port-name')])
+
+        for net in nets:
             if net.get('net-id'):
                 nics.append(net)
             elif net.get('net-name'):
-                network_id = self.conn.network.find_network(
-                    net['net-name'], ignore_missing=False).id
+                network_id = network_ids[net['net-name']]
                 # Replace net-name with net-id and keep optional nic args
                 # Ref.: https://github.com/ansible/ansible/pull/20969
                 #
@@ -1255,8 +1707,7 @@ class ServerModule(OpenStackModule):
             elif net.get('port-id'):
                 nics.append(net)
             elif net.get('port-name'):
-                port_id = self.conn.network.find_port(
-                    net['port-name'], ignore_missing=False).id
+                port_id = port_ids[net['port-name']]
                 # Replace net-name with net-id and keep optional nic args
                 # Ref.: https://github.com/ansible/ansible/pull/20969
                 #
@@ -1271,11 +1722,43 @@ class ServerModule(OpenStackModule):
                 nics[-1]['tag'] = net['tag']
         return nics
 
+    def _resolve_nics(self, type_name, names_or_ids):
+        # Returns a dict mapping names or ids of networks or ports to ids
+        names_or_ids = sorted(set(names_or_ids))
+        if not names_or_ids:
+            return dict()
+
+        cache = None
+        if self.params['nics_cache']:
+            cache = ResourceCache(self.params['nics_cache'],
+                                  self.params['nics_cache_ttl'])
+
+        ids = dict()
+        if cache:
+            for name_or_id in names_or_ids:
+                id = cache.get(type_name, name_or_id)
+                if id:
+                    ids[name_or_id] = id
+
+        missing = [v for v in names_or_ids if v not in ids]
+        if missing:
+            for name_or_id, resource in self.resolve_resources(
+                    getattr(self.conn.network, type_name + 's'), missing,
+                    type_name, filter_names=True,
+                    fields=['id', 'name']).items():
+                ids[name_or_id] = resource['id']
+                if cache:
+                    cache.set(type_name, name_or_id, resource['id'])
+
+        if cache:
+            cache.save()
+        return ids
+
     def _will_change(self, state, server):
         if state == 'present' and not server:
             return True
         elif state == 'present' and server:
-            return bool(self._build_update(server))
+            return bool(self.plan_update(server, self._build_update))
         elif state == 'absent' and server:
             return True
         else:
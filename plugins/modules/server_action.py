@@ -11,6 +11,8 @@ short_description: Perform actions on OpenStack compute (Nova) instances
 author: OpenStack Ansible SIG
 description:
   - Perform actions on OpenStack compute (Nova) instances aka servers.
+  - Actions on several servers are performed concurrently and all servers
+    are awaited with a single listing of servers per polling interval.
 options:
   action:
     description:
@@ -32,16 +34,55 @@ options:
         only.
     type: bool
     default: false
+  filters:
+    description:
+      - Query parameters which select the servers to perform the action on,
+        e.g. C(status) or C(name), which Nova matches as a regular
+        expression.
+      - Mutually exclusive with I(name) and I(names).
+    type: dict
   image:
     description:
       - Image name or ID the server should be rebuilt with.
     type: str
+  max_workers:
+    description:
+      - Maximum number of concurrent requests when performing the action on
+        several servers.
+    default: 8
+    type: int
   name:
     description:
       - Server name or ID.
-    required: true
+      - Exactly one of I(name), I(names) and I(filters) must be given.
     type: str
     aliases: ['server']
+  names:
+    description:
+      - List of server names or IDs to perform the action on.
+      - All servers are found with a single listing of servers. Each name
+        or ID must match exactly one server.
+      - Exactly one of I(name), I(names) and I(filters) must be given.
+    type: list
+    elements: str
+  wait_strategy:
+    description:
+      - How to wait for servers when I(wait) is true.
+      - If I(wait_strategy) is C(fixed), servers are polled at a fixed
+        interval until the action has been completed or I(timeout) has been
+        reached.
+      - If I(wait_strategy) is C(adaptive), the poll interval starts short
+        and grows with the elapsed time, with bounds depending on the
+        action, e.g. short intervals for reboots and long intervals for
+        rebuilds. Waiting for a server stops early when it is in status
+        C(ERROR) or when Nova's instance actions report that the action has
+        failed.
+      - Up to 10 pending servers are fetched by ID. More servers are polled
+        with a single listing of the servers which have changed since the
+        actions have been performed.
+    choices: ['adaptive', 'fixed']
+    default: fixed
+    type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
 '''
@@ -53,9 +94,61 @@ EXAMPLES = r'''
     action: pause
     server: vm1
     timeout: 200
+
+- name: Hard reboot all servers whose name starts with web-
+  openstack.cloud.server_action:
+    cloud: devstack
+    action: reboot_hard
+    filters:
+      name: ^web-
+    max_workers: 16
+
+- name: Stop servers web-1 and web-2
+  openstack.cloud.server_action:
+    cloud: devstack
+    action: stop
+    names:
+      - web-1
+      - web-2
+'''
+
+RETURN = r'''
+servers:
+  description: Per-server results.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    changed:
+      description: Whether the action has been performed on this server.
+      type: bool
+    failed:
+      description: Whether the action failed or did not complete in time.
+      type: bool
+    id:
+      description: ID of the server.
+      type: str
+    msg:
+      description: Error message if the action failed.
+      type: str
+    name:
+      description: Name of the server.
+      type: str
 '''
 
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
+from ansible_collections.openstack.cloud.plugins.module_utils.server_wait import wait_for_servers
+import concurrent.futures
+import datetime
+
+# Servers which are waited for are fetched by id up to this number and
+# listed otherwise
+MAX_FETCHED_SERVERS = 10
+
+# Listings of servers which have changed since the actions have been
+# performed start earlier by this margin, so changes are not missed if
+# clocks of the managed host and the cloud differ
+CHANGES_SINCE_MARGIN = datetime.timedelta(minutes=10)
 
 
 class ServerActionModule(OpenStackModule):
@@ -67,12 +160,18 @@ class ServerActionModule(OpenStackModule):
                              'shelve_offload', 'unshelve']),
         admin_password=dict(no_log=True),
         all_projects=dict(type='bool', default=False),
+        filters=dict(type='dict'),
         image=dict(),
-        name=dict(required=True, aliases=['server']),
+        max_workers=dict(default=8, type='int'),
+        name=dict(aliases=['server']),
+        names=dict(type='list', elements='str'),
+        wait_strategy=dict(default='fixed', choices=['adaptive', 'fixed']),
     )
 
     module_kwargs = dict(
+        mutually_exclusive=[('filters', 'name', 'names')],
         required_if=[('action', 'rebuild', ['image'])],
+        required_one_of=[('filters', 'name', 'names')],
         supports_check_mode=True,
     )
 
@@ -119,51 +218,126 @@ class ServerActionModule(OpenStackModule):
                    'unshelve': ['ACTIVE']}
 
     def run(self):
-        # TODO: Replace with self.conn.compute.find_server(
-        #       self.params['name'], all_projects=self.params['all_projects'],
-        #       ignore_missing=False) when [0] has been merged.
-        # [0] https://review.opendev.org/c/openstack/openstacksdk/+/857936/
-        server = self.conn.get_server(
-            name_or_id=self.params['name'],
-            detailed=True,
-            all_projects=self.params['all_projects'])
-        if not server:
-            self.fail_json(msg='No Server found for {0}'
-                               .format(self.params['name']))
-
         action = self.params['action']
+        servers = self._find_servers()
+        results = dict(
+            (server['id'], dict(id=server['id'], name=server['name'],
+                                changed=False, failed=False))
+            for server in servers)
 
-        # rebuild does not depend on state
-        will_change = (
-            (action == 'rebuild')
-            # `reboot_*` actions do not change state, servers remain `ACTIVE`
-            or (action == 'reboot_hard')
-            or (action == 'reboot_soft')
-            or (action == 'lock' and not server['is_locked'])
-            or (action == 'unlock' and server['is_locked'])
-            or server.status.lower() not in [a.lower()
-                                             for a
-                                             in self._action_map[action]])
+        servers = [server for server in servers
+                   if self._will_change(action, server)]
 
-        if not will_change:
-            self.exit_json(changed=False)
-        elif self.ansible.check_mode:
-            self.exit_json(changed=True)
+        if not servers or self.ansible.check_mode:
+            self.exit_json(changed=bool(servers),
+                           servers=list(results.values()))
         # else perform action
 
+        kwargs = dict()
         if action == 'rebuild':
             # rebuild should ensure images exists
             image = self.conn.image.find_image(self.params['image'],
                                                ignore_missing=False)
-            kwargs = dict(server=server,
-                          name=server['name'],
-                          image=image['id'])
+            kwargs['image'] = image['id']
 
             admin_password = self.params['admin_password']
             if admin_password is not None:
                 kwargs['admin_password'] = admin_password
 
-            self.conn.compute.rebuild_server(**kwargs)
+        self._changes_since = (
+            datetime.datetime.now(datetime.timezone.utc)
+            - CHANGES_SINCE_MARGIN).strftime('%Y-%m-%dT%H:%M:%SZ')
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            futures = dict(
+                (server['id'], executor.submit(self._act, action, server,
+                                               **kwargs))
+                for server in servers)
+            for server_id, future in futures.items():
+                try:
+                    future.result()
+                    results[server_id]['changed'] = True
+                except self.sdk.exceptions.SDKException as e:
+                    results[server_id].update(failed=True, msg=str(e))
+
+        if self.params['wait']:
+            ids = [server['id'] for server in servers
+                   if not results[server['id']]['failed']]
+            if self.params['wait_strategy'] == 'adaptive':
+                done, errors, pending = wait_for_servers(
+                    self.conn, action, ids, self._list_servers,
+                    lambda server: server is not None
+                    and self._is_done(action, server),
+                    self.params['timeout'])
+                for server_id, msg in errors.items():
+                    results[server_id].update(failed=True, msg=msg)
+            else:
+                pending = self._wait(action, ids)
+            for server_id in pending:
+                results[server_id].update(
+                    failed=True,
+                    msg='Timeout waiting for action {0} to be completed.'
+                        .format(action))
+
+        results = list(results.values())
+        is_changed = any(result['changed'] for result in results)
+        failures = [result for result in results if result['failed']]
+        if failures:
+            if self.params['name']:
+                # A single server fails with the error of its action
+                msg = failures[0]['msg']
+            else:
+                msg = 'Action {0} failed for {1} of {2} servers.' \
+                    .format(action, len(failures), len(results))
+            self.fail_json(msg=msg, changed=is_changed, servers=results)
+
+        self.exit_json(changed=is_changed, servers=results)
+
+    def _find_servers(self):
+        if self.params['name']:
+            # TODO: Replace with self.conn.compute.find_server(
+            #       self.params['name'],
+            #       all_projects=self.params['all_projects'],
+            #       ignore_missing=False) when [0] has been merged.
+            # [0] https://review.opendev.org/c/openstack/openstacksdk/+/857936/
+            server = self.conn.get_server(
+                name_or_id=self.params['name'],
+                detailed=True,
+                all_projects=self.params['all_projects'])
+            if not server:
+                self.fail_json(msg='No Server found for {0}'
+                                   .format(self.params['name']))
+            return [server]
+
+        if self.params['names']:
+            # A single listing of servers finds all servers
+            return self.find_resources(
+                self.conn.compute.servers, self.params['names'], 'Server',
+                details=True, all_projects=self.params['all_projects'])
+
+        return list(self.conn.compute.servers(
+            details=True,
+            all_projects=self.params['all_projects'],
+            **(self.params['filters'] or {})))
+
+    def _will_change(self, action, server):
+        # rebuild does not depend on state
+        return (
+            (action == 'rebuild')
+            # `reboot_*` actions do not change state, servers remain `ACTIVE`
+            or (action == 'reboot_hard')
+            or (action == 'reboot_soft')
+            or (action == 'lock' and not server['is_locked'])
+            or (action == 'unlock' and server['is_locked'])
+            or server.status.lower() not in [a.lower()
+                                             for a
+                                             in self._action_map[action]])
+
+    def _act(self, action, server, **kwargs):
+        if action == 'rebuild':
+            self.conn.compute.rebuild_server(server=server,
+                                             name=server['name'],
+                                             **kwargs)
         elif action == 'shelve_offload':
             # TODO: Replace with shelve_offload function call when [0] has been
             #       merged.
@@ -192,23 +366,59 @@ class ServerActionModule(OpenStackModule):
             else:
                 func_name(server)
 
-        if self.params['wait']:
+    def _is_done(self, action, server):
+        if (action == 'lock' and server['is_locked']) \
+           or (action == 'unlock' and not server['is_locked']):
+            return True
+
+        states = [s.lower() for s in self._action_map[action]]
+        return server.status.lower() in states
+
+    def _list_servers(self, ids):
+        if len(ids) == 1:
+            server = self.conn.compute.get_server(next(iter(ids)))
+            return {server['id']: server}
+
+        if len(ids) <= MAX_FETCHED_SERVERS:
+            servers = dict()
+            for server_id in ids:
+                try:
+                    servers[server_id] = \
+                        self.conn.compute.get_server(server_id)
+                except self.sdk.exceptions.NotFoundException:
+                    pass
+            return servers
+
+        # A single listing of servers which have changed since the actions
+        # have been performed tracks all servers, because performing an
+        # action changes a server. Servers which are not listed have not
+        # changed yet. Filters are not applied because servers might no
+        # longer match them after the action, e.g. filters on status.
+        return dict((server['id'], server) for server in
+                    self.conn.compute.servers(
+                        details=True,
+                        all_projects=self.params['all_projects'],
+                        changes_since=self._changes_since))
+
+    def _wait(self, action, ids):
+        # Returns ids of servers which have not completed the action in time
+        pending = set(ids)
+        try:
             for count in self.sdk.utils.iterate_timeout(
                 timeout=self.params['timeout'],
                 message='Timeout waiting for action {0} to be completed.'
                         .format(action)
             ):
-                server = self.conn.compute.get_server(server['id'])
-
-                if (action == 'lock' and server['is_locked']) \
-                   or (action == 'unlock' and not server['is_locked']):
-                    break
-
-                states = [s.lower() for s in self._action_map[action]]
-                if server.status.lower() in states:
+                if not pending:
                     break
 
-        self.exit_json(changed=True)
+                for server in self._list_servers(pending).values():
+                    if server['id'] in pending \
+                       and self._is_done(action, server):
+                        pending.discard(server['id'])
+        except self.sdk.exceptions.ResourceTimeout:
+            pass
+        return pending
 
 
 def main():
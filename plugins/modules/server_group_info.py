@@ -0,0 +1,189 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026 Red Hat, Inc.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+DOCUMENTATION = r'''
+---
+module: server_group_info
+short_description: Fetch OpenStack Compute (Nova) server groups
+author: OpenStack Ansible SIG
+description:
+  - Fetch policies and members of OpenStack Compute (Nova) server groups
+    with a single listing of server groups.
+  - Optionally estimate how many servers can still be added to groups with
+    policy C(anti-affinity), e.g. to fail before servers are created which
+    cannot be scheduled.
+options:
+  all_projects:
+    description:
+      - Whether to list server groups of all projects or the current project
+        only.
+    type: bool
+    default: false
+  capacity:
+    description:
+      - Whether to return the number of servers which can still be added to
+        each server group in C(capacity).
+      - For groups with policy C(anti-affinity), the capacity is the number
+        of enabled and running hypervisors multiplied with rule
+        C(max_server_per_host), which defaults to 1, minus the number of
+        members. Members on disabled or down hypervisors are counted, so
+        the capacity might be underestimated.
+      - Other policies do not limit the number of members, so their
+        capacity is null.
+      - Hypervisors are fetched with a single listing, which by default
+        requires administrator privileges.
+    type: bool
+    default: false
+  name:
+    description:
+      - Names or IDs of server groups.
+      - If not given, all server groups are returned.
+    type: list
+    elements: str
+extends_documentation_fragment:
+  - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
+'''
+
+EXAMPLES = r'''
+- name: Fetch server groups web and db
+  openstack.cloud.server_group_info:
+    cloud: devstack
+    name:
+      - web
+      - db
+
+- name: Fetch capacity of server group web
+  openstack.cloud.server_group_info:
+    cloud: devstack-admin
+    name: web
+    capacity: true
+  register: web_group
+
+- name: Fail before servers are created which cannot be scheduled
+  ansible.builtin.assert:
+    that:
+      - web_group.server_groups.0.capacity is none
+        or web_group.server_groups.0.capacity >= 3
+
+- name: Create servers in server group web
+  openstack.cloud.server:
+    cloud: devstack
+    name: web-%02d
+    count: 3
+    image: cirros
+    flavor: m1.tiny
+    scheduler_hints:
+      group: "{{ web_group.server_groups.0.id }}"
+'''
+
+RETURN = r'''
+server_groups:
+  description: List of dictionaries describing server groups.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    capacity:
+      description: Number of servers which can still be added to the server
+                   group or null if its policy does not limit the number of
+                   members. Only returned if I(capacity) is true.
+      type: int
+    id:
+      description: Unique UUID.
+      type: str
+    member_ids:
+      description: The list of members in the server group
+      type: list
+    metadata:
+      description: Metadata key and value pairs.
+      type: dict
+    name:
+      description: The name of the server group.
+      type: str
+    policies:
+      description: A list of exactly one policy name to associate with the
+                   group. Available until microversion 2.63
+      type: list
+    policy:
+      description: Represents the name of the policy. Available from version
+                   2.64 on.
+      type: str
+    project_id:
+      description: The project ID who owns the server group.
+      type: str
+    rules:
+      description: The rules field, applied to the policy. Currently, only
+                   the C(max_server_per_host) rule is supported for the
+                   C(anti-affinity) policy.
+      type: dict
+    user_id:
+      description: The user ID who owns the server group
+      type: str
+'''
+
+from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
+
+
+class ServerGroupInfoModule(OpenStackModule):
+    argument_spec = dict(
+        all_projects=dict(type='bool', default=False),
+        capacity=dict(type='bool', default=False),
+        fields=dict(type='list', elements='str'),
+        name=dict(type='list', elements='str'),
+    )
+
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    def run(self):
+        server_groups = list(self.conn.compute.server_groups(
+            all_projects=self.params['all_projects']))
+
+        names = self.params['name']
+        if names:
+            found = dict()
+            for name_or_id in names:
+                matches = [sg for sg in server_groups
+                           if sg['id'] == name_or_id] \
+                    or [sg for sg in server_groups
+                        if sg['name'] == name_or_id]
+                for sg in matches:
+                    found.setdefault(sg['id'], sg)
+            server_groups = list(found.values())
+
+        results = [sg.to_dict(computed=False) for sg in server_groups]
+
+        if self.params['capacity']:
+            hosts = None
+            for result in results:
+                policy = result['policy'] \
+                    or (result['policies'] or [None])[0]
+                if policy != 'anti-affinity':
+                    result['capacity'] = None
+                    continue
+
+                if hosts is None:
+                    hosts = len([h for h in self.conn.compute.hypervisors()
+                                 if h['state'] == 'up'
+                                 and h['status'] == 'enabled'])
+                per_host = (result['rules'] or {}) \
+                    .get('max_server_per_host', 1)
+                result['capacity'] = max(
+                    hosts * int(per_host) - len(result['member_ids'] or []),
+                    0)
+
+        self.exit_json(changed=False, server_groups=results)
+
+
+def main():
+    module = ServerGroupInfoModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
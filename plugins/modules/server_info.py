@@ -26,6 +26,29 @@ options:
         of additional API calls.
     type: bool
     default: 'false'
+  bulk_details:
+    description:
+      - When I(detailed) is true, fetch additional details with a single
+        listing of ports, floating ips and volumes each and join them to
+        servers instead of querying them per server.
+      - Flavor and image names are fetched once per distinct flavor and
+        image.
+      - Security groups are fetched per server from the Compute API like
+        when I(bulk_details) is false, so they have the same format.
+      - If at most 50 servers have been found, e.g. because I(name) or
+        I(filters) are given, ports are listed by server ID, floating ips
+        by the IDs of these ports and attached volumes are fetched by ID,
+        so only resources of these servers are transferred. Otherwise all
+        ports, floating ips and volumes visible to the user are listed,
+        which is cheaper than filtering by thousands of IDs but returns
+        resources of servers which have not been found, too.
+    type: bool
+    default: 'false'
+  max_workers:
+    description:
+      - Maximum number of concurrent requests when I(bulk_details) is true.
+    type: int
+    default: 8
   filters:
     description: |
       Used for further filtering of results. Either a string containing a
@@ -40,6 +63,7 @@ options:
     default: 'false'
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = '''
@@ -50,6 +74,13 @@ EXAMPLES = '''
     filters:
       vm_state: active
 
+- name: Gather details about all servers of all projects
+  openstack.cloud.server_info:
+    cloud: devstack-admin
+    all_projects: true
+    detailed: true
+    bulk_details: true
+
 - name: Filter servers with nested dictionaries
   openstack.cloud.server_info:
     cloud: devstack
@@ -355,8 +386,15 @@ servers:
             type: list
 '''
 
+import collections
+import concurrent.futures
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
+# Listings are filtered by IDs of up to this many servers. IDs are passed as
+# query parameters, so their number is limited to keep URLs short.
+MAX_FILTERED_SERVERS = 50
+
 
 class ServerInfoModule(OpenStackModule):
 
@@ -365,12 +403,18 @@ class ServerInfoModule(OpenStackModule):
         detailed=dict(type='bool', default=False),
         filters=dict(type='dict'),
         all_projects=dict(type='bool', default=False),
+        fields=dict(type='list', elements='str'),
+        bulk_details=dict(type='bool', default=False),
+        max_workers=dict(type='int', default=8),
     )
     module_kwargs = dict(
         supports_check_mode=True
     )
 
     def run(self):
+        if self.params['detailed'] and self.params['bulk_details']:
+            self.exit(changed=False, servers=self._find_detailed_servers())
+
         kwargs = dict((k, self.params[k])
                       for k in ['detailed', 'filters', 'all_projects']
                       if self.params[k] is not None)
@@ -382,6 +426,207 @@ class ServerInfoModule(OpenStackModule):
                            for server in
                            self.conn.search_servers(**kwargs)])
 
+    def _find_detailed_servers(self):
+        servers = self.conn.search_servers(
+            name_or_id=self.params['name'],
+            filters=self.params['filters'],
+            all_projects=self.params['all_projects'],
+            bare=True)
+
+        if not servers:
+            return []
+
+        is_filtered = len(servers) <= MAX_FILTERED_SERVERS
+
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            listings = dict(
+                (k, executor.submit(lambda f: list(f()), f))
+                for k, f in self._listings(servers, is_filtered).items())
+
+            attached_volumes = []
+            if is_filtered and self.conn.has_service('volume'):
+                # Cinder cannot list volumes by server, so volumes attached
+                # to the servers are fetched by id
+                volume_ids = sorted(set(
+                    v['id'] for s in servers
+                    for v in s['attached_volumes'] or []))
+                attached_volumes = [executor.submit(self._get_volume, i)
+                                    for i in volume_ids]
+
+            flavor_ids = set(s['flavor'].get('id') for s in servers)
+            flavor_names = dict(
+                (i, executor.submit(self._get_name,
+                                    self.conn.compute.get_flavor, i))
+                for i in flavor_ids if i)
+
+            # Nova returns security groups of a server in a different format
+            # than the Networking API
+            security_groups = dict(
+                (s['id'], executor.submit(self._get_security_groups, s))
+                for s in servers)
+
+            image_ids = set(self._image_id(s) for s in servers)
+            image_names = dict(
+                (i, executor.submit(self._get_name,
+                                    self.conn.image.get_image, i))
+                for i in image_ids if i)
+
+            listings = dict((k, f.result()) for k, f in listings.items())
+
+            if is_filtered and listings.get('ports'):
+                # Floating ips are found by the ports of the servers
+                port_ids = [port['id'] for port in listings['ports']]
+                listings['floating_ips'] = list(
+                    self.conn.network.ips(port_id=port_ids))
+
+            if attached_volumes:
+                listings['volumes'] = [
+                    v for v in (f.result() for f in attached_volumes) if v]
+
+            flavor_names = dict((k, f.result())
+                                for k, f in flavor_names.items())
+            image_names = dict((k, f.result())
+                               for k, f in image_names.items())
+            security_groups = dict((k, f.result())
+                                   for k, f in security_groups.items())
+
+        ports = collections.defaultdict(list)
+        for port in listings.get('ports', []):
+            ports[port['device_id']].append(port)
+
+        floating_ips = collections.defaultdict(list)
+        for ip in listings.get('floating_ips', []):
+            floating_ips[ip['port_id']].append(ip)
+
+        volumes = collections.defaultdict(list)
+        for volume in listings.get('volumes', []):
+            for attachment in volume['attachments']:
+                volumes[attachment['server_id']].append(
+                    dict(volume.to_dict(computed=False),
+                         device=attachment['device']))
+
+        return [self._expand_server(server, ports[server['id']],
+                                    floating_ips,
+                                    security_groups[server['id']],
+                                    volumes[server['id']], flavor_names,
+                                    image_names)
+                for server in servers]
+
+    def _listings(self, servers, is_filtered):
+        listings = {}
+        if self.conn.has_service('network') and is_filtered:
+            device_ids = [server['id'] for server in servers]
+            listings['ports'] = \
+                lambda: self.conn.network.ports(device_id=device_ids)
+        elif self.conn.has_service('network'):
+            listings['ports'] = self.conn.network.ports
+            listings['floating_ips'] = self.conn.network.ips
+        if self.conn.has_service('volume') and not is_filtered:
+            kwargs = dict(all_projects=True) \
+                if self.params['all_projects'] else dict()
+            listings['volumes'] = \
+                lambda: self.conn.block_storage.volumes(**kwargs)
+        return listings
+
+    def _get_volume(self, id):
+        try:
+            return self.conn.block_storage.get_volume(id)
+        except self.sdk.exceptions.SDKException:
+            # Volume might have been detached and deleted in the meantime
+            return None
+
+    def _get_security_groups(self, server):
+        # Mirrors openstacksdk's expand_server_security_groups()
+        try:
+            return self.conn.compute.fetch_server_security_groups(
+                server)['security_groups'] or []
+        except self.sdk.exceptions.SDKException:
+            return []
+
+    def _get_name(self, get_function, id):
+        try:
+            return get_function(id)['name']
+        except self.sdk.exceptions.SDKException:
+            # Details are supplemental and do not block results
+            return None
+
+    def _image_id(self, server):
+        # Image is a string when server has been booted from volume
+        image = server['image']
+        return image if isinstance(image, str) else (image or {}).get('id')
+
+    def _expand_server(self, server, ports, floating_ips, security_groups,
+                       volumes, flavor_names, image_names):
+        # Mirrors openstacksdk's openstack.cloud.meta.add_server_interfaces()
+        # and get_hostvars_from_server() but uses prefetched resources
+        meta = self.sdk.cloud.meta
+
+        server.addresses = self._add_floating_ips(server, ports,
+                                                  floating_ips)
+        server['public_v4'] = meta.get_server_external_ipv4(
+            self.conn, server) or ''
+        server['public_v6'] = '' if self.conn.force_ipv4 \
+            else meta.get_server_external_ipv6(server) or ''
+        server['private_v4'] = meta.get_server_private_ip(
+            server, self.conn) or ''
+        server['interface_ip'] = meta._get_interface_ip(
+            self.conn, server) or ''
+
+        details = server.to_dict(computed=True)
+
+        if self.conn.private and details['private_v4']:
+            details['access_ipv4'] = details['private_v4']
+        else:
+            details['access_ipv4'] = details['public_v4']
+        details['access_ipv6'] = details['public_v6']
+
+        flavor = details['flavor']
+        if flavor_names.get(flavor.get('id')):
+            flavor['name'] = flavor_names[flavor['id']]
+        elif 'original_name' in flavor:
+            flavor['name'] = flavor['original_name']
+
+        image_id = self._image_id(server)
+        if isinstance(details['image'], str):
+            details['image'] = dict(id=image_id)
+        if image_names.get(image_id):
+            details['image']['name'] = image_names[image_id]
+
+        details['security_groups'] = security_groups
+        details['volumes'] = volumes
+
+        return details
+
+    def _add_floating_ips(self, server, ports, floating_ips):
+        addresses = dict((name, list(network))
+                         for name, network in server['addresses'].items())
+
+        fixed_ip_mapping = {}
+        for name, network in addresses.items():
+            for address in network:
+                if address['version'] == 6:
+                    continue
+                if address.get('OS-EXT-IPS:type') == 'floating':
+                    # Nova knows about floating ips already
+                    return addresses
+                fixed_ip_mapping[address['addr']] = name
+
+        if server['status'] != 'ACTIVE':
+            return addresses
+
+        for port in ports:
+            for ip in floating_ips[port['id']]:
+                name = fixed_ip_mapping.get(ip['fixed_ip_address'])
+                if name is not None:
+                    addresses[name].append({
+                        'version': 4,
+                        'addr': ip['floating_ip_address'],
+                        'OS-EXT-IPS:type': 'floating',
+                        'OS-EXT-IPS-MAC:mac_addr': port['mac_address'],
+                    })
+        return addresses
+
 
 def main():
     module = ServerInfoModule()
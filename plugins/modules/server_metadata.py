@@ -11,13 +11,36 @@ short_description: Add/Update/Delete Metadata in Compute Instances from OpenStac
 author: OpenStack Ansible SIG
 description:
    - Add, Update or Remove metadata in compute instances from OpenStack.
+   - Metadata of several servers is reconciled with a single listing of
+     servers and only servers whose metadata differs are updated,
+     concurrently.
 options:
+   filters:
+     description:
+        - Query parameters which select the servers to update the metadata
+          of, e.g. C(name), which Nova matches as a regular expression.
+        - Mutually exclusive with I(name) and I(names).
+     type: dict
+   max_workers:
+     description:
+        - Maximum number of concurrent requests when updating the metadata
+          of several servers.
+     default: 8
+     type: int
    name:
      description:
         - Name of the instance to update the metadata
-     required: true
+        - Exactly one of I(name), I(names) and I(filters) must be given.
      aliases: ['server']
      type: str
+   names:
+     description:
+        - List of names or IDs of instances to update the metadata of.
+        - All instances are found with a single listing of servers. Each
+          name or ID must match exactly one instance.
+        - Exactly one of I(name), I(names) and I(filters) must be given.
+     type: list
+     elements: str
    metadata:
      description:
         - 'A list of key value pairs that should be provided as a metadata to
@@ -60,6 +83,26 @@ EXAMPLES = '''
             hostname:
             group:
             public_keys:
+
+# Sets owner and cost center of all servers whose name starts with web-
+- name: add metadata to several instances
+  openstack.cloud.server_metadata:
+      cloud: "{{ cloud }}"
+      filters:
+          name: ^web-
+      metadata:
+          owner: web-team
+          cost_center: cc-1234
+
+# Sets owner of the instances vm1 and vm2
+- name: add metadata to a list of instances
+  openstack.cloud.server_metadata:
+      cloud: "{{ cloud }}"
+      names:
+          - vm1
+          - vm2
+      metadata:
+          owner: web-team
 '''
 
 RETURN = '''
@@ -355,22 +398,61 @@ server:
             description: Same as attached_volumes.
             returned: success
             type: list
+servers:
+    description: Results for each server when I(filters) or I(names) are
+                 given.
+    returned: When I(filters) or I(names) are given
+    type: list
+    elements: dict
+    contains:
+        changed:
+            description: Whether the metadata of the server has been changed.
+            type: bool
+        failed:
+            description: Whether updating the metadata of the server failed.
+            type: bool
+        id:
+            description: ID of the server.
+            type: str
+        metadata:
+            description: Metadata of the server after the update.
+            type: dict
+        msg:
+            description: Error message if updating the metadata failed.
+            type: str
+        name:
+            description: Name of the server.
+            type: str
 '''
 
+import concurrent.futures
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
 
 class ServerMetadataModule(OpenStackModule):
     argument_spec = dict(
-        name=dict(required=True, aliases=['server']),
+        filters=dict(type='dict'),
+        max_workers=dict(default=8, type='int'),
+        name=dict(aliases=['server']),
+        names=dict(type='list', elements='str'),
         metadata=dict(required=True, type='dict', aliases=['meta']),
         state=dict(default='present', choices=['absent', 'present']),
     )
     module_kwargs = dict(
+        mutually_exclusive=[
+            ('filters', 'name', 'names'),
+        ],
+        required_one_of=[
+            ('filters', 'name', 'names'),
+        ],
         supports_check_mode=True
     )
 
     def run(self):
+        if self.params['name'] is None:
+            self._run_servers()
+
         state = self.params['state']
         server_name_or_id = self.params['name']
         metadata = self.params['metadata']
@@ -409,6 +491,83 @@ class ServerMetadataModule(OpenStackModule):
         self.exit_json(changed=changed,
                        server=server.to_dict(computed=False))
 
+    def _run_servers(self):
+        state = self.params['state']
+        metadata = self.params['metadata']
+
+        servers = self._find_servers()
+        results = dict(
+            (server['id'], dict(id=server['id'], name=server['name'],
+                                metadata=dict(server['metadata'] or {}),
+                                changed=False, failed=False))
+            for server in servers)
+
+        # Diffs are computed locally, so only servers whose metadata differs
+        # are updated
+        changes = dict()
+        for server in servers:
+            if state == 'present':
+                change = self._build_update(server['metadata'], metadata)
+            else:
+                change = self._get_keys_to_delete(server['metadata'],
+                                                  metadata)
+            if change:
+                changes[server['id']] = (server, change)
+
+        if not changes or self.ansible.check_mode:
+            self.exit_json(changed=bool(changes),
+                           servers=list(results.values()))
+
+        with concurrent.futures.ThreadPoolExecutor(
+                self.params['max_workers']) as executor:
+            futures = dict(
+                (server_id, executor.submit(self._apply, state, server,
+                                            change))
+                for server_id, (server, change) in changes.items())
+            for server_id, future in futures.items():
+                result = results[server_id]
+                try:
+                    future.result()
+                    change = changes[server_id][1]
+                    if state == 'present':
+                        result['metadata'].update(change)
+                    else:
+                        for key in change:
+                            result['metadata'].pop(key)
+                    result['changed'] = True
+                except self.sdk.exceptions.SDKException as e:
+                    result.update(failed=True, msg=str(e))
+
+        results = list(results.values())
+        is_changed = any(result['changed'] for result in results)
+        failures = [result for result in results if result['failed']]
+        if failures:
+            self.fail_json(msg='Failed to update metadata of {0} of {1}'
+                               ' servers.'.format(len(failures),
+                                                  len(changes)),
+                           changed=is_changed,
+                           servers=results)
+
+        self.exit_json(changed=is_changed, servers=results)
+
+    def _find_servers(self):
+        # A single listing of servers with details includes metadata of all
+        # servers
+        if self.params['names']:
+            return self.find_resources(
+                self.conn.compute.servers, self.params['names'], 'Server',
+                details=True)
+
+        return list(self.conn.compute.servers(
+            details=True, **(self.params['filters'] or {})))
+
+    def _apply(self, state, server, change):
+        if state == 'present':
+            # Nova merges the given keys into the existing metadata
+            self.conn.compute.set_server_metadata(server, **change)
+        else:
+            self.conn.compute.delete_server_metadata(server, list(change))
+
     def _build_update(self, current=None, requested=None):
         current = current or {}
         requested = requested or {}
@@ -15,6 +15,7 @@ options:
    device:
      description:
       - Device you want to attach. Defaults to auto finding a device name.
+      - Cannot be used together with I(volumes).
      type: str
    server:
      description:
@@ -30,8 +31,21 @@ options:
    volume:
      description:
       - Name or id of volume you want to attach to a server
-     required: true
+      - Exactly one of I(volume) and I(volumes) is required.
      type: str
+   volumes:
+     description:
+      - Names or ids of volumes you want to attach to or detach from a
+        server.
+      - All volumes are looked up with a single listing of volumes and
+        attachments are requested one after another without waiting in
+        between.
+      - When I(wait) is true, all volumes are waited for with a single
+        listing of volumes per poll interval.
+      - Device names are chosen automatically.
+      - Exactly one of I(volume) and I(volumes) is required.
+     type: list
+     elements: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
 '''
@@ -140,6 +154,32 @@ volume:
     volume_type:
       description: The associated volume type name for the volume.
       type: str
+volumes:
+  type: list
+  elements: dict
+  description: Results for each volume in I(volumes).
+  returned: When I(volumes) is set
+  contains:
+    changed:
+      description: Whether the volume has been attached or detached.
+      type: bool
+    device:
+      description: Device of the volume on the server or null if the volume
+                   is not attached to the server.
+      type: str
+      sample: /dev/vdb
+    failed:
+      description: Whether attaching or detaching the volume failed.
+      type: bool
+    id:
+      description: The UUID of the volume.
+      type: str
+    msg:
+      description: Error message if attaching or detaching failed.
+      type: str
+    name:
+      description: The volume name.
+      type: str
 '''
 
 EXAMPLES = r'''
@@ -150,6 +190,16 @@ EXAMPLES = r'''
     server: Mysql-server
     volume: mysql-data
     device: /dev/vdb
+
+- name: Attaches data volumes to a database server
+  openstack.cloud.server_volume:
+    state: present
+    cloud: mordred
+    server: Mysql-server
+    volumes:
+      - mysql-data-1
+      - mysql-data-2
+      - mysql-data-3
 '''
 
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
@@ -165,12 +215,26 @@ class ServerVolumeModule(OpenStackModule):
 
     argument_spec = dict(
         server=dict(required=True),
-        volume=dict(required=True),
+        volume=dict(),
+        volumes=dict(type='list', elements='str'),
         device=dict(),  # None == auto choose device name
         state=dict(default='present', choices=['absent', 'present']),
     )
 
+    module_kwargs = dict(
+        mutually_exclusive=[
+            ('volume', 'volumes'),
+            ('device', 'volumes'),
+        ],
+        required_one_of=[
+            ('volume', 'volumes'),
+        ],
+    )
+
     def run(self):
+        if self.params['volumes'] is not None:
+            self._run_volumes()
+
         state = self.params['state']
         wait = self.params['wait']
         timeout = self.params['timeout']
@@ -206,6 +270,114 @@ class ServerVolumeModule(OpenStackModule):
             self.conn.detach_volume(server, volume, wait=wait, timeout=timeout)
             self.exit_json(changed=True)
 
+    def _run_volumes(self):
+        state = self.params['state']
+
+        server = self.conn.compute.find_server(self.params['server'],
+                                               ignore_missing=False)
+        attached_ids = set(v['id'] for v in server.attached_volumes or [])
+        # A single listing of volumes finds all volumes
+        volumes = self.find_resources(
+            self.conn.block_storage.volumes, self.params['volumes'], 'Volume',
+            details=True)
+
+        pending = [volume for volume in volumes
+                   if (volume.id in attached_ids) == (state == 'absent')]
+
+        if self.ansible.check_mode:
+            self.exit_json(changed=bool(pending))
+
+        results = dict(
+            (volume.id, dict(changed=False,
+                             device=self._get_device(volume, server.id),
+                             failed=False,
+                             id=volume.id,
+                             name=volume.name))
+            for volume in volumes)
+
+        # Nova serializes attachments of a server, so requests are sent one
+        # after another and all volumes are waited for once afterwards
+        for volume in pending:
+            result = results[volume.id]
+            try:
+                if state == 'present':
+                    attachment = self.conn.compute.create_volume_attachment(
+                        server, volume=volume.id)
+                    result['device'] = attachment.device
+                else:
+                    self.conn.compute.delete_volume_attachment(server,
+                                                               volume.id)
+                    result['device'] = None
+                result['changed'] = True
+            except self.sdk.exceptions.SDKException as e:
+                result.update(failed=True, msg=str(e))
+
+        if self.params['wait']:
+            self._wait_volumes(
+                [results[volume.id] for volume in pending
+                 if not results[volume.id]['failed']],
+                server.id, state)
+
+        results = [results[volume.id] for volume in volumes]
+        is_changed = any(result['changed'] for result in results)
+        failures = [result for result in results if result['failed']]
+        if failures:
+            self.fail_json(msg='Failed to {0} {1} of {2} volumes.'.format(
+                               'attach' if state == 'present' else 'detach',
+                               len(failures), len(pending)),
+                           changed=is_changed,
+                           volumes=results)
+
+        self.exit_json(changed=is_changed, volumes=results)
+
+    @staticmethod
+    def _get_device(volume, server_id):
+        for attachment in volume.attachments or []:
+            if attachment.get('server_id') == server_id:
+                return attachment.get('device')
+        return None
+
+    def _wait_volumes(self, results, server_id, state):
+        pending = dict((result['id'], result) for result in results)
+        try:
+            for count in self.sdk.utils.iterate_timeout(
+                timeout=self.params['timeout'],
+                message='Timeout waiting for volumes'
+            ):
+                if not pending:
+                    break
+
+                if len(pending) == 1:
+                    volumes = [self.conn.block_storage.get_volume(
+                        next(iter(pending)))]
+                else:
+                    # A single listing of volumes tracks all volumes
+                    volumes = self.conn.block_storage.volumes(details=True)
+
+                for volume in volumes:
+                    if volume.id not in pending:
+                        continue
+                    result = pending[volume.id]
+                    device = self._get_device(volume, server_id)
+                    if volume.status.lower().startswith('error'):
+                        result.update(
+                            failed=True,
+                            msg='Volume {0} is in status {1}'.format(
+                                volume.id, volume.status))
+                        del pending[volume.id]
+                    elif state == 'present' and device \
+                            and volume.status == 'in-use':
+                        result['device'] = device
+                        del pending[volume.id]
+                    elif state == 'absent' and not device \
+                            and volume.status != 'detaching':
+                        del pending[volume.id]
+        except self.sdk.exceptions.ResourceTimeout:
+            for result in pending.values():
+                result.update(failed=True,
+                              msg='Timeout waiting for volume {0}'
+                                  .format(result['id']))
+
 
 def main():
     module = ServerVolumeModule()
@@ -24,6 +24,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 """
 
 EXAMPLES = r"""
@@ -96,7 +97,10 @@ MANILA_MICROVERSION = "2.50"
 
 
 class ShareTypeInfoModule(OpenStackModule):
-    argument_spec = dict(name=dict(type="str", required=True))
+    argument_spec = dict(
+        fields=dict(type="list", elements="str"),
+        name=dict(type="str", required=True),
+    )
     module_kwargs = dict(
         supports_check_mode=True,
     )
@@ -12,6 +12,19 @@ author: OpenStack Ansible SIG
 description:
   - Get information about Heat stack in OpenStack
 options:
+  detailed:
+    description:
+      - Whether to fetch each stack individually to return details such as
+        I(outputs), I(parameters) or I(template_description) which are not
+        part of stack listings.
+      - Stacks are fetched concurrently, see I(max_workers).
+    default: false
+    type: bool
+  max_workers:
+    description:
+      - Maximum number of concurrent requests when I(detailed) is C(true).
+    default: 8
+    type: int
   name:
     description:
       - Name of the stack.
@@ -32,6 +45,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -43,6 +57,12 @@ EXAMPLES = r'''
   openstack.cloud.stack_info:
     cloud: devstack
     name: my_stack
+
+- name: Fetch outputs of a Heat stack
+  openstack.cloud.stack_info:
+    cloud: devstack
+    name: my_stack
+    detailed: true
 '''
 
 RETURN = r'''
@@ -185,11 +205,16 @@ stacks:
             type: str
 '''
 
+import concurrent.futures
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
 
 class StackInfoModule(OpenStackModule):
     argument_spec = dict(
+        detailed=dict(default=False, type='bool'),
+        fields=dict(type='list', elements='str'),
+        max_workers=dict(default=8, type='int'),
         name=dict(),
         owner=dict(aliases=['owner_id']),
         project=dict(aliases=['project_id']),
@@ -229,10 +254,16 @@ class StackInfoModule(OpenStackModule):
             if self.params[k] is not None:
                 kwargs[k] = self.params[k]
 
-        stacks = []
-        for stack in self.conn.orchestration.stacks(**kwargs):
-            stack_obj = self.conn.orchestration.get_stack(stack.id)
-            stacks.append(stack_obj.to_dict(computed=False))
+        stacks = list(self.conn.orchestration.stacks(**kwargs))
+
+        if self.params['detailed'] and stacks:
+            with concurrent.futures.ThreadPoolExecutor(
+                    self.params['max_workers']) as executor:
+                stacks = list(executor.map(
+                    lambda stack: self.conn.orchestration.get_stack(stack.id),
+                    stacks))
+
+        stacks = [stack.to_dict(computed=False) for stack in stacks]
 
         self.exit_json(changed=False, stacks=stacks)
 
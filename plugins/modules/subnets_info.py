@@ -27,6 +27,7 @@ options:
      type: dict
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = '''
@@ -166,7 +167,8 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class SubnetInfoModule(OpenStackModule):
     argument_spec = dict(
         name=dict(aliases=['subnet']),
-        filters=dict(type='dict')
+        filters=dict(type='dict'),
+        fields=dict(type='list', elements='str'),
     )
     module_kwargs = dict(
         supports_check_mode=True
@@ -187,6 +189,9 @@ class SubnetInfoModule(OpenStackModule):
                 pass
         if self.params['filters']:
             kwargs.update(self.params['filters'])
+        fields = self.query_fields(self.sdk.network.v2.subnet.Subnet)
+        if fields:
+            kwargs['fields'] = fields
         subnets = self.conn.network.subnets(**kwargs)
         subnets = [i.to_dict(computed=False) for i in subnets]
         self.exit(changed=False, subnets=subnets)
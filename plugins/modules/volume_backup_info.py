@@ -22,6 +22,7 @@ options:
     type: str
 extends_documentation_fragment:
 - openstack.cloud.openstack
+- openstack.cloud.openstack.fields
 '''
 
 RETURN = r'''
@@ -117,6 +118,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class VolumeBackupInfoModule(OpenStackModule):
 
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         name=dict(),
         volume=dict()
     )
@@ -32,6 +32,7 @@ options:
     required: false
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 RETURN = r'''
@@ -205,6 +206,7 @@ class VolumeInfoModule(OpenStackModule):
     argument_spec = dict(
         all_projects=dict(type='bool'),
         details=dict(type='bool'),
+        fields=dict(type='list', elements='str'),
         name=dict(),
         status=dict(),
     )
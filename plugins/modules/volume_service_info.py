@@ -22,6 +22,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -76,6 +77,7 @@ class VolumeServiceInfoModule(OpenStackModule):
 
     argument_spec = dict(
         binary=dict(),
+        fields=dict(type='list', elements='str'),
         host=dict(),
     )
 
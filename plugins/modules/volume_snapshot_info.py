@@ -32,6 +32,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 RETURN = r'''
@@ -97,6 +98,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 class VolumeSnapshotInfoModule(OpenStackModule):
     argument_spec = dict(
         details=dict(type='bool'),
+        fields=dict(type='list', elements='str'),
         name=dict(),
         status=dict(choices=['available', 'backing-up', 'creating', 'deleted',
                              'deleting', 'error', 'error_deleting',
@@ -20,6 +20,7 @@ options:
     type: str
 extends_documentation_fragment:
   - openstack.cloud.openstack
+  - openstack.cloud.openstack.fields
 '''
 
 EXAMPLES = r'''
@@ -132,6 +133,7 @@ from ansible_collections.openstack.cloud.plugins.module_utils.openstack import O
 
 class VolumeTypeModule(OpenStackModule):
     argument_spec = dict(
+        fields=dict(type='list', elements='str'),
         name=dict(type='str', required=True)
     )
     module_kwargs = dict(
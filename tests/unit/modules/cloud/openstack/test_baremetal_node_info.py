@@ -0,0 +1,66 @@
+from ansible_collections.openstack.cloud.plugins.modules import baremetal_node_info
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+class FakeBaremetalSDK(FakeSDK):
+    class baremetal:
+        class v1:
+            class node:
+                class Node(object):
+                    pass
+
+
+class TestBaremetalNodeInfo(OpenStackModuleTestCase):
+
+    module = baremetal_node_info
+    sdk = FakeBaremetalSDK
+
+    def setUp(self):
+        super(TestBaremetalNodeInfo, self).setUp()
+        self.conn.baremetal.ports.return_value = [
+            FakeResource(address='00:00:00:00:00:0{0}'.format(i),
+                         node_id='node{0}'.format(i // 2))
+            for i in range(10)]
+        self.conn.baremetal.get_node.side_effect = \
+            lambda node_id, fields=None: FakeResource(id=node_id)
+        self.conn.baremetal.nodes.return_value = [
+            FakeResource(id='node{0}'.format(i)) for i in range(5)]
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]['nodes']
+
+    def test_macs_fetch_matching_nodes(self):
+        nodes = self._run(mac=['00:00:00:00:00:03', '00:00:00:00:00:02',
+                               '00:00:00:00:00:08', 'ff:ff:ff:ff:ff:ff'])
+
+        self.assertEqual([n['id'] for n in nodes], ['node1', 'node4'])
+        self.conn.baremetal.ports.assert_called_once_with(
+            fields=['address', 'node_id'])
+        self.assertEqual(self.conn.baremetal.get_node.call_count, 2)
+        self.conn.baremetal.nodes.assert_not_called()
+        self.conn.get_nic_by_mac.assert_not_called()
+
+    def test_macs_list_nodes_when_many_match(self):
+        nodes = self._run(mac=['00:00:00:00:00:0{0}'.format(i)
+                               for i in range(0, 10, 2)],
+                          max_workers=2)
+
+        self.assertEqual([n['id'] for n in nodes],
+                         ['node{0}'.format(i) for i in range(5)])
+        self.conn.baremetal.nodes.assert_called_once_with(details=True)
+        self.conn.baremetal.get_node.assert_not_called()
+
+    def test_single_mac(self):
+        self.conn.get_nic_by_mac.return_value = FakeResource(node_id='node3')
+
+        nodes = self._run(mac='00:00:00:00:00:06')
+
+        self.assertEqual([n['id'] for n in nodes], ['node3'])
+        self.conn.baremetal.ports.assert_not_called()
@@ -0,0 +1,57 @@
+from ansible_collections.openstack.cloud.plugins.modules import compute_flavor_info
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    OpenStackModuleTestCase,
+)
+
+
+def range_search(data, filters):
+    # Simplified openstacksdk range_search() for exact, >= and MIN values
+    data = list(data)
+    for key, value in filters.items():
+        if value == 'MIN':
+            minimum = min(d[key] for d in data)
+            data = [d for d in data if d[key] == minimum]
+        elif value.startswith('>='):
+            data = [d for d in data if d[key] >= int(value[2:])]
+        else:
+            data = [d for d in data if d[key] == int(value)]
+    return data
+
+
+class TestComputeFlavorInfo(OpenStackModuleTestCase):
+
+    module = compute_flavor_info
+
+    def setUp(self):
+        super(TestComputeFlavorInfo, self).setUp()
+        self.consumed = []
+        self.conn.compute.flavors.side_effect = self._flavors
+        self.conn.range_search.side_effect = range_search
+
+    def _flavors(self, **query):
+        for i in range(1, 9):
+            flavor = FakeResource(id=str(i), ram=512 * i, vcpus=i % 2 + 1)
+            if flavor['ram'] >= query.get('min_ram', 0):
+                self.consumed.append(flavor['id'])
+                yield flavor
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]['flavors']
+
+    def test_filters_and_limit_are_pushed_down(self):
+        flavors = self._run(ram='>=2048', vcpus='2', limit=2)
+
+        self.conn.compute.flavors.assert_called_once_with(min_ram=2048,
+                                                          limit=2)
+        self.assertEqual([f['id'] for f in flavors], ['5', '7'])
+        self.assertEqual(self.consumed, ['4', '5', '6', '7'])
+
+    def test_minimum_uses_all_flavors(self):
+        flavors = self._run(ram='MIN', vcpus='1', limit=1)
+
+        self.conn.compute.flavors.assert_called_once_with()
+        self.assertEqual(flavors, [])
@@ -0,0 +1,105 @@
+from ansible_collections.openstack.cloud.plugins.modules import probe
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    OpenStackModuleTestCase,
+)
+
+
+NETWORK_ID = '0c2b3a6c-0e1b-4b6c-a3d6-f1f5b0f9c7a1'
+IMAGE_ID = 'e0c5c4ee-0d8c-4b6b-8bbf-8c0c7ea3ee7c'
+
+
+class TestProbe(OpenStackModuleTestCase):
+
+    module = probe
+
+    def setUp(self):
+        super(TestProbe, self).setUp()
+        networks = [
+            FakeResource(id=NETWORK_ID, name='app', status='ACTIVE'),
+            FakeResource(id='net-2', name='db', status='DOWN'),
+            FakeResource(id='net-3', name='dup', status='ACTIVE'),
+            FakeResource(id='net-4', name='dup', status='ACTIVE'),
+        ]
+        images = [
+            FakeResource(id=IMAGE_ID, name='cirros', status='active'),
+            FakeResource(id='img-2', name='a,b', status='queued'),
+        ]
+        servers = [
+            FakeResource(id='srv-1', name='web1', status='ACTIVE'),
+            FakeResource(id='srv-2', name='web2', status='BUILD'),
+        ]
+
+        def list_networks(id=None, name=None, fields=None):
+            values = id or name
+            key = 'id' if id else 'name'
+            return [n for n in networks if n[key] in values]
+
+        self.conn.network.networks.side_effect = list_networks
+        self.conn.image.images.return_value = images
+        self.conn.compute.servers.return_value = servers
+
+    def _run(self, resources):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(resources=resources)
+        return ctx.exception.args[0]
+
+    def test_probe_groups_references_by_type(self):
+        result = self._run([
+            dict(type='server', name='web1'),
+            dict(type='network', name='app'),
+            dict(type='network', name=NETWORK_ID),
+            dict(type='server', name='srv-2'),
+            dict(type='network', name='dup'),
+            dict(type='network', name='missing'),
+            dict(type='server', name='missing'),
+            dict(type='server', name='web1'),
+        ])
+
+        self.assertFalse(result['changed'])
+        self.assertEqual(result['resources'], dict(
+            network=dict(
+                app=dict(exists=True, id=NETWORK_ID, matches=1,
+                         status='ACTIVE'),
+                dup=dict(exists=True, id=None, matches=2, status=None),
+                missing=dict(exists=False, id=None, matches=0,
+                             status=None),
+                **{NETWORK_ID: dict(exists=True, id=NETWORK_ID, matches=1,
+                                    status='ACTIVE')}),
+            server=dict(
+                web1=dict(exists=True, id='srv-1', matches=1,
+                          status='ACTIVE'),
+                missing=dict(exists=False, id=None, matches=0,
+                             status=None),
+                **{'srv-2': dict(exists=True, id='srv-2', matches=1,
+                                 status='BUILD')}),
+        ))
+
+        self.conn.compute.servers.assert_called_once_with()
+        self.assertEqual(
+            [c.kwargs for c in self.conn.network.networks.call_args_list],
+            [dict(id=[NETWORK_ID], fields=['id', 'name', 'status']),
+             dict(name=['app', 'dup', 'missing'],
+                  fields=['id', 'name', 'status'])])
+
+    def test_probe_images_with_in_operator(self):
+        result = self._run([
+            dict(type='image', name=IMAGE_ID),
+            dict(type='image', name='a,b'),
+        ])
+
+        self.assertEqual(result['resources']['image']['a,b']['id'], 'img-2')
+        self.assertEqual(
+            [c.kwargs for c in self.conn.image.images.call_args_list],
+            [dict(id='in:' + IMAGE_ID), dict(name='in:"a,b"')])
+
+    def test_probe_private_flavors(self):
+        self.conn.compute.flavors.return_value = [
+            FakeResource(id='flv-1', name='private')]
+
+        result = self._run([dict(type='flavor', name='private')])
+
+        self.assertEqual(result['resources']['flavor']['private']['id'],
+                         'flv-1')
+        self.conn.compute.flavors.assert_called_once_with(is_public='None')
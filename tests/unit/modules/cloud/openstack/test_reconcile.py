@@ -0,0 +1,238 @@
+import threading
+from unittest import mock
+
+from ansible_collections.openstack.cloud.plugins.modules import reconcile
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+class FakeService(object):
+    '''Stores resources of several types in memory and records calls.'''
+
+    def __init__(self, calls, **resources):
+        self.calls = calls
+        self.lock = threading.Lock()
+        self.resources = dict(
+            (type_name, [FakeResource(r) for r in items])
+            for type_name, items in resources.items())
+
+    def __getattr__(self, name):
+        action, type_name = name.split('_', 1) if '_' in name \
+            else (name, '')
+        if action not in ['create', 'delete', 'find', 'get', 'update']:
+            action, type_name = 'list', name[:-1]
+        return lambda *args, **kwargs: getattr(self, '_' + action)(
+            type_name, *args, **kwargs)
+
+    def _record(self, *call):
+        with self.lock:
+            self.calls.append(call)
+
+    def _list(self, type_name, **kwargs):
+        self._record('list', type_name)
+        return list(self.resources.get(type_name, []))
+
+    def _create(self, type_name, **attributes):
+        self._record('create', type_name, attributes['name'])
+        if attributes['name'] == 'broken':
+            raise FakeSDK.exceptions.SDKException('creation failed')
+        resource = FakeResource(attributes, id='id-' + attributes['name'])
+        self.resources.setdefault(type_name, []).append(resource)
+        return resource
+
+    def _delete(self, type_name, id):
+        self._record('delete', type_name, id)
+        self.resources[type_name] = [r for r in self.resources[type_name]
+                                     if r['id'] != id]
+
+    def _get(self, type_name, id):
+        self._record('get', type_name, id)
+        for r in self.resources.get(type_name, []):
+            if r['id'] == id:
+                return r
+        raise FakeSDK.exceptions.NotFoundException()
+
+    def _update(self, type_name, id, **attributes):
+        self._record('update', type_name, id)
+        resource = self._get(type_name, id)
+        resource.update(attributes)
+        return resource
+
+
+class TestReconcile(OpenStackModuleTestCase):
+
+    module = reconcile
+
+    def setUp(self):
+        super(TestReconcile, self).setUp()
+        self.calls = []
+
+    def _run(self, network, block_storage=None, **params):
+        params.setdefault('wait', False)
+        self.conn.network = network
+        self.conn.compute = self.compute = FakeService(self.calls)
+        self.conn.block_storage = block_storage or FakeService(self.calls)
+        self.run_module(**params)
+
+    def _calls(self, action):
+        return [c[1:] for c in self.calls if c[0] == action]
+
+    def test_create_in_dependency_order(self):
+        network = FakeService(self.calls, security_group=[
+            dict(id='sg', name='default', description='')])
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self._run(network, resources=[
+                dict(type='port', name='vip',
+                     attributes=dict(network='app',
+                                     security_groups=['default'])),
+                dict(type='subnet', name='app',
+                     attributes=dict(network='app', cidr='10.0.0.0/24',
+                                     ip_version=4)),
+                dict(type='network', name='app'),
+                dict(type='security_group', name='default',
+                     attributes=dict(description='')),
+            ])
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual([r['changed'] for r in result['resources']],
+                         [True, True, True, False])
+        self.assertEqual(result['resources'][0]['resource']['network_id'],
+                         'id-app')
+        self.assertEqual(
+            result['resources'][0]['resource']['security_group_ids'],
+            ['sg'])
+        self.assertEqual(sorted(self._calls('list')),
+                         [('network',), ('port',), ('security_group',),
+                          ('subnet',)])
+        self.assertEqual(self._calls('create')[0], ('network', 'app'))
+        self.assertEqual(self._calls('get'), [])
+
+    def test_delete_in_reverse_dependency_order(self):
+        network = FakeService(
+            self.calls,
+            network=[dict(id='net', name='app')],
+            subnet=[dict(id='subnet', name='app', network_id='net')])
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self._run(network, state='absent', resources=[
+                dict(type='network', name='app'),
+                dict(type='subnet', name='app',
+                     attributes=dict(network='app')),
+            ])
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(self._calls('delete'),
+                         [('subnet', 'subnet'), ('network', 'net')])
+
+    def test_failure_skips_dependents(self):
+        network = FakeService(self.calls)
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self._run(network, resources=[
+                dict(type='network', name='broken'),
+                dict(type='subnet', name='app',
+                     attributes=dict(network='broken', cidr='10.0.0.0/24',
+                                     ip_version=4)),
+                dict(type='security_group', name='app'),
+            ])
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual([r['failed'] for r in result['resources']],
+                         [True, True, False])
+        self.assertEqual(result['resources'][1]['msg'],
+                         'Skipped because network broken failed.')
+        self.assertNotIn(('subnet', 'app'), self._calls('create'))
+
+    def test_present_must_not_refer_to_absent(self):
+        network = FakeService(self.calls)
+
+        with self.assertRaises(AnsibleFailJson):
+            self._run(network, resources=[
+                dict(type='network', name='app', state='absent'),
+                dict(type='subnet', name='app',
+                     attributes=dict(network='app')),
+            ])
+
+        self.assertEqual(self.calls, [])
+
+    def test_failure_cascades_through_dependency_chain(self):
+        network = FakeService(self.calls)
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self._run(network, resources=[
+                dict(type='network', name='broken'),
+                dict(type='port', name='p',
+                     attributes=dict(network='broken')),
+                dict(type='server', name='s',
+                     attributes=dict(ports=['p'])),
+            ])
+
+        result = ctx.exception.args[0]
+        self.assertEqual(
+            [(r['failed'], r['msg']) for r in result['resources']],
+            [(True, 'creation failed'),
+             (True, 'Skipped because network broken failed.'),
+             (True, 'Skipped because port p failed.')])
+        self.assertEqual(self._calls('create'), [('network', 'broken')])
+
+    def test_security_groups_of_ports_are_unordered(self):
+        network = FakeService(
+            self.calls,
+            network=[dict(id='net', name='app')],
+            port=[dict(id='port', name='vip', network_id='net',
+                       security_group_ids=['sg2', 'sg1'])],
+            security_group=[dict(id='sg1', name='a'),
+                            dict(id='sg2', name='b')])
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self._run(network, resources=[
+                dict(type='port', name='vip',
+                     attributes=dict(network='app',
+                                     security_groups=['a', 'b'])),
+            ])
+
+        self.assertFalse(ctx.exception.args[0]['changed'])
+        self.assertEqual(self._calls('update'), [])
+
+    def test_server_networks_keep_order_of_attributes(self):
+        network = FakeService(
+            self.calls,
+            network=[dict(id='net', name='app')],
+            port=[dict(id='port', name='vip', network_id='net')])
+
+        with self.assertRaises(AnsibleExitJson):
+            self._run(network, resources=[
+                dict(type='server', name='s',
+                     attributes=dict(ports=['vip'], networks=['app'])),
+            ])
+
+        self.assertEqual(self.compute.resources['server'][0]['networks'],
+                         [dict(port='port'), dict(uuid='net')])
+
+    def test_update_waits_for_previous_status(self):
+        network = FakeService(self.calls)
+        block_storage = FakeService(self.calls, volume=[
+            dict(id='v', name='data', description='old', status='in-use')])
+
+        with mock.patch.object(FakeSDK, 'resource', create=True) as sdk:
+            sdk.wait_for_status.side_effect = \
+                lambda session, resource, **kwargs: resource
+            with self.assertRaises(AnsibleExitJson) as ctx:
+                self._run(network, block_storage, wait=True, resources=[
+                    dict(type='volume', name='data',
+                         attributes=dict(description='new')),
+                ])
+
+        self.assertTrue(ctx.exception.args[0]['changed'])
+        self.assertEqual(self._calls('update'), [('volume', 'v')])
+        self.assertEqual(sdk.wait_for_status.call_args.kwargs['status'],
+                         'in-use')
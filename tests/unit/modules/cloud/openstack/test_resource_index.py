@@ -0,0 +1,159 @@
+import datetime
+import os
+import sqlite3
+import tempfile
+from unittest import mock
+
+from ansible_collections.openstack.cloud.plugins.module_utils import resource_index as index
+from ansible_collections.openstack.cloud.plugins.module_utils.resource_index import (
+    connect,
+    search,
+)
+from ansible_collections.openstack.cloud.plugins.modules import resource_index
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+class TestResourceIndex(OpenStackModuleTestCase):
+
+    module = resource_index
+
+    def setUp(self):
+        super(TestResourceIndex, self).setUp()
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        self.conn.compute.servers.return_value = [
+            FakeResource(id='1', name='web1', status='ACTIVE'),
+            FakeResource(id='2', name='web2', status='BUILD'),
+        ]
+        self.conn.block_storage.volumes.return_value = [
+            FakeResource(id='v1', name='data', status='available'),
+            FakeResource(id='v2', name='logs', status='in-use'),
+        ]
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(path=self.path, types=['server', 'volume'],
+                            **params)
+        return ctx.exception.args[0]
+
+    def _search(self, *args, **kwargs):
+        db = connect(self.path)
+        try:
+            return search(db, *args, **kwargs)
+        finally:
+            db.close()
+
+    def test_incremental_refresh(self):
+        result = self._run()
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['counts'], dict(server=2, volume=2))
+        self.conn.compute.servers.assert_called_once_with()
+        self.conn.block_storage.volumes.assert_called_once_with()
+
+        self.conn.compute.servers.reset_mock()
+        self.conn.compute.servers.return_value = [
+            FakeResource(id='1', name='web1', status='DELETED'),
+            FakeResource(id='2', name='web2', status='ACTIVE'),
+        ]
+        self.conn.block_storage.volumes.reset_mock()
+        self.conn.block_storage.volumes.side_effect = [
+            [FakeResource(id='v2', name='logs', status='available')],
+            [FakeResource(id='v2')],
+        ]
+
+        result = self._run()
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['counts'], dict(server=1, volume=1))
+        self.assertIn('changes_since',
+                      self.conn.compute.servers.call_args.kwargs)
+        self.assertEqual(
+            [c.kwargs for c in
+             self.conn.block_storage.volumes.call_args_list][1],
+            dict(details=False))
+        self.assertEqual(self._search('server'),
+                         [dict(id='2', name='web2', status='ACTIVE')])
+        self.assertEqual(self._search('volume', ['logs']),
+                         [dict(id='v2', name='logs', status='available')])
+
+    def test_incremental_refresh_starts_before_last_refresh(self):
+        self._run()
+        self._run()
+
+        since = datetime.datetime.strptime(
+            self.conn.compute.servers.call_args.kwargs['changes_since'],
+            '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=datetime.timezone.utc)
+        self.assertLessEqual(
+            since, datetime.datetime.now(datetime.timezone.utc)
+            - resource_index.SINCE_MARGIN)
+
+    def test_full_refresh_unchanged(self):
+        self._run()
+        result = self._run(refresh='full')
+
+        self.assertFalse(result['changed'])
+        self.assertEqual(self.conn.compute.servers.call_args.kwargs, dict())
+
+    def test_check_mode_does_not_write(self):
+        result = self._run(_ansible_check_mode=True)
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['counts'], dict(server=2, volume=2))
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        os.remove(self.path)
+        self._run(_ansible_check_mode=True)
+        self.assertFalse(os.path.exists(self.path))
+        open(self.path, 'w').close()
+
+    def test_volumes_without_microversion_are_listed_completely(self):
+        self._run()
+        self.conn.block_storage.volumes.reset_mock()
+
+        with mock.patch.object(FakeSDK.utils, 'supports_microversion',
+                               return_value=False):
+            result = self._run()
+
+        self.assertFalse(result['changed'])
+        self.conn.block_storage.volumes.assert_called_once_with()
+
+    def test_search(self):
+        self._run()
+
+        self.assertEqual(
+            [r['id'] for r in self._search('server', ['2', 'web1'])],
+            ['2', '1'])
+        self.assertEqual(
+            [r['id'] for r in self._search('server',
+                                           filters=dict(status='BUILD'))],
+            ['2'])
+
+    def test_search_in_chunks(self):
+        self._run()
+
+        with mock.patch.object(index, 'CHUNK_SIZE', 1):
+            self.assertEqual(
+                [r['id'] for r in self._search('server',
+                                               ['2', 'web1', 'web2'])],
+                ['2', '1', '2'])
+
+    def test_read_only_does_not_create_index(self):
+        os.remove(self.path)
+        with self.assertRaises(sqlite3.OperationalError):
+            connect(self.path, read_only=True)
+        self.assertFalse(os.path.exists(self.path))
+        open(self.path, 'w').close()
+
+        db = connect(self.path, read_only=True)
+        try:
+            self.assertEqual(db.execute(
+                "SELECT COUNT(*) FROM sqlite_master").fetchone(), (0,))
+        finally:
+            db.close()
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+
+from ansible_collections.openstack.cloud.plugins.modules import resources
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    FakeResource,
+    OpenStackModuleTestCase,
+)
+
+
+class TestResources(OpenStackModuleTestCase):
+
+    module = resources
+
+    def setUp(self):
+        super(TestResources, self).setUp()
+        self.consumed = []
+        self.conn.network.ports.side_effect = self._ports
+        self.conn.compute.servers.return_value = [
+            FakeResource(id='s1', name='server', status='ACTIVE')]
+
+    def _ports(self, **parameters):
+        for i in range(10):
+            self.consumed.append(i)
+            yield FakeResource(id='p{0}'.format(i),
+                               fixed_ips=[dict(ip_address='10.0.0.1',
+                                               subnet_id='subnet')])
+
+    def test_single_query(self):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(service='compute', type='server')
+
+        self.assertEqual(ctx.exception.args[0]['resources'],
+                         [dict(id='s1', name='server', status='ACTIVE')])
+
+    def test_queries(self):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(queries=[
+                dict(name='ports', service='network', type='port',
+                     fields=['id', 'fixed_ips.ip_address'], limit=2),
+                dict(name='servers', service='compute', type='server',
+                     parameters=dict(all_projects=True)),
+            ])
+
+        results = ctx.exception.args[0]['results']
+        self.assertEqual(results['ports'], [
+            dict(id='p0', fixed_ips=[dict(ip_address='10.0.0.1')]),
+            dict(id='p1', fixed_ips=[dict(ip_address='10.0.0.1')])])
+        self.assertEqual(len(results['servers']), 1)
+        self.assertEqual(self.consumed, [0, 1])
+        self.conn.compute.servers.assert_called_once_with(all_projects=True)
+
+    def test_queries_require_unique_names(self):
+        with self.assertRaises(AnsibleFailJson):
+            self.run_module(queries=[
+                dict(name='servers', service='compute', type='server'),
+                dict(name='servers', service='compute', type='server'),
+            ])
+
+    def test_pagination(self):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(service='network', type='port', page_size=3,
+                            limit=4, marker='p9',
+                            parameters=dict(device_id='d'))
+
+        self.assertEqual(len(ctx.exception.args[0]['resources']), 4)
+        self.assertEqual(self.consumed, [0, 1, 2, 3])
+        self.conn.network.ports.assert_called_once_with(
+            device_id='d', limit=3, marker='p9')
+
+    def test_output_file(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(service='network', type='port', output_file=path)
+
+        result = ctx.exception.args[0]
+        self.assertEqual(result['count'], 10)
+        self.assertNotIn('resources', result)
+        with open(path) as f:
+            ports = [json.loads(line) for line in f]
+        self.assertEqual([p['id'] for p in ports],
+                         ['p{0}'.format(i) for i in range(10)])
+
+    def test_output_file_check_mode(self):
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b'old\n')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(service='network', type='port', output_file=path,
+                            _ansible_check_mode=True)
+
+        self.assertEqual(ctx.exception.args[0]['count'], 10)
+        with open(path) as f:
+            self.assertEqual(f.read(), 'old\n')
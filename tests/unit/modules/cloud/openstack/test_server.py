@@ -1,11 +1,21 @@
 import collections
 import inspect
+import os
 import pytest
+import tempfile
+import time
 from unittest import mock
 import yaml
 
 from ansible.module_utils.six import string_types
 from ansible_collections.openstack.cloud.plugins.modules import server as os_server
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
 
 
 class AnsibleFail(Exception):
@@ -262,3 +272,378 @@ class TestCreateServer(object):
             os_server._create_server(self.module, self.cloud)
 
         assert 'floating_ip_pools' in self.module.fail_json.call_args[1]['msg']
+
+
+class TestFleet(OpenStackModuleTestCase):
+
+    module = os_server
+
+    def setUp(self):
+        super(TestFleet, self).setUp()
+        self.conn.get_image_exclude.return_value = FakeResource(id='image')
+        self.conn.compute.find_flavor.return_value = FakeResource(id='flavor')
+        self.conn.get_default_network.return_value = None
+
+    def _run(self, **params):
+        params = dict(dict(name='web-%d', count=3, image='cirros',
+                           flavor='m1.tiny', auto_ip=False), **params)
+        self.run_module(**params)
+
+    def test_create_fleet(self):
+        listings = [
+            [FakeResource(id='1', name='web-1', status='ACTIVE')],
+            [FakeResource(id='1', name='web-1', status='ACTIVE'),
+             FakeResource(id='3', name='web-3', status='BUILD')],
+            [FakeResource(id='1', name='web-1', status='ACTIVE'),
+             FakeResource(id='3', name='web-3', status='ACTIVE')],
+        ]
+        self.conn.compute.servers.side_effect = listings
+
+        def create_server(name, **kwargs):
+            if name == 'web-2':
+                raise FakeSDK.exceptions.SDKException('quota exceeded')
+            return FakeResource(id='3', name=name, status='BUILD')
+        self.conn.create_server.side_effect = create_server
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self._run()
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['name'], r['changed'], r['failed'])
+             for r in result['servers']],
+            [('web-1', False, False), ('web-2', False, True),
+             ('web-3', True, False)])
+        self.assertEqual(result['servers'][1]['msg'], 'quota exceeded')
+        self.assertEqual(result['servers'][2]['server']['status'], 'ACTIVE')
+
+        # Image and flavor are resolved once for all servers
+        self.conn.get_image_exclude.assert_called_once_with(
+            'cirros', '(deprecated)')
+        self.conn.compute.find_flavor.assert_called_once_with(
+            'm1.tiny', ignore_missing=False)
+        self.assertEqual(
+            sorted(c.kwargs['name']
+                   for c in self.conn.create_server.call_args_list),
+            ['web-2', 'web-3'])
+        self.assertFalse(self.conn.create_server.call_args.kwargs['wait'])
+        self.assertEqual(
+            [c.kwargs for c in self.conn.compute.servers.call_args_list],
+            [dict(name='^web-')] * 3)
+        self.conn.compute.get_server.assert_not_called()
+
+    def test_create_fleet_resolves_resources_once(self):
+        self.conn.compute.servers.return_value = []
+        self.conn.network.networks.return_value = [
+            FakeResource(id='net-1', name='app')]
+        self.conn.create_server.side_effect = \
+            lambda name, **kwargs: FakeResource(id=name, name=name,
+                                                status='BUILD')
+
+        with self.assertRaises(AnsibleExitJson):
+            self._run(network='app', wait=False)
+
+        self.assertEqual(self.conn.create_server.call_count, 3)
+        self.conn.get_image_exclude.assert_called_once()
+        self.conn.compute.find_flavor.assert_called_once()
+        self.conn.network.networks.assert_called_once_with(
+            fields=['id', 'name'], name=['app'])
+        for c in self.conn.create_server.call_args_list:
+            # Resources are passed, so create_server() does not look up
+            # flavor, image and network again
+            self.assertIs(c.kwargs['flavor'],
+                          self.conn.compute.find_flavor.return_value)
+            self.assertIs(c.kwargs['image'],
+                          self.conn.get_image_exclude.return_value)
+            self.assertEqual(c.kwargs['nics'], [{'net-id': 'net-1'}])
+            self.assertNotIn('network', c.kwargs)
+
+    def test_create_fleet_uses_default_network_once(self):
+        self.conn.compute.servers.return_value = []
+        self.conn.get_default_network.return_value = FakeResource(id='net-2')
+
+        with self.assertRaises(AnsibleExitJson):
+            self._run(wait=False)
+
+        self.conn.get_default_network.assert_called_once_with()
+        self.assertEqual(
+            [c.kwargs['nics']
+             for c in self.conn.create_server.call_args_list],
+            [[{'net-id': 'net-2'}]] * 3)
+
+    def test_create_fleet_check_mode(self):
+        self.conn.compute.servers.return_value = [
+            FakeResource(id='1', name='web-1', status='ACTIVE')]
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self._run(_ansible_check_mode=True)
+
+        self.assertTrue(ctx.exception.args[0]['changed'])
+        self.conn.create_server.assert_not_called()
+
+    def test_delete_fleet(self):
+        self.conn.compute.servers.side_effect = [
+            [FakeResource(id='1', name='web-1', status='ACTIVE'),
+             FakeResource(id='2', name='web-2', status='ACTIVE'),
+             FakeResource(id='9', name='web-10', status='ACTIVE')],
+            [FakeResource(id='9', name='web-10', status='ACTIVE')],
+        ]
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self._run(state='absent')
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual([r['name'] for r in result['servers']],
+                         ['web-1', 'web-2'])
+        self.assertEqual(
+            sorted(c.args[0] for c in self.conn.delete_server.call_args_list),
+            ['1', '2'])
+
+    def test_name_must_be_pattern(self):
+        with self.assertRaises(AnsibleFailJson):
+            self._run(name='web')
+
+
+class TestUpdateSecurityGroups(OpenStackModuleTestCase):
+
+    module = os_server
+
+    def setUp(self):
+        super(TestUpdateSecurityGroups, self).setUp()
+        self.server = FakeResource(
+            id='server', name='web', status='ACTIVE', addresses={},
+            metadata={}, tags=[])
+        self.conn.compute.find_server.return_value = self.server
+        self.conn.compute.get_server.return_value = self.server
+        self.conn.compute.fetch_server_security_groups.return_value = \
+            FakeResource(self.server, security_groups=[
+                dict(id='1c7e2b44-6f8f-4f8e-9d7a-2f4b6b0b5a01', name='web'),
+                dict(id='9a4c0c55-6a2e-4d0b-8e47-2b9d9f1f3c02', name='ssh'),
+            ])
+
+    def _run(self, security_groups):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(name='web', image='cirros', flavor='m1.tiny',
+                            auto_ip=False, security_groups=security_groups)
+        return ctx.exception.args[0]
+
+    def test_unchanged_security_groups_call_budget(self):
+        result = self._run(['web', '9a4c0c55-6a2e-4d0b-8e47-2b9d9f1f3c02'])
+
+        self.assertFalse(result['changed'])
+        self.conn.compute.fetch_server_security_groups.assert_called_once()
+        self.assertEqual(self.conn.network.method_calls, [])
+        self.assertEqual(
+            [c[0] for c in self.conn.compute.method_calls],
+            ['find_server', 'fetch_server_security_groups'])
+
+    def test_changed_security_groups_are_listed_once(self):
+        self.conn.network.security_groups.return_value = [
+            FakeResource(id='3', name='db'), FakeResource(id='4', name='lb')]
+
+        result = self._run(['web', 'db', 'lb'])
+
+        self.assertTrue(result['changed'])
+        self.conn.network.security_groups.assert_called_once_with(
+            fields=['id', 'name'], name=['db', 'lb'])
+        self.assertEqual(
+            [c.args[1]['id'] for c in self.conn.compute
+             .add_security_group_to_server.call_args_list],
+            ['3', '4'])
+        self.assertEqual(
+            [c.args[1]['name'] for c in self.conn.compute
+             .remove_security_group_from_server.call_args_list],
+            ['ssh'])
+
+
+class TestUpdate(OpenStackModuleTestCase):
+
+    module = os_server
+
+    def setUp(self):
+        super(TestUpdate, self).setUp()
+        self.server = FakeResource(
+            id='server', name='web', status='ACTIVE', addresses={},
+            metadata=dict(a='1', b='2'), tags=['old'])
+        self.conn.compute.find_server.return_value = self.server
+        self.conn.create_server.return_value = self.server
+
+    def _run(self, **params):
+        params = dict(dict(name='web', image='cirros', flavor='m1.tiny',
+                           auto_ip=False, metadata=dict(a='1', b='2'),
+                           tags=['old']), **params)
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]
+
+    def test_unchanged_does_not_put_tags(self):
+        result = self._run()
+
+        self.assertFalse(result['changed'])
+        self.conn.compute.put.assert_not_called()
+        self.conn.compute.get_server.assert_not_called()
+
+    def test_tags_and_metadata_are_updated_without_refetch(self):
+        result = self._run(tags=[], metadata=dict(a='3', c='4'))
+
+        self.assertTrue(result['changed'])
+        self.conn.compute.put.assert_called_once_with(
+            '/servers/server/tags', json=dict(tags=[]), microversion='2.26')
+        self.conn.compute.set_server_metadata.assert_called_once_with(
+            'server', a='3', c='4')
+        self.assertEqual(
+            list(self.conn.compute.delete_server_metadata.call_args.args[1]),
+            ['b'])
+        self.conn.compute.get_server.assert_not_called()
+        self.assertEqual(result['server']['tags'], [])
+        self.assertEqual(result['server']['metadata'], dict(a='3', c='4'))
+
+    def test_create_minimal(self):
+        self.conn.compute.find_server.return_value = None
+        self.conn.get_image_exclude.return_value = FakeResource(id='image')
+        self.conn.compute.find_flavor.return_value = FakeResource(id='flavor')
+
+        result = self._run(return_server='minimal')
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['server'],
+                         dict(id='server', name='web', status='ACTIVE'))
+        self.conn.create_server.assert_called_once()
+        self.conn.compute.get_server.assert_not_called()
+
+    def test_plan_round_trip_by_name(self):
+        fd, plan_file = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, plan_file)
+        # Nova's show response has attributes which listings lack
+        self.conn.compute.get_server.return_value = FakeResource(
+            self.server, server_groups=['group'])
+
+        result = self._run(metadata=dict(a='3'), plan_file=plan_file,
+                           _ansible_check_mode=True)
+        self.assertTrue(result['changed'])
+        self.conn.compute.find_server.reset_mock()
+
+        result = self._run(metadata=dict(a='3'), plan_file=plan_file)
+
+        self.assertTrue(result['changed'])
+        # The plan is used, so the server is not looked up by name again
+        self.conn.compute.find_server.assert_not_called()
+        self.conn.compute.set_server_metadata.assert_called_once_with(
+            'server', a='3')
+
+
+class TestUpdateFloatingIps(OpenStackModuleTestCase):
+
+    module = os_server
+
+    def setUp(self):
+        super(TestUpdateFloatingIps, self).setUp()
+
+        def server(*ips):
+            return FakeResource(
+                id='server', name='web', status='ACTIVE', metadata={},
+                tags=[], addresses=dict(private=[
+                    {'addr': '10.0.0.5', 'OS-EXT-IPS:type': 'fixed'}] + [
+                    {'addr': ip, 'OS-EXT-IPS:type': 'floating'}
+                    for ip in ips]))
+
+        self.conn.compute.find_server.return_value = \
+            server('1.1.1.1', '2.2.2.2')
+        self.conn.compute.get_server.side_effect = [
+            server('2.2.2.2'), server('2.2.2.2', '3.3.3.3')]
+        self.conn.network.ips.return_value = [
+            FakeResource(id='ip1', floating_ip_address='1.1.1.1'),
+            FakeResource(id='ip3', floating_ip_address='3.3.3.3')]
+        self.conn.network.ports.return_value = [
+            FakeResource(id='port', fixed_ips=[
+                dict(ip_address='10.0.0.5', subnet_id='subnet')])]
+
+    def test_floating_ips_are_attached_and_detached_concurrently(self):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(name='web', image='cirros', flavor='m1.tiny',
+                            floating_ips=['2.2.2.2', '3.3.3.3'])
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.conn.network.ips.assert_called_once_with(
+            floating_ip_address=['3.3.3.3', '1.1.1.1'])
+        self.conn.network.ports.assert_called_once_with(device_id='server')
+        self.assertEqual(
+            sorted((c.args[0]['id'], c.kwargs.get('port_id'))
+                   for c in self.conn.network.update_ip.call_args_list),
+            [('ip1', None), ('ip3', 'port')])
+        self.conn.add_ip_list.assert_not_called()
+        self.conn.detach_ip_from_server.assert_not_called()
+        # Server is polled until all changes are reported and not refreshed
+        # again afterwards
+        self.assertEqual(self.conn.compute.get_server.call_count, 2)
+        self.assertEqual(
+            [a['addr'] for a in result['server']['addresses']['private']],
+            ['10.0.0.5', '2.2.2.2', '3.3.3.3'])
+
+
+class TestParseNics(OpenStackModuleTestCase):
+
+    module = os_server
+
+    def setUp(self):
+        super(TestParseNics, self).setUp()
+        self.conn.get_image_exclude.return_value = FakeResource(id='image')
+        self.conn.compute.find_flavor.return_value = FakeResource(id='flavor')
+        self.conn.compute.servers.return_value = []
+        self.conn.create_server.return_value = FakeResource(
+            id='1', name='web-1', status='BUILD')
+        self.conn.network.networks.return_value = [
+            FakeResource(id='net-1', name='app'),
+            FakeResource(id='net-2', name='db')]
+        self.conn.network.ports.return_value = [
+            FakeResource(id='port-1', name='vip')]
+
+        fd, self.cache = tempfile.mkstemp()
+        os.close(fd)
+        os.remove(self.cache)
+        self.addCleanup(
+            lambda: os.path.exists(self.cache) and os.remove(self.cache))
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson):
+            self.run_module(name='web-%d', count=2, image='cirros',
+                            flavor='m1.tiny', auto_ip=False, wait=False,
+                            nics=[{'net-name': 'app'}, {'net-name': 'db'},
+                                  {'net-name': 'app'}, {'net-id': 'net-3'},
+                                  {'port-name': 'vip'}],
+                            **params)
+
+    def test_nics_are_resolved_with_one_listing_per_type(self):
+        self._run()
+
+        self.conn.network.networks.assert_called_once_with(
+            fields=['id', 'name'], name=['app', 'db'])
+        self.conn.network.ports.assert_called_once_with(
+            fields=['id', 'name'], name=['vip'])
+        self.conn.network.find_network.assert_not_called()
+        self.conn.network.find_port.assert_not_called()
+        self.assertEqual(
+            self.conn.create_server.call_args.kwargs['nics'],
+            [{'net-id': 'net-1'}, {'net-id': 'net-2'}, {'net-id': 'net-1'},
+             {'net-id': 'net-3'}, {'port-id': 'port-1'}])
+
+    def test_nics_cache_is_shared_between_runs(self):
+        self._run(nics_cache=self.cache)
+        self._run(nics_cache=self.cache)
+
+        self.conn.network.networks.assert_called_once()
+        self.conn.network.ports.assert_called_once()
+        self.assertEqual(
+            self.conn.create_server.call_args.kwargs['nics'][-1],
+            {'port-id': 'port-1'})
+
+    def test_nics_cache_entries_expire(self):
+        self._run(nics_cache=self.cache)
+        with mock.patch('time.time', return_value=time.time() + 301):
+            self._run(nics_cache=self.cache)
+
+        self.assertEqual(self.conn.network.networks.call_count, 2)
@@ -0,0 +1,186 @@
+from unittest import mock
+
+from ansible_collections.openstack.cloud.plugins.module_utils.server_wait import get_interval
+from ansible_collections.openstack.cloud.plugins.modules import server_action
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+def server(id, name, status, is_locked=False, task_state=None):
+    return FakeResource(id=id, name=name, status=status, is_locked=is_locked,
+                        task_state=task_state, fault=None)
+
+
+class TestServerAction(OpenStackModuleTestCase):
+
+    module = server_action
+
+    def test_stop_many_servers(self):
+        self.conn.compute.servers.side_effect = [
+            [server('1', 'web-1', 'ACTIVE'), server('2', 'web-2', 'ACTIVE'),
+             server('3', 'web-3', 'SHUTOFF')],
+            [server('1', 'web-1', 'SHUTOFF'), server('2', 'web-2', 'ACTIVE'),
+             server('3', 'web-3', 'SHUTOFF'), server('4', 'db', 'ACTIVE')],
+        ]
+        self.conn.compute.get_server.return_value = \
+            server('2', 'web-2', 'SHUTOFF')
+
+        with mock.patch.object(server_action, 'MAX_FETCHED_SERVERS', 1):
+            with self.assertRaises(AnsibleExitJson) as ctx:
+                self.run_module(action='stop', filters=dict(name='^web-'))
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['name'], r['changed'], r['failed'])
+             for r in result['servers']],
+            [('web-1', True, False), ('web-2', True, False),
+             ('web-3', False, False)])
+        self.assertEqual(
+            sorted(c.args[0]['id']
+                   for c in self.conn.compute.stop_server.call_args_list),
+            ['1', '2'])
+        calls = [c.kwargs for c in self.conn.compute.servers.call_args_list]
+        self.assertEqual(calls[0],
+                         dict(details=True, all_projects=False, name='^web-'))
+        # Only servers which have changed since the actions are listed
+        self.assertEqual(sorted(calls[1]),
+                         ['all_projects', 'changes_since', 'details'])
+        # Once a single server is pending, it is fetched by id
+        self.conn.compute.get_server.assert_called_once_with('2')
+
+    def test_few_servers_are_fetched_by_id(self):
+        self.conn.compute.servers.return_value = [
+            server('1', 'web-1', 'ACTIVE'), server('2', 'web-2', 'ACTIVE')]
+        self.conn.compute.get_server.side_effect = [
+            server('1', 'web-1', 'SHUTOFF'),
+            FakeSDK.exceptions.NotFoundException('gone'),
+            server('2', 'web-2', 'SHUTOFF')]
+
+        with self.assertRaises(AnsibleExitJson):
+            self.run_module(action='stop', names=['web-1', 'web-2'])
+
+        self.assertEqual(self.conn.compute.servers.call_count, 1)
+        self.assertEqual(
+            sorted(c.args[0]
+                   for c in self.conn.compute.get_server.call_args_list),
+            ['1', '2', '2'])
+
+    def test_single_server_fails_with_error_of_action(self):
+        self.conn.get_server.return_value = server('1', 'web-1', 'ACTIVE')
+        self.conn.compute.stop_server.side_effect = \
+            FakeSDK.exceptions.SDKException('conflict')
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self.run_module(action='stop', name='web-1')
+
+        self.assertEqual(ctx.exception.args[0]['msg'], 'conflict')
+
+    def test_single_server_fails_with_timeout(self):
+        self.conn.get_server.return_value = server('1', 'web-1', 'ACTIVE')
+        self.conn.compute.get_server.return_value = \
+            server('1', 'web-1', 'ACTIVE')
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self.run_module(action='stop', name='web-1')
+
+        self.assertEqual(ctx.exception.args[0]['msg'],
+                         'Timeout waiting for action stop to be completed.')
+
+    def test_partial_failure(self):
+        self.conn.compute.servers.return_value = [
+            server('1', 'web-1', 'ACTIVE'), server('2', 'web-2', 'ACTIVE')]
+        self.conn.compute.get_server.return_value = \
+            server('1', 'web-1', 'ACTIVE')
+
+        def reboot_server(server, reboot_type):
+            if server['id'] == '2':
+                raise FakeSDK.exceptions.SDKException('conflict')
+        self.conn.compute.reboot_server.side_effect = reboot_server
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self.run_module(action='reboot_hard', names=['web-1', '2'])
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['id'], r['changed'], r['failed'], r.get('msg'))
+             for r in result['servers']],
+            [('1', True, False, None), ('2', False, True, 'conflict')])
+        # Only the server whose action succeeded is waited for
+        self.assertEqual(self.conn.compute.servers.call_count, 1)
+        self.conn.compute.get_server.assert_called_once_with('1')
+
+    def test_single_server_keeps_lookup(self):
+        self.conn.get_server.return_value = server('1', 'web-1', 'SHUTOFF')
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(action='stop', name='web-1')
+
+        self.assertFalse(ctx.exception.args[0]['changed'])
+        self.conn.get_server.assert_called_once_with(
+            name_or_id='web-1', detailed=True, all_projects=False)
+        self.conn.compute.stop_server.assert_not_called()
+
+    def test_single_name_with_comma(self):
+        self.conn.get_server.return_value = server('1', 'web,1', 'SHUTOFF')
+
+        with self.assertRaises(AnsibleExitJson):
+            self.run_module(action='stop', name='web,1')
+
+        self.conn.get_server.assert_called_once_with(
+            name_or_id='web,1', detailed=True, all_projects=False)
+
+    def test_ambiguous_names(self):
+        self.conn.compute.servers.return_value = [
+            server('1', 'web', 'ACTIVE'), server('2', 'web', 'ACTIVE')]
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self.run_module(action='stop', names=['web'])
+
+        self.assertEqual(ctx.exception.args[0]['msg'],
+                         'Multiple Servers found for web')
+        self.conn.compute.stop_server.assert_not_called()
+
+    def test_adaptive_wait_fails_fast(self):
+        self.conn.compute.servers.side_effect = [
+            [server('1', 'web-1', 'ACTIVE'), server('2', 'web-2', 'ACTIVE'),
+             server('3', 'web-3', 'ACTIVE')],
+            [server('1', 'web-1', 'SHUTOFF'), server('2', 'web-2', 'ACTIVE'),
+             server('3', 'web-3', 'ACTIVE', task_state='powering-off')],
+        ]
+        self.conn.compute.get_server.return_value = \
+            server('3', 'web-3', 'SHUTOFF')
+        self.conn.compute.server_actions.return_value = [
+            FakeResource(action='stop', message='Error'),
+            FakeResource(action='start', message=None)]
+
+        with mock.patch('time.sleep') as sleep, \
+                mock.patch.object(server_action, 'MAX_FETCHED_SERVERS', 1):
+            with self.assertRaises(AnsibleFailJson) as ctx:
+                self.run_module(action='stop', filters=dict(name='^web-'),
+                                wait_strategy='adaptive')
+
+        result = ctx.exception.args[0]
+        self.assertEqual(
+            [(r['id'], r['failed'], r.get('msg')) for r in result['servers']],
+            [('1', False, None),
+             ('2', True, 'Action stop failed for server 2: Error'),
+             ('3', False, None)])
+        # Instance actions are only listed for the server without task
+        self.conn.compute.server_actions.assert_called_once_with('2')
+        self.assertEqual(self.conn.compute.servers.call_count, 2)
+        self.conn.compute.get_server.assert_called_once_with('3')
+        sleep.assert_called_once()
+
+    def test_adaptive_intervals(self):
+        self.assertEqual(get_interval('reboot', 0), 1)
+        self.assertEqual(get_interval('reboot', 600), 5)
+        self.assertEqual(get_interval('rebuild', 0), 5)
+        self.assertEqual(get_interval('rebuild', 80), 20)
+        self.assertEqual(get_interval('rebuild', 600), 30)
@@ -0,0 +1,64 @@
+from ansible_collections.openstack.cloud.plugins.modules import server_group_info
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    OpenStackModuleTestCase,
+)
+
+
+def server_group(id, name, policy, member_ids=(), rules=None):
+    return FakeResource(id=id, name=name, policy=policy, policies=None,
+                        member_ids=list(member_ids), rules=rules)
+
+
+class TestServerGroupInfo(OpenStackModuleTestCase):
+
+    module = server_group_info
+
+    def setUp(self):
+        super(TestServerGroupInfo, self).setUp()
+        self.conn.compute.server_groups.return_value = [
+            server_group('1', 'web', 'anti-affinity', ['a', 'b']),
+            server_group('2', 'db', 'anti-affinity', ['c'],
+                         rules=dict(max_server_per_host=2)),
+            server_group('3', 'cache', 'affinity', ['d']),
+            server_group('4', 'full', 'anti-affinity', ['e', 'f', 'g', 'h']),
+        ]
+        self.conn.compute.hypervisors.return_value = [
+            dict(state='up', status='enabled'),
+            dict(state='up', status='enabled'),
+            dict(state='up', status='disabled'),
+            dict(state='down', status='enabled'),
+        ]
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]
+
+    def test_capacity(self):
+        result = self._run(name=['db', '1', 'cache', 'full', 'missing'],
+                           capacity=True)
+
+        self.assertFalse(result['changed'])
+        self.assertEqual(
+            [(sg['name'], sg['capacity']) for sg in result['server_groups']],
+            [('db', 3), ('web', 0), ('cache', None), ('full', 0)])
+        self.conn.compute.server_groups.assert_called_once_with(
+            all_projects=False)
+        self.conn.compute.hypervisors.assert_called_once_with()
+
+    def test_without_capacity(self):
+        result = self._run()
+
+        self.assertEqual([sg['id'] for sg in result['server_groups']],
+                         ['1', '2', '3', '4'])
+        self.assertNotIn('capacity', result['server_groups'][0])
+        self.conn.compute.hypervisors.assert_not_called()
+
+    def test_fields(self):
+        result = self._run(name=['web'], capacity=True,
+                           fields=['name', 'capacity'])
+
+        self.assertEqual(result['server_groups'],
+                         [dict(name='web', capacity=0)])
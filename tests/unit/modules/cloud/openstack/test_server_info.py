@@ -0,0 +1,157 @@
+from unittest import mock
+
+from ansible_collections.openstack.cloud.plugins.modules import server_info
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+class FakeServerInfoSDK(FakeSDK):
+    class cloud:
+        class meta:
+            @staticmethod
+            def get_server_external_ipv4(cloud, server):
+                return next((a['addr']
+                             for network in server['addresses'].values()
+                             for a in network
+                             if a.get('OS-EXT-IPS:type') == 'floating'),
+                            None)
+
+            @staticmethod
+            def get_server_external_ipv6(server):
+                return None
+
+            @staticmethod
+            def get_server_private_ip(server, cloud):
+                return server['addresses']['private'][0]['addr']
+
+            @staticmethod
+            def _get_interface_ip(cloud, server):
+                return server['public_v4'] or server['private_v4']
+
+
+def server(id, flavor_id, image_id, volume_ids=()):
+    return FakeResource(
+        id=id, name=id, status='ACTIVE',
+        flavor=dict(id=flavor_id), image=dict(id=image_id),
+        attached_volumes=[dict(id=i) for i in volume_ids],
+        addresses=dict(private=[{'addr': '10.0.0.{0}'.format(id[-1]),
+                                 'version': 4,
+                                 'OS-EXT-IPS:type': 'fixed'}]))
+
+
+class TestServerInfo(OpenStackModuleTestCase):
+
+    module = server_info
+    sdk = FakeServerInfoSDK
+
+    def setUp(self):
+        super(TestServerInfo, self).setUp()
+        self.conn.force_ipv4 = False
+        self.conn.private = False
+        self.conn.has_service.return_value = True
+        self.conn.search_servers.return_value = [
+            server('s1', 'f1', 'i1'),
+            server('s2', 'f1', 'i1'),
+            server('s3', 'f2', 'i1', ['v1'])]
+        self.conn.network.ports.return_value = [
+            FakeResource(id='p1', device_id='s1', mac_address='m1',
+                         security_group_ids=['sg1', 'sg2']),
+            FakeResource(id='p2', device_id='s2', mac_address='m2',
+                         security_group_ids=['sg1'])]
+        self.conn.network.ips.return_value = [
+            FakeResource(id='ip1', port_id='p1',
+                         fixed_ip_address='10.0.0.1',
+                         floating_ip_address='172.24.4.1')]
+        security_groups = dict(
+            s1=[dict(name='default', rules=[]), dict(name='web', rules=[])],
+            s2=[dict(name='default', rules=[])])
+        self.conn.compute.fetch_server_security_groups.side_effect = \
+            lambda server: FakeResource(
+                server, security_groups=security_groups.get(server['id']))
+        self.conn.block_storage.volumes.return_value = [
+            FakeResource(id='v1', attachments=[
+                dict(server_id='s3', device='/dev/vdb')])]
+        self.conn.block_storage.get_volume.side_effect = \
+            lambda id: FakeResource(id=id, attachments=[
+                dict(server_id='s3', device='/dev/vdb')])
+        self.conn.compute.get_flavor.side_effect = \
+            lambda id: FakeResource(id=id, name='flavor-' + id)
+        self.conn.image.get_image.side_effect = \
+            lambda id: FakeResource(id=id, name='image-' + id)
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]['servers']
+
+    def test_bulk_details(self):
+        servers = self._run(detailed=True, bulk_details=True)
+
+        self.conn.search_servers.assert_called_once_with(
+            name_or_id=None, filters=None, all_projects=False, bare=True)
+        # Only resources of the servers found are fetched
+        self.conn.network.ports.assert_called_once_with(
+            device_id=['s1', 's2', 's3'])
+        self.conn.network.ips.assert_called_once_with(port_id=['p1', 'p2'])
+        # Security groups are fetched from Nova like without bulk_details
+        self.assertEqual(
+            sorted(c.args[0]['id'] for c in self.conn.compute
+                   .fetch_server_security_groups.call_args_list),
+            ['s1', 's2', 's3'])
+        self.conn.network.security_groups.assert_not_called()
+        self.conn.block_storage.get_volume.assert_called_once_with('v1')
+        self.conn.block_storage.volumes.assert_not_called()
+        self.assertEqual(self.conn.compute.get_flavor.call_count, 2)
+        self.conn.image.get_image.assert_called_once_with('i1')
+
+        s1, s2, s3 = servers
+        self.assertEqual(s1['public_v4'], '172.24.4.1')
+        self.assertEqual(s1['interface_ip'], '172.24.4.1')
+        self.assertEqual(s1['access_ipv4'], '172.24.4.1')
+        self.assertEqual(s1['addresses']['private'][1]['OS-EXT-IPS:type'],
+                         'floating')
+        self.assertEqual(s1['security_groups'],
+                         [dict(name='default', rules=[]),
+                          dict(name='web', rules=[])])
+        self.assertEqual(s1['flavor']['name'], 'flavor-f1')
+        self.assertEqual(s1['image']['name'], 'image-i1')
+        self.assertEqual(s1['volumes'], [])
+
+        self.assertEqual(s2['public_v4'], '')
+        self.assertEqual(s2['private_v4'], '10.0.0.2')
+        self.assertEqual(s2['interface_ip'], '10.0.0.2')
+
+        self.assertEqual(s3['flavor']['name'], 'flavor-f2')
+        self.assertEqual(s3['security_groups'], [])
+        self.assertEqual(s3['volumes'], [dict(id='v1', device='/dev/vdb',
+                                              attachments=[dict(
+                                                  server_id='s3',
+                                                  device='/dev/vdb')])])
+
+    def test_bulk_details_many_servers(self):
+        with mock.patch.object(server_info, 'MAX_FILTERED_SERVERS', 2):
+            servers = self._run(detailed=True, bulk_details=True)
+
+        for f in [self.conn.network.ports, self.conn.network.ips,
+                  self.conn.block_storage.volumes]:
+            f.assert_called_once_with()
+        self.conn.block_storage.get_volume.assert_not_called()
+
+        s1, s2, s3 = servers
+        self.assertEqual(s1['public_v4'], '172.24.4.1')
+        self.assertEqual([sg['name'] for sg in s1['security_groups']],
+                         ['default', 'web'])
+        self.assertEqual([v['id'] for v in s3['volumes']], ['v1'])
+
+    def test_per_server_details(self):
+        self.conn.search_servers.return_value = []
+
+        self._run(detailed=True)
+
+        self.conn.search_servers.assert_called_once_with(
+            detailed=True, all_projects=False, name_or_id=None)
+        self.conn.network.ports.assert_not_called()
@@ -0,0 +1,82 @@
+from ansible_collections.openstack.cloud.plugins.modules import server_metadata
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+class TestServerMetadataBulk(OpenStackModuleTestCase):
+
+    module = server_metadata
+
+    def setUp(self):
+        super(TestServerMetadataBulk, self).setUp()
+        self.conn.compute.servers.return_value = [
+            FakeResource(id='1', name='web-1',
+                         metadata=dict(owner='web', group='a')),
+            FakeResource(id='2', name='web-2', metadata=dict(group='b')),
+            FakeResource(id='3', name='web-3', metadata=None),
+        ]
+
+    def test_set_metadata_with_filters(self):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(filters=dict(name='^web-'),
+                            metadata=dict(owner='web'))
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['id'], r['changed'], r['metadata'])
+             for r in result['servers']],
+            [('1', False, dict(owner='web', group='a')),
+             ('2', True, dict(owner='web', group='b')),
+             ('3', True, dict(owner='web'))])
+        self.conn.compute.servers.assert_called_once_with(
+            details=True, name='^web-')
+        self.assertEqual(
+            sorted((c.args[0]['id'], c.kwargs) for c in
+                   self.conn.compute.set_server_metadata.call_args_list),
+            [('2', dict(owner='web')), ('3', dict(owner='web'))])
+        self.conn.compute.find_server.assert_not_called()
+        self.conn.compute.get_server.assert_not_called()
+
+    def test_delete_metadata_partial_failure(self):
+        def delete_server_metadata(server, keys):
+            if server['id'] == '2':
+                raise FakeSDK.exceptions.SDKException('forbidden')
+        self.conn.compute.delete_server_metadata.side_effect = \
+            delete_server_metadata
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self.run_module(names=['web-1', '2', 'web-3'], state='absent',
+                            metadata=dict(group=None))
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['id'], r['changed'], r['failed'], r['metadata'])
+             for r in result['servers']],
+            [('1', True, False, dict(owner='web')),
+             ('2', False, True, dict(group='b')),
+             ('3', False, False, dict())])
+        self.assertEqual(self.conn.compute.delete_server_metadata.call_count,
+                         2)
+
+    def test_check_mode(self):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(names=['web-1', 'web-2'], metadata=dict(group='a'),
+                            _ansible_check_mode=True)
+
+        self.assertTrue(ctx.exception.args[0]['changed'])
+        self.conn.compute.set_server_metadata.assert_not_called()
+
+    def test_missing_name(self):
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self.run_module(names=['web-1', 'db'], metadata=dict(group='a'))
+
+        self.assertEqual(ctx.exception.args[0]['msg'],
+                         'No Server found for db')
+        self.conn.compute.set_server_metadata.assert_not_called()
@@ -0,0 +1,93 @@
+from ansible_collections.openstack.cloud.plugins.modules import server_volume
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    AnsibleFailJson,
+    FakeResource,
+    FakeSDK,
+    OpenStackModuleTestCase,
+)
+
+
+def volume(id, status='available', device=None):
+    attachments = [dict(server_id='srv', device=device)] if device else []
+    return FakeResource(id=id, name='data-' + id, status=status,
+                        attachments=attachments)
+
+
+class TestServerVolumes(OpenStackModuleTestCase):
+
+    module = server_volume
+
+    def setUp(self):
+        super(TestServerVolumes, self).setUp()
+        self.conn.compute.find_server.return_value = FakeResource(
+            id='srv', attached_volumes=[dict(id='1')])
+
+    def _run(self, **params):
+        self.run_module(server='db', **params)
+
+    def test_attach_volumes(self):
+        self.conn.block_storage.volumes.side_effect = [
+            [volume('1', 'in-use', '/dev/vdb'), volume('2'), volume('3')],
+            [volume('1', 'in-use', '/dev/vdb'), volume('2', 'attaching'),
+             volume('3', 'attaching')],
+            [volume('1', 'in-use', '/dev/vdb'),
+             volume('2', 'in-use', '/dev/vdc'),
+             volume('3', 'in-use', '/dev/vdd')],
+        ]
+        self.conn.compute.create_volume_attachment.return_value = \
+            FakeResource(device=None)
+
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self._run(volumes=['data-1', '2', 'data-3'])
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['id'], r['changed'], r['device']) for r in result['volumes']],
+            [('1', False, '/dev/vdb'), ('2', True, '/dev/vdc'),
+             ('3', True, '/dev/vdd')])
+        self.assertEqual(
+            [c.kwargs['volume'] for c in
+             self.conn.compute.create_volume_attachment.call_args_list],
+            ['2', '3'])
+        # One listing to find volumes and one listing per poll interval
+        self.assertEqual(self.conn.block_storage.volumes.call_count, 3)
+        self.conn.block_storage.get_volume.assert_not_called()
+
+    def test_detach_volumes_partial_failure(self):
+        self.conn.compute.find_server.return_value = FakeResource(
+            id='srv', attached_volumes=[dict(id='1'), dict(id='2')])
+        self.conn.block_storage.volumes.return_value = [
+            volume('1', 'in-use', '/dev/vdb'),
+            volume('2', 'in-use', '/dev/vdc'),
+            volume('3')]
+        self.conn.block_storage.get_volume.return_value = volume('1')
+
+        def delete_volume_attachment(server, volume_id):
+            if volume_id == '2':
+                raise FakeSDK.exceptions.SDKException('conflict')
+        self.conn.compute.delete_volume_attachment.side_effect = \
+            delete_volume_attachment
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self._run(volumes=['1', '2', '3'], state='absent')
+
+        result = ctx.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [(r['id'], r['changed'], r['failed'], r['device'])
+             for r in result['volumes']],
+            [('1', True, False, None), ('2', False, True, '/dev/vdc'),
+             ('3', False, False, None)])
+        self.conn.block_storage.get_volume.assert_called_once_with('1')
+
+    def test_missing_volume(self):
+        self.conn.block_storage.volumes.return_value = [volume('1')]
+
+        with self.assertRaises(AnsibleFailJson) as ctx:
+            self._run(volumes=['1', 'missing'])
+
+        self.assertEqual(ctx.exception.args[0]['msg'],
+                         'No Volume found for missing')
+        self.conn.compute.create_volume_attachment.assert_not_called()
@@ -0,0 +1,39 @@
+from ansible_collections.openstack.cloud.plugins.modules import stack_info
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    OpenStackModuleTestCase,
+)
+
+
+class TestStackInfo(OpenStackModuleTestCase):
+
+    module = stack_info
+
+    def setUp(self):
+        super(TestStackInfo, self).setUp()
+        self.conn.orchestration.stacks.return_value = [
+            FakeResource(id=str(i), name='stack{0}'.format(i))
+            for i in range(5)]
+        self.conn.orchestration.get_stack.side_effect = \
+            lambda id: FakeResource(id=id, outputs=[])
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]
+
+    def test_listing_only(self):
+        result = self._run()
+
+        self.assertEqual(len(result['stacks']), 5)
+        self.assertNotIn('outputs', result['stacks'][0])
+        self.conn.orchestration.get_stack.assert_not_called()
+
+    def test_detailed(self):
+        result = self._run(detailed=True, max_workers=2)
+
+        self.assertEqual([s['id'] for s in result['stacks']],
+                         ['0', '1', '2', '3', '4'])
+        self.assertEqual(result['stacks'][4]['outputs'], [])
+        self.assertEqual(self.conn.orchestration.get_stack.call_count, 5)
@@ -0,0 +1,39 @@
+import openstack
+
+from ansible_collections.openstack.cloud.plugins.modules import subnets_info
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    AnsibleExitJson,
+    FakeResource,
+    OpenStackModuleTestCase,
+)
+
+
+class TestSubnetsInfo(OpenStackModuleTestCase):
+
+    module = subnets_info
+    # Fields are derived from openstacksdk's resource classes
+    sdk = openstack
+
+    def setUp(self):
+        super(TestSubnetsInfo, self).setUp()
+        self.conn.network.subnets.return_value = [
+            FakeResource(id='1', cidr='10.0.0.0/24', project_id='p')]
+
+    def _run(self, **params):
+        with self.assertRaises(AnsibleExitJson) as ctx:
+            self.run_module(**params)
+        return ctx.exception.args[0]
+
+    def test_fields_are_sent_to_neutron(self):
+        result = self._run(fields=['id', 'cidr', 'project_id'],
+                           filters=dict(ip_version=4))
+
+        self.assertEqual(result['subnets'],
+                         [dict(id='1', cidr='10.0.0.0/24', project_id='p')])
+        self.conn.network.subnets.assert_called_once_with(
+            ip_version=4, fields=['id', 'cidr', 'project_id'])
+
+    def test_without_fields(self):
+        self._run()
+
+        self.conn.network.subnets.assert_called_once_with()
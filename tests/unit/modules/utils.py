@@ -1,9 +1,11 @@
 import json
 import unittest
+from unittest import mock
 from unittest.mock import patch
 
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
+from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
 
 def set_module_args(args):
@@ -45,3 +47,62 @@ class ModuleTestCase(unittest.TestCase):
         set_module_args({})
         self.addCleanup(self.mock_module.stop)
         self.addCleanup(self.mock_sleep.stop)
+
+
+class FakeSDK(object):
+    class exceptions:
+        class SDKException(Exception):
+            pass
+
+        class OpenStackCloudException(SDKException):
+            pass
+
+        class NotFoundException(SDKException):
+            pass
+
+        ResourceNotFound = NotFoundException
+
+        class ResourceTimeout(SDKException):
+            pass
+
+    class utils:
+        @staticmethod
+        def iterate_timeout(timeout, message, wait=2):
+            yield from range(3)
+            raise FakeSDK.exceptions.ResourceTimeout(message)
+
+        @staticmethod
+        def supports_microversion(adapter, microversion):
+            return True
+
+
+class FakeResource(dict):
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def to_dict(self, computed=False):
+        return dict(self)
+
+
+class OpenStackModuleTestCase(ModuleTestCase):
+    """Runs module under test against a mocked connection in self.conn."""
+
+    module = None
+    sdk = FakeSDK
+
+    def setUp(self):
+        super(OpenStackModuleTestCase, self).setUp()
+        self.conn = mock.Mock()
+
+    def run_module(self, **params):
+        set_module_args(params)
+        with patch.object(OpenStackModule, 'openstack_cloud_from_module',
+                          return_value=(self.sdk, self.conn)):
+            self.module.main()
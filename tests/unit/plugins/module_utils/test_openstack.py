@@ -0,0 +1,273 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    FakeResource,
+    FakeSDK,
+)
+
+
+class FakeModule(OpenStackModule):
+    argument_spec = dict(
+        description=dict(),
+        name=dict(),
+        plan_file=dict(type='path'),
+    )
+
+    def __init__(self, params, check_mode):
+        # Skip AnsibleModule and connection setup
+        self.params = params
+        self.check_mode = check_mode
+        self.module_name = 'fake'
+        self.sdk = FakeSDK()
+
+
+class TestPlan(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        os.remove(self.path)
+        self.addCleanup(lambda: os.path.exists(self.path)
+                        and os.remove(self.path))
+        self.params = dict(description='new', name='sg',
+                           plan_file=self.path)
+        self.resource = FakeResource(id='1', description='old',
+                                     revision_number=3)
+
+    def _plan(self):
+        module = FakeModule(dict(self.params), check_mode=True)
+        build_update = mock.Mock(return_value=dict(
+            attributes=dict(description='new'),
+            rules=[FakeResource(id='rule')]))
+        update = module.plan_update(self.resource, build_update)
+        build_update.assert_called_once_with(self.resource)
+        return update
+
+    def test_read_plan_returns_planned_update(self):
+        self._plan()
+
+        fetch = mock.Mock(return_value=FakeResource(self.resource))
+        module = FakeModule(dict(self.params), check_mode=False)
+        resource, update = module.read_plan(fetch)
+
+        fetch.assert_called_once_with('1')
+        self.assertEqual(resource, self.resource)
+        self.assertEqual(update, dict(attributes=dict(description='new'),
+                                      rules=[dict(id='rule')]))
+
+    def test_read_plan_ignores_changed_resource(self):
+        self._plan()
+
+        fetch = mock.Mock(return_value=FakeResource(self.resource,
+                                                    revision_number=4))
+        module = FakeModule(dict(self.params), check_mode=False)
+
+        self.assertEqual(module.read_plan(fetch), (None, None))
+
+    def test_read_plan_ignores_changed_params(self):
+        self._plan()
+
+        fetch = mock.Mock()
+        module = FakeModule(dict(self.params, description='other'),
+                            check_mode=False)
+
+        self.assertEqual(module.read_plan(fetch), (None, None))
+        fetch.assert_not_called()
+
+    def test_read_plan_ignores_deleted_resource(self):
+        self._plan()
+
+        fetch = mock.Mock(side_effect=FakeSDK.exceptions.ResourceNotFound)
+        module = FakeModule(dict(self.params), check_mode=False)
+
+        self.assertEqual(module.read_plan(fetch), (None, None))
+
+    def test_read_plan_without_plan_file(self):
+        fetch = mock.Mock()
+        module = FakeModule(dict(self.params), check_mode=False)
+
+        self.assertEqual(module.read_plan(fetch), (None, None))
+        fetch.assert_not_called()
+
+
+class FakeQueryResource(object):
+    class _query_mapping:
+        _mapping = dict(device_id='device_id', id='id', limit='limit',
+                        marker='marker', name='name',
+                        is_admin_state_up='admin_state_up')
+
+
+class TestSearchResources(unittest.TestCase):
+
+    def setUp(self):
+        self.module = FakeModule(dict(), check_mode=False)
+        self.resources = [
+            FakeResource(id='1', name='a', device_id='d', status='ACTIVE',
+                         binding=dict(host='h1')),
+            FakeResource(id='2', name='b', device_id='d', status='DOWN',
+                         binding=dict(host='h2')),
+            FakeResource(id='3', name='c', device_id='d', status='ACTIVE',
+                         binding=dict(host='h2')),
+        ]
+        self.list_function = mock.Mock(
+            side_effect=lambda **query: [
+                r for r in self.resources
+                if all(r.get(k) == v for k, v in query.items()
+                       if k not in ['limit', 'marker'])])
+
+    def _search(self, **kwargs):
+        return self.module.search_resources(self.list_function,
+                                            FakeQueryResource, **kwargs)
+
+    def test_query_parameters_are_passed_to_api(self):
+        resources = self._search(filters=dict(device_id='d',
+                                              admin_state_up=True,
+                                              status='ACTIVE',
+                                              binding=dict(host='h2')))
+
+        self.list_function.assert_called_once_with(device_id='d',
+                                                   admin_state_up=True)
+        self.assertEqual([r['id'] for r in resources], [])
+
+        resources = self._search(filters=dict(device_id='d',
+                                              status='ACTIVE',
+                                              binding=dict(host='h2')))
+        self.assertEqual([r['id'] for r in resources], ['3'])
+
+    def test_name_or_id_is_queried_as_name_then_id(self):
+        self.assertEqual(self._search(name_or_id='b'), [self.resources[1]])
+        self.list_function.assert_called_once_with(name='b')
+
+        self.list_function.reset_mock()
+        self.assertEqual(self._search(name_or_id='3'), [self.resources[2]])
+        self.assertEqual([c.kwargs for c in
+                          self.list_function.call_args_list],
+                         [dict(name='3'), dict(id='3')])
+
+    def test_name_or_id_pattern_is_matched_client_side(self):
+        resources = self._search(name_or_id='[ab]')
+
+        self.list_function.assert_called_once_with()
+        self.assertEqual([r['id'] for r in resources], ['1', '2'])
+
+    def test_limit_stops_iteration(self):
+        consumed = []
+
+        def list_function(**query):
+            for r in self.resources:
+                consumed.append(r['id'])
+                yield r
+
+        resources = self.module.search_resources(
+            list_function, FakeQueryResource,
+            filters=dict(status='ACTIVE'), limit=1, marker='0')
+
+        self.assertEqual([r['id'] for r in resources], ['1'])
+        self.assertEqual(consumed, ['1'])
+
+
+UUID = '0c2b3a6c-0e1b-4b6c-a3d6-f1f5b0f9c7a1'
+
+
+class TestResolveResources(unittest.TestCase):
+
+    def setUp(self):
+        self.module = FakeModule(dict(), check_mode=False)
+        self.resources = [
+            FakeResource(id=UUID, name='a'),
+            FakeResource(id='2', name=UUID.replace('0', '1')),
+            FakeResource(id='3', name='c'),
+        ]
+        self.list_function = mock.Mock(
+            side_effect=lambda id=None, name=None, **query: [
+                r for r in self.resources
+                if (id is None or r['id'] in id)
+                and (name is None or r['name'] in name)])
+
+    def test_resources_are_mapped_in_order_of_names(self):
+        resolved = self.module.resolve_resources(
+            self.list_function, ['c', UUID, 'a'], 'port')
+
+        self.list_function.assert_called_once_with()
+        self.assertEqual(list(resolved.items()),
+                         [('c', self.resources[2]),
+                          (UUID, self.resources[0]),
+                          ('a', self.resources[0])])
+
+    def test_find_resources_drops_duplicates(self):
+        resources = self.module.find_resources(
+            self.list_function, ['c', UUID, 'a'], 'port')
+
+        self.assertEqual(resources, [self.resources[2], self.resources[0]])
+
+    def test_filter_names_queries_names_which_look_like_ids(self):
+        name = UUID.replace('0', '1')
+        resolved = self.module.resolve_resources(
+            self.list_function, [UUID, name], 'port', filter_names=True,
+            fields=['id', 'name'])
+
+        self.assertEqual([c.kwargs for c in
+                          self.list_function.call_args_list],
+                         [dict(fields=['id', 'name'], id=[UUID, name]),
+                          dict(fields=['id', 'name'], name=[name])])
+        self.assertEqual(resolved[name], self.resources[1])
+
+        self.list_function.reset_mock()
+        self.module.resolve_resources(self.list_function, ['a', 'c'],
+                                      'port', filter_names=True)
+        self.list_function.assert_called_once_with(name=['a', 'c'])
+
+
+class FakeField(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeFieldsResource(FakeQueryResource):
+    is_admin_state_up = FakeField('admin_state_up')
+
+    class _query_mapping:
+        _mapping = dict(FakeQueryResource._query_mapping._mapping,
+                        fields='fields')
+
+
+class TestFields(unittest.TestCase):
+
+    def _module(self, fields):
+        module = FakeModule(dict(fields=fields), check_mode=False)
+        module.ansible = mock.Mock()
+        return module
+
+    def test_exit_json_projects_dotted_paths(self):
+        module = self._module(['id', 'addresses.private', 'fixed_ips.ip'])
+        module._exit_json(changed=False, ports=[
+            dict(id='1', name='a',
+                 addresses=dict(private=['10.0.0.1'], public=['1.2.3.4']),
+                 fixed_ips=[dict(ip='10.0.0.1', subnet_id='s')])])
+
+        module.ansible.exit_json.assert_called_once_with(
+            changed=False, ports=[
+                dict(id='1', addresses=dict(private=['10.0.0.1']),
+                     fixed_ips=[dict(ip='10.0.0.1')])])
+
+    def test_exit_json_without_fields(self):
+        module = self._module(None)
+        module._exit_json(changed=False, ports=[dict(id='1', name='a')])
+
+        module.ansible.exit_json.assert_called_once_with(
+            changed=False, ports=[dict(id='1', name='a')])
+
+    def test_query_fields_are_passed_to_api(self):
+        module = self._module(['is_admin_state_up', 'fixed_ips.ip'])
+        list_function = mock.Mock(return_value=[])
+
+        module.search_resources(list_function, FakeFieldsResource,
+                                filters=dict(status='ACTIVE'))
+
+        list_function.assert_called_once_with(
+            fields=['admin_state_up', 'fixed_ips', 'id', 'name', 'status'])
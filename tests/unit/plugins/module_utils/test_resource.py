@@ -0,0 +1,266 @@
+import unittest
+from unittest import mock
+
+from openstack.compute.v2.flavor import Flavor
+from ansible_collections.openstack.cloud.plugins.module_utils.resource import StateMachine
+from ansible_collections.openstack.cloud.tests.unit.modules.utils import (
+    FakeResource,
+    FakeSDK,
+)
+
+
+class TestStateMachine(unittest.TestCase):
+
+    def setUp(self):
+        self.crud_functions = dict(
+            (k, mock.Mock(name=k))
+            for k in ['create', 'delete', 'find', 'get', 'list', 'update'])
+        self.sdk = FakeSDK()
+        self.sm = StateMachine(connection=mock.Mock(),
+                               sdk=self.sdk,
+                               type_name='network',
+                               service_name='network',
+                               crud_functions=self.crud_functions)
+
+    def _call(self, attributes, check_mode=False, state='present',
+              updateable_attributes=None, non_updateable_attributes=None,
+              wait=False):
+        return self.sm(attributes=attributes,
+                       check_mode=check_mode,
+                       state=state,
+                       timeout=180,
+                       wait=wait,
+                       updateable_attributes=updateable_attributes,
+                       non_updateable_attributes=non_updateable_attributes)
+
+    def _calls(self):
+        return dict((k, f.call_count)
+                    for k, f in self.crud_functions.items()
+                    if f.call_count)
+
+    def test_present_unchanged_makes_single_request(self):
+        self.crud_functions['find'].return_value = FakeResource(
+            id='1', name='net', description='desc')
+
+        resource, is_changed = self._call(dict(name='net',
+                                               description='desc'))
+
+        self.assertFalse(is_changed)
+        self.assertEqual(resource['id'], '1')
+        self.assertEqual(self._calls(), dict(find=1))
+
+    def test_present_unchanged_check_mode_makes_single_request(self):
+        self.crud_functions['find'].return_value = FakeResource(
+            id='1', name='net', description='desc')
+
+        resource, is_changed = self._call(dict(name='net',
+                                               description='desc'),
+                                          check_mode=True)
+
+        self.assertFalse(is_changed)
+        self.assertEqual(self._calls(), dict(find=1))
+
+    def test_present_partial_listing_entry_is_fetched(self):
+        self.crud_functions['find'].return_value = FakeResource(
+            id='1', name='net', description=None)
+        self.crud_functions['get'].return_value = FakeResource(
+            id='1', name='net', description='desc')
+
+        resource, is_changed = self._call(dict(name='net',
+                                               description='desc'))
+
+        self.assertFalse(is_changed)
+        self.crud_functions['get'].assert_called_once_with('1')
+        self.assertEqual(self._calls(), dict(find=1, get=1))
+
+    def test_present_listing_entry_with_defaults_is_fetched(self):
+        # Listing returned neither ram nor vcpus, which default to 0
+        self.crud_functions['find'].return_value = Flavor.existing(
+            id='1', name='tiny')
+        self.crud_functions['get'].return_value = Flavor.existing(
+            id='1', name='tiny', ram=512, vcpus=1)
+
+        resource, is_changed = self._call(dict(name='tiny', ram=512))
+
+        self.assertFalse(is_changed)
+        self.crud_functions['get'].assert_called_once_with('1')
+
+    def test_present_changed_updates_without_refetch(self):
+        self.crud_functions['find'].return_value = FakeResource(
+            id='1', name='net', description='old')
+        self.crud_functions['update'].return_value = FakeResource(
+            id='1', name='net', description='new')
+
+        resource, is_changed = self._call(dict(name='net',
+                                               description='new'))
+
+        self.assertTrue(is_changed)
+        self.assertEqual(resource['description'], 'new')
+        self.crud_functions['update'].assert_called_once_with(
+            '1', description='new')
+        self.assertEqual(self._calls(), dict(find=1, update=1))
+
+    def test_present_ignores_non_updateable_attributes(self):
+        self.crud_functions['find'].return_value = FakeResource(
+            id='1', name='net', description='desc', project_id=None)
+
+        resource, is_changed = self._call(
+            dict(name='net', description='desc', project_id='p'),
+            non_updateable_attributes=['project_id'])
+
+        self.assertFalse(is_changed)
+        self.assertEqual(self._calls(), dict(find=1))
+
+    @mock.patch('time.sleep')
+    def test_absent_wait_polls_resource_by_id(self, mock_sleep):
+        self.crud_functions['list'].return_value = [
+            FakeResource(id='1', name='net', description='desc')]
+        self.crud_functions['get'].side_effect = [
+            FakeResource(id='1', status='ACTIVE'),
+            FakeResource(id='1', status='ACTIVE'),
+            self.sdk.exceptions.NotFoundException()]
+
+        resource, is_changed = self._call(dict(description='desc'),
+                                          state='absent', wait=True)
+
+        self.assertTrue(is_changed)
+        self.crud_functions['delete'].assert_called_once_with('1')
+        self.crud_functions['get'].assert_called_with('1')
+        self.assertEqual(self._calls(), dict(delete=1, get=3, list=1))
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list],
+                         [1, 2])
+
+    @mock.patch('time.sleep')
+    def test_absent_wait_stops_on_deleted_status(self, mock_sleep):
+        self.crud_functions['find'].return_value = FakeResource(id='1')
+        self.crud_functions['get'].return_value = FakeResource(
+            id='1', status='DELETED')
+
+        resource, is_changed = self._call(dict(name='stack'),
+                                          state='absent', wait=True)
+
+        self.assertTrue(is_changed)
+        self.assertEqual(self._calls(), dict(delete=1, find=1, get=1))
+        mock_sleep.assert_not_called()
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.time')
+    def test_absent_wait_times_out(self, mock_time, mock_sleep):
+        mock_time.side_effect = [0, 100, 200]
+        self.crud_functions['find'].return_value = FakeResource(id='1')
+        self.crud_functions['get'].return_value = FakeResource(
+            id='1', status='ACTIVE')
+
+        self.assertRaises(self.sdk.exceptions.ResourceTimeout,
+                          self._call, dict(name='net'),
+                          state='absent', wait=True)
+        self.assertEqual(self.crud_functions['get'].call_count, 2)
+
+    def test_batch_lists_collection_once(self):
+        self.crud_functions['list'].return_value = [
+            FakeResource(id='1', name='unchanged', description='desc'),
+            FakeResource(id='2', name='changed', description='old'),
+            FakeResource(id='3', name='deleted', description='desc'),
+            FakeResource(id='4', name='other', description='desc')]
+        self.crud_functions['create'].return_value = FakeResource(
+            id='5', name='created')
+        self.crud_functions['update'].return_value = FakeResource(
+            id='2', name='changed', description='new')
+
+        items = [
+            dict(attributes=dict(name='unchanged', description='desc'),
+                 state='present'),
+            dict(attributes=dict(name='changed', description='new'),
+                 state='present'),
+            dict(attributes=dict(name='created'), state='present'),
+            dict(attributes=dict(id='3'), state='absent'),
+            dict(attributes=dict(name='missing'), state='absent'),
+        ]
+        outcomes = self.sm.batch(items=items,
+                                 check_mode=False,
+                                 timeout=180,
+                                 wait=False,
+                                 updateable_attributes=None,
+                                 non_updateable_attributes=None)
+
+        self.assertEqual([outcome[1] for outcome in outcomes],
+                         [False, True, True, True, False])
+        self.assertEqual([outcome[0] and outcome[0]['id']
+                          for outcome in outcomes],
+                         ['1', '2', '5', None, None])
+        self.crud_functions['list'].assert_called_once_with()
+        self.crud_functions['create'].assert_called_once_with(name='created')
+        self.crud_functions['update'].assert_called_once_with(
+            '2', description='new')
+        self.crud_functions['delete'].assert_called_once_with('3')
+        self.assertEqual(self._calls(),
+                         dict(create=1, delete=1, list=1, update=1))
+
+    def test_batch_matches_attribute_tuples(self):
+        self.crud_functions['list'].return_value = [
+            FakeResource(id='1', name=None, port_id='a', address='1.2.3.4'),
+            FakeResource(id='2', name=None, port_id='b', address='1.2.3.4')]
+
+        outcomes = self.sm.batch(
+            items=[dict(attributes=dict(address='1.2.3.4', port_id='b'),
+                        state='present')],
+            check_mode=True,
+            timeout=180,
+            wait=False,
+            updateable_attributes=None,
+            non_updateable_attributes=None)
+
+        self.assertEqual(outcomes[0][0]['id'], '2')
+        self.assertFalse(outcomes[0][1])
+
+    def test_batch_ignores_resources_without_attribute(self):
+        self.crud_functions['list'].return_value = [
+            FakeResource(id='1', name='a'),
+            FakeResource(id='2', name='b', port_id='b')]
+
+        outcomes = self.sm.batch(
+            items=[dict(attributes=dict(port_id='b'), state='present')],
+            check_mode=True,
+            timeout=180,
+            wait=False,
+            updateable_attributes=None,
+            non_updateable_attributes=None)
+
+        self.assertEqual(outcomes[0][0]['id'], '2')
+
+    def test_batch_requires_workers(self):
+        self.sm.fail_json = mock.Mock(side_effect=Exception)
+
+        with self.assertRaises(Exception):
+            self.sm.batch(
+                items=[dict(attributes=dict(name='a'), state='present')],
+                check_mode=False,
+                timeout=180,
+                wait=False,
+                updateable_attributes=None,
+                non_updateable_attributes=None,
+                max_workers=0)
+
+        self.sm.fail_json.assert_called_once_with(
+            msg='max_workers must be at least 1.')
+        self.crud_functions['list'].assert_not_called()
+
+    def test_batch_reports_errors_per_item(self):
+        self.crud_functions['list'].return_value = []
+        self.crud_functions['create'].side_effect = [
+            FakeResource(id='1', name='good'),
+            self.sdk.exceptions.SDKException('quota exceeded')]
+
+        outcomes = self.sm.batch(
+            items=[dict(attributes=dict(name='good'), state='present'),
+                   dict(attributes=dict(name='bad'), state='present')],
+            check_mode=False,
+            timeout=180,
+            wait=False,
+            updateable_attributes=None,
+            non_updateable_attributes=None,
+            max_workers=1)
+
+        self.assertEqual(outcomes[0][:2], (FakeResource(id='1', name='good'),
+                                           True))
+        self.assertEqual(str(outcomes[1][2]), 'quota exceeded')